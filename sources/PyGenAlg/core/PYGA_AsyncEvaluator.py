@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""
+Python Genetic Algorithm module.
+
+This file contains the asyncio evaluation engine of the GA: PYGA_AsyncEvaluator.
+It runs coroutine fitness functions ("async def fitness") concurrently on one
+event loop, which suits I/O bound evaluations (external solvers, simulators...).
+
+License full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+
+
+
+Modification History:
+**** 18/10/2026 ****
+Creation
+- Batch fitness (PYGA_Individual.fitnessBatch) awaited in one call
+- Evaluation timeout: late coroutines cancelled
+- Failed evaluations retried
+- Individuals added while evaluating (see launchQueue)
+- Wake up time, running evaluations abandoned when the evaluation is closed
+
+TODO List:
+-
+"""
+# - Build-in imports -
+from asyncio import new_event_loop, wait, wait_for, FIRST_COMPLETED, TimeoutError as AsyncTimeoutError
+from collections import deque
+from inspect import iscoroutine
+
+# - Local imports -
+from PyGenAlg.core.PYGA_Evaluator import PYGA_Evaluator, launchQueue, ERROR_FAILURE, TIMEOUT_FAILURE
+
+# Meta information
+__author__ = "Raphaël Deau"
+__copyright__ = "Copyright 2016, Raphaël Deau"
+__license__ = "Creative Commons Attribution Non-commercial 4.0"
+__version__ = "1.0.0"
+__since__ = "18/10/2026"
+__date__ = "18/10/2026"
+
+
+async def _computeObjectives(individual, context):
+    """
+    Compute the objectives of an individual, awaiting a coroutine fitness.
+
+    :param individual: The individual to evaluate.
+    :type individual: Derived from PYGA_Individual
+    :param context: The evaluation context (see PYGA_Individual.getEvaluationContext).
+    :type context: Depending on the individual
+    """
+    obj = individual.launchObjectives(context)
+    if iscoroutine(obj):
+        obj = await obj
+    individual.storeObjectives(obj)
+
+
+async def _computeObjectivesBatch(individualClass, individuals, context):
+    """
+    Compute the objectives of several individuals in one call, awaiting a coroutine
+    batch fitness (see PYGA_Individual.fitnessBatch).
+
+    :param individualClass: The individual class to evaluate.
+    :type individualClass: type derived from PYGA_Individual
+    :param individuals: The individuals to evaluate.
+    :type individuals: list
+    :param context: The evaluation context (see PYGA_Individual.getEvaluationContext).
+    :type context: Depending on the individual
+    """
+    objs = individualClass.fitnessBatch(individuals, context)
+    if iscoroutine(objs):
+        objs = await objs
+    individualClass.storeObjectivesBatch(individuals, objs)
+
+
+class PYGA_AsyncEvaluator(PYGA_Evaluator):
+    """
+    Evaluation engine running coroutine fitness functions on an event loop.
+
+    The event loop is created by start() and closed by stop(). The evaluations
+    run in the main process: the individuals are evaluated in place. A fitness
+    that is not a coroutine function is computed when its turn comes, blocking
+    the loop.
+    With an evaluation timeout, the late coroutines are cancelled. The failed
+    evaluations are given to PYGA_Evaluator.failTask (launched again, or penalised).
+    A fitness blocking the loop cannot be stopped.
+
+    Attributes:
+        :ivar __maxConcurrency: The maximum number of simultaneous evaluations (0 for no limit).
+        :type __maxConcurrency: int
+        :ivar __loop: The event loop.
+        :type __loop: asyncio event loop
+    """
+    # ==================
+    # v Public methods v
+    # ==================
+
+    def __init__(self, individualClass, printMethod, maxConcurrency):
+        """
+        Constructor of the asyncio evaluator.
+
+        :param individualClass: The individual class to evaluate.
+        :type individualClass: type derived from PYGA_Individual
+        :param printMethod: The method to call to print logs.
+        :type printMethod: Python method
+        :param maxConcurrency: The maximum number of simultaneous evaluations (0 for no limit).
+        :type maxConcurrency: int
+        """
+        PYGA_Evaluator.__init__(self, individualClass, printMethod)
+        self.__maxConcurrency = maxConcurrency
+        self.__loop = None
+
+    def getNbWorkers(self):
+        """Get the maximum number of simultaneous evaluations (0 for no limit)."""
+        return self.__maxConcurrency
+
+    def start(self):
+        """Initialise the worker state and create the event loop."""
+        PYGA_Evaluator.start(self)
+        self.__loop = new_event_loop()
+
+    def stop(self):
+        """Close the event loop."""
+        if self.__loop is not None:
+            self.__loop.close()
+            self.__loop = None
+        PYGA_Evaluator.stop(self)
+
+    def evaluate(self, population, individuals):
+        """
+        Compute the objectives of the given individuals concurrently on the event loop.
+        See PYGA_Evaluator.evaluate.
+        """
+        if self.__loop is None:
+            self.start()
+        individualClass = self.getIndividualClass()
+        contextVersion, context = self.getEvaluationContext(population)
+        timeout = self.getEvaluationTimeout()
+        toLaunch = launchQueue(individuals)
+        # Individuals of failed tasks, to launch one by one
+        toLaunchAlone = deque()
+        running = {}
+        try:
+            while len(toLaunch) > 0 or len(toLaunchAlone) > 0 or len(running) > 0:
+                # (the context given since the beginning of the evaluation, see PYGA_Evaluator.getNewContext)
+                newContext = self.getNewContext(contextVersion)
+                if newContext is not None:
+                    contextVersion, context = newContext
+                # 1- Launch evaluations until the concurrency limit is reached
+                while (len(toLaunch) > 0 or len(toLaunchAlone) > 0) and (self.__maxConcurrency == 0 or
+                                                                         len(running) < self.__maxConcurrency):
+                    # One call for all waiting individuals with a batch fitness, one call per individual otherwise
+                    if len(toLaunchAlone) > 0:
+                        launched = [toLaunchAlone.popleft()]
+                    elif individualClass.hasFitnessBatch():
+                        launched = list(toLaunch)
+                        toLaunch.clear()
+                    else:
+                        launched = [toLaunch.popleft()]
+                    if individualClass.hasFitnessBatch():
+                        coroutine = _computeObjectivesBatch(individualClass,
+                                                            [individual for _, individual in launched], context)
+                    else:
+                        coroutine = _computeObjectives(launched[0][1], context)
+                    if timeout > 0:
+                        coroutine = wait_for(coroutine, timeout * len(launched))
+                    task = self.__loop.create_task(coroutine)
+                    running[task] = launched
+                # 2- Run the loop until at least one evaluation is done (or the wake up time)
+                done, _ = self.__loop.run_until_complete(wait(list(running.keys()), timeout=self.getWaitTime([]),
+                                                              return_when=FIRST_COMPLETED))
+                for task in done:
+                    launched = running.pop(task)
+                    if task.exception() is not None:
+                        failureType = ERROR_FAILURE
+                        reason = repr(task.exception())
+                        if isinstance(task.exception(), AsyncTimeoutError):
+                            # The coroutine has been cancelled by wait_for
+                            failureType = TIMEOUT_FAILURE
+                            reason = "timeout after " + str(timeout) + " seconds"
+                        launched = self.failTask(launched, toLaunchAlone, failureType, reason)
+                    for indivID, individual in launched:
+                        yield indivID, individual
+                if self.isWakeUpTime():
+                    yield None, None
+        finally:
+            # Evaluation closed by the caller (or failed): the running evaluations are cancelled
+            self.__cancel(running)
+
+    # ==================
+    # ^ Public methods ^
+    # ==================
+
+    # ===================
+    # v Private methods v
+    # ===================
+
+    def __cancel(self, running):
+        """
+        Cancel the running evaluations.
+
+        :param running: The running tasks.
+        :type running: dict
+        """
+        for task in running:
+            task.cancel()
+        if len(running) > 0:
+            self.__loop.run_until_complete(wait(list(running.keys())))
+
+    # ===================
+    # ^ Private methods ^
+    # ===================
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Python Genetic Algorithm module.
+
+This file contains the persistent evaluation cache of the GA: PYGA_DiskEvaluationCache.
+It keeps the evaluation results in a sqlite file, so that they are shared between
+the runs (and between the programs using the same file).
+
+License full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+
+
+
+Modification History:
+**** 18/10/2026 ****
+Creation
+
+TODO List:
+-
+"""
+# - Build-in imports -
+from pickle import dumps, loads, HIGHEST_PROTOCOL
+import sqlite3
+
+# - Local imports -
+from PyGenAlg.core.PYGA_EvaluationCache import PYGA_EvaluationCache
+
+# Meta information
+__author__ = "Raphaël Deau"
+__copyright__ = "Copyright 2016, Raphaël Deau"
+__license__ = "Creative Commons Attribution Non-commercial 4.0"
+__version__ = "1.0.0"
+__since__ = "18/10/2026"
+__date__ = "18/10/2026"
+
+
+class PYGA_DiskEvaluationCache(PYGA_EvaluationCache):
+    """
+    Evaluation cache saved in a sqlite file.
+
+    The results of the individual class are loaded in memory at start (bounded
+    by the memory size of the cache), the others are read from the file when
+    they are looked for. The new results are written at the end of each
+    evaluation of a population (see flush), in one transaction.
+    The key of a result is the individual class name and the repr of the fingerprint
+    (see PYGA_Individual.getFingerprint), the result being pickled.
+
+    The file is opened in WAL mode with a busy timeout: several runs (several
+    programs) may read and write it at the same time. Existing results are never
+    replaced.
+
+    Attributes:
+        :ivar __fileName: The sqlite file.
+        :type __fileName: str
+        :ivar __className: The key of the individual class in the file.
+        :type __className: str
+        :ivar __connection: The connection to the file (None when the cache is stopped).
+        :type __connection: sqlite3.Connection
+        :ivar __toSave: The results to write at the next flush, as [key, pickled result].
+        :type __toSave: list
+        :ivar __nbLoaded: The number of results loaded at start.
+        :type __nbLoaded: int
+    """
+
+    # Time to wait for a lock of the file (seconds)
+    TIMEOUT = 60.0
+
+    # ==================
+    # v Public methods v
+    # ==================
+
+    def __init__(self, fileName, maxSize, individualClass):
+        """
+        Constructor of the disk evaluation cache.
+
+        :param fileName: The sqlite file (created if it does not exist).
+        :type fileName: str
+        :param maxSize: The maximum number of results kept in memory (0 for no limit).
+        :type maxSize: int
+        :param individualClass: The individual class to evaluate.
+        :type individualClass: type derived from PYGA_Individual
+        """
+        PYGA_EvaluationCache.__init__(self, maxSize)
+        self.__fileName = fileName
+        self.__className = individualClass.__module__ + '.' + individualClass.__name__
+        self.__connection = None
+        self.__toSave = []
+        self.__nbLoaded = 0
+
+    def start(self):
+        """Open the file and load its results."""
+        self.__connection = sqlite3.connect(self.__fileName, timeout=self.TIMEOUT)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        with self.__connection:
+            self.__connection.execute("CREATE TABLE IF NOT EXISTS evaluations ("
+                                      "class TEXT NOT NULL, fingerprint TEXT NOT NULL, result BLOB NOT NULL, "
+                                      "PRIMARY KEY (class, fingerprint))")
+        # Bulk load (the first results of the file are evicted first)
+        self.__nbLoaded = 0
+        cursor = self.__connection.execute("SELECT fingerprint, result FROM evaluations WHERE class = ? "
+                                           "ORDER BY rowid", (self.__className,))
+        for key, result in cursor:
+            self.storeInMemory(key, loads(result))
+            self.__nbLoaded += 1
+
+    def stop(self):
+        """Write the last results and close the file."""
+        if self.__connection is not None:
+            self.flush()
+            self.__connection.close()
+            self.__connection = None
+
+    def flush(self):
+        """Write the new results in one transaction."""
+        if len(self.__toSave) == 0 or self.__connection is None:
+            return
+        with self.__connection:
+            self.__connection.executemany("INSERT OR IGNORE INTO evaluations (class, fingerprint, result) "
+                                          "VALUES (?, ?, ?)",
+                                          [(self.__className, key, result) for key, result in self.__toSave])
+        self.__toSave = []
+
+    def lookup(self, fingerprint):
+        """See PYGA_EvaluationCache.lookup (the fingerprint is converted into the key of the file)."""
+        return PYGA_EvaluationCache.lookup(self, repr(fingerprint))
+
+    def store(self, fingerprint, result):
+        """See PYGA_EvaluationCache.store (the fingerprint is converted into the key of the file)."""
+        PYGA_EvaluationCache.store(self, repr(fingerprint), result)
+
+    def loadResult(self, key):
+        """Read a result evicted from memory, or written by another program since the start."""
+        if self.__connection is None:
+            return False, None
+        row = self.__connection.execute("SELECT result FROM evaluations WHERE class = ? AND fingerprint = ?",
+                                        (self.__className, key)).fetchone()
+        if row is None:
+            return False, None
+        return True, loads(row[0])
+
+    def saveResult(self, key, result):
+        """Keep the result to write it at the next flush."""
+        self.__toSave.append([key, sqlite3.Binary(dumps(result, HIGHEST_PROTOCOL))])
+
+    def getPrintInformation(self):
+        """Get the statistics of the cache, as printed at the end of the run."""
+        return (PYGA_EvaluationCache.getPrintInformation(self) +
+                "    " + str(self.__nbLoaded) + " results loaded from " + self.__fileName + '\n')
+
+    # ==================
+    # ^ Public methods ^
+    # ==================
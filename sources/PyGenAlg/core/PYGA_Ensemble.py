@@ -0,0 +1,577 @@
+# -*- coding: utf-8 -*-
+"""
+Python Genetic Algorithm module.
+
+This file contains the ensemble runner of the GA: PYGA_Ensemble.
+It runs the same GA configuration with several random seeds in parallel
+processes, and aggregates their results.
+
+Command line (see main):
+    python -m PyGenAlg.core.PYGA_Ensemble module:IndividualClass --runs 20 pop_size=100 nb_gen=50
+
+License full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+
+
+
+Modification History:
+**** 18/10/2026 ****
+Creation
+
+TODO List:
+-
+"""
+# - Build-in imports -
+from argparse import ArgumentParser
+from ast import literal_eval
+from collections import deque
+from importlib import import_module
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import wait
+from os import devnull
+from os.path import join as osjoin
+from sys import stdout
+import random
+from time import time, asctime
+from traceback import format_exc
+
+# - Local imports -
+from PyGenAlg.core.PYGA_GenAlg import PYGA_GenAlg
+from PyGenAlg.core.PYGA_Population import PYGA_Population
+from PyGenAlg.core.PYGA_Individual import PYGA_Individual
+from PyGenAlg.core.PYGA_GenAlgBehavior import PYGA_GenAlgBehavior
+from PyGenAlg.core.PYGA_Evaluator import getNbAvailableCpus
+from PyGenAlg.core.PYGA_Exceptions import PYGA_CreationError, PYGA_ParametersError
+from PyGenAlg.standards.PYGA_StandardGenAlgBehavior import PYGA_StandardGenAlgBehavior
+
+# Meta information
+__author__ = "Raphaël Deau"
+__copyright__ = "Copyright 2016, Raphaël Deau"
+__license__ = "Creative Commons Attribution Non-commercial 4.0"
+__version__ = "1.0.0"
+__since__ = "18/10/2026"
+__date__ = "18/10/2026"
+
+# Types of the messages sent by the runs to the ensemble
+DONE_MSG = 0
+ERROR_MSG = 1
+
+
+def isFitnessReached(fitness, targetFitness, maximize):
+    """
+    Check if a fitness reaches the target fitness.
+
+    :param fitness: The fitness (None if multi objective).
+    :type fitness: float
+    :param targetFitness: The target fitness (None if no target).
+    :type targetFitness: float
+    :param maximize: True if the fitness is maximized, False if it is minimized.
+    :type maximize: bool
+    :return: True if the fitness is at least as good as the target.
+    :rtype: bool
+    """
+    if fitness is None or targetFitness is None:
+        return False
+    if maximize:
+        return fitness >= targetFitness
+    return fitness <= targetFitness
+
+
+def _ensembleRun(connection, individualClass, genAlgBehaviorClass, populationClass, debugMode, logFileName,
+                 seed, parameters, targetFitness, maximize):
+    """
+    Main function of a run process: seed the random module, run a GA (stopped when
+    its best fitness reaches the target), then send [DONE_MSG, [best individual,
+    history, number of evaluations, run time, target reached]] to the ensemble
+    ([ERROR_MSG, formatted traceback] if the GA failed). The history is the best
+    fitness of each generation, as [generation, best fitness (None if multi objective),
+    time since the start of the run].
+
+    :param connection: The connection to the ensemble.
+    :type connection: multiprocessing Connection
+    :param individualClass: The individual class to use.
+    :type individualClass: type derived from PYGA_Individual
+    :param genAlgBehaviorClass: The behavior class of the GA.
+    :type genAlgBehaviorClass: type derived from PYGA_GenAlgBehavior
+    :param populationClass: The population class of the GA.
+    :type populationClass: type derived from PYGA_Population
+    :param debugMode: Setting debug mode up or down.
+    :type debugMode: bool
+    :param logFileName: The file where the GA writes its logs (None to drop them).
+    :type logFileName: str
+    :param seed: The seed of the random module of the run.
+    :type seed: int
+    :param parameters: The parameters of the GA.
+    :type parameters: dict
+    :param targetFitness: The fitness stopping the run (None if no target).
+    :type targetFitness: float
+    :param maximize: True if the fitness is maximized, False if it is minimized.
+    :type maximize: bool
+    """
+    if logFileName is None:
+        logFileName = devnull
+    outputPrint = open(logFileName, 'w')
+    try:
+        random.seed(seed)
+        genAlg = PYGA_GenAlg(individualClass, genAlgBehaviorClass, populationClass, debugMode, outputPrint)
+        genAlg.setParameters(**parameters)
+        history = []
+        startTime = time()
+
+        def observeGeneration(population, iGeneration):
+            fitness = None
+            if not individualClass.MULTI_OBJ and population.size() > 0:
+                fitness = population.getBestIndividual().getFitness()
+            history.append([iGeneration, fitness, time() - startTime])
+            return isFitnessReached(fitness, targetFitness, maximize)
+
+        genAlg.setGenerationObserver(observeGeneration)
+        genAlg.run()
+        targetReached = len(history) > 0 and isFitnessReached(history[-1][1], targetFitness, maximize)
+        connection.send([DONE_MSG, [genAlg.getBestIndividual(), history, genAlg.getNbEvaluations(),
+                                    time() - startTime, targetReached]])
+    except Exception:
+        connection.send([ERROR_MSG, format_exc()])
+    finally:
+        outputPrint.close()
+        connection.close()
+
+
+class PYGA_Ensemble(object):
+    """
+    Ensemble of runs: the same GA configuration (see setParameters) is run with
+    nbRuns random seeds (firstSeed, firstSeed + 1...), in at most maxProcess runs
+    at once. Each run is a GA in its own process: the seeds give the same results
+    as separate scripts seeding the random module before PYGA_GenAlg.run.
+
+    The best individual, the best fitness of each generation, the number of
+    evaluations and the duration of each run are gathered by the ensemble, and
+    aggregated over the runs (see getStatistics and getGenerationStatistics).
+    With a target fitness, a run reaching it stops, and the other runs are
+    cancelled: the running ones are killed, the waiting ones are not launched.
+    A failed run (error or dead process) does not stop the other ones.
+    A run may use parallel evaluation (max_process parameter...): its worker
+    processes add to the run processes.
+
+    Attributes:
+        :ivar __individualClass: The individual class to use.
+        :type __individualClass: type derived from PYGA_Individual
+        :ivar __genAlgBehaviorClass: The behavior class of the runs.
+        :type __genAlgBehaviorClass: type derived from PYGA_GenAlgBehavior
+        :ivar __populationClass: The population class of the runs.
+        :type __populationClass: type derived from PYGA_Population
+        :ivar __seeds: The random seeds of the runs.
+        :type __seeds: list of int
+        :ivar __maxProcess: The maximum number of runs at once.
+        :type __maxProcess: int
+        :ivar __targetFitness: The fitness stopping the ensemble (None if no target).
+        :type __targetFitness: float
+        :ivar __maximize: True if the fitness is maximized, False if it is minimized.
+        :type __maximize: bool
+        :ivar __debugMode: Defines if debug is activated (in the runs).
+        :type __debugMode: bool
+        :ivar __outputPrint: The output stream to write log in.
+        :type __outputPrint: Opened output stream
+        :ivar __logDirectory: The directory of the log files of the runs (None to drop their logs).
+        :type __logDirectory: str
+        :ivar __parameters: The parameters of the GA.
+        :type __parameters: dict
+        :ivar __runResults: The results of each run, as [best individual, history, number of
+                            evaluations, run time, target reached] (see _ensembleRun),
+                            None if the run was cancelled or failed.
+        :type __runResults: list
+        :ivar __runErrors: The error of each failed run, by seed.
+        :type __runErrors: dict
+        :ivar __ensembleTime: The duration of the last run of the ensemble (seconds).
+        :type __ensembleTime: float
+    """
+    # ==================
+    # v Public methods v
+    # ==================
+
+    def __init__(self,
+                 individualClass,
+                 nbRuns,
+                 genAlgBehaviorClass=PYGA_StandardGenAlgBehavior,
+                 populationClass=PYGA_Population,
+                 firstSeed=0,
+                 maxProcess=0,
+                 targetFitness=None,
+                 maximize=False,
+                 debugMode=False,
+                 outputPrint=None,
+                 logDirectory=None):
+        """
+        The constructor of PYGA_Ensemble.
+
+        :param individualClass: The individual class to use
+        :type individualClass: Python class, inherited from PYGA_Individual
+        :param nbRuns: The number of runs (seeds).
+        :type nbRuns: int
+        :param genAlgBehaviorClass: A class defining the behavior of the runs.
+        :type genAlgBehaviorClass: Python class, inherited from PYGA_GenAlgBehavior
+        :param populationClass: A class defining the structure of a population of the runs
+        :type populationClass: Python class, inherited from PYGA_Population
+        :param firstSeed: The random seed of the first run (incremented for the next ones).
+        :type firstSeed: int
+        :param maxProcess: The maximum number of runs at once (0 for the number of available CPUs).
+        :type maxProcess: int
+        :param targetFitness: The fitness stopping the ensemble (None if no target, single objective only).
+        :type targetFitness: float
+        :param maximize: True if the fitness is maximized, False if it is minimized (target fitness
+                         and aggregated statistics).
+        :type maximize: bool
+        :param debugMode: Setting debug mode up or down (in the runs).
+        :type debugMode: Bool
+        :param outputPrint: A stream within the logs will be written
+        :type outputPrint: Opened output stream
+        :param logDirectory: The directory where each run writes its logs (run_<seed>.log),
+                             None to drop the logs of the runs.
+        :type logDirectory: str
+        """
+        # 1- Check given classes and parameters
+        if not issubclass(individualClass, PYGA_Individual):
+            raise PYGA_CreationError("ERROR: individual class must inherit from PYGA_Individual")
+        if not issubclass(genAlgBehaviorClass, PYGA_GenAlgBehavior):
+            raise PYGA_CreationError("ERROR: behavior class must inherit from PYGA_GenAlgBehavior")
+        if not issubclass(populationClass, PYGA_Population):
+            raise PYGA_CreationError("ERROR: population class must inherit from PYGA_Population")
+        if type(nbRuns) != type(0) or nbRuns < 1:
+            raise PYGA_ParametersError("ERROR: Number of runs must be a strictly positive integer.")
+        if type(firstSeed) != type(0):
+            raise PYGA_ParametersError("ERROR: First seed must be an integer.")
+        if type(maxProcess) != type(0) or maxProcess < 0:
+            raise PYGA_ParametersError("ERROR: Maximum number of runs at once must be a positive integer "
+                                       "(0 for automatic).")
+        if targetFitness is not None and type(targetFitness) not in (type(0), type(0.0)):
+            raise PYGA_ParametersError("ERROR: Target fitness must be a number.")
+
+        # 2- Store the configuration
+        self.__individualClass = individualClass
+        self.__genAlgBehaviorClass = genAlgBehaviorClass
+        self.__populationClass = populationClass
+        self.__seeds = list(range(firstSeed, firstSeed + nbRuns))
+        if maxProcess == 0:
+            maxProcess = getNbAvailableCpus()
+        self.__maxProcess = maxProcess
+        self.__targetFitness = targetFitness
+        self.__maximize = maximize
+        self.__debugMode = debugMode
+        if outputPrint is None:
+            outputPrint = stdout
+        self.__outputPrint = outputPrint
+        self.__logDirectory = logDirectory
+        self.__parameters = {}
+        self.__runResults = [None] * nbRuns
+        self.__runErrors = {}
+        self.__ensembleTime = 0.0
+
+    def setParameters(self, **kwargs):
+        """
+        Set the given parameters values of the runs (see Behavior for parameters list).
+        The parameters are checked by the runs, at the start of the ensemble.
+        """
+        self.__parameters.update(kwargs)
+
+    def getSeeds(self):
+        """Returns the random seeds of the runs."""
+        return list(self.__seeds)
+
+    def run(self):
+        """Run the ensemble (see the class documentation)."""
+        self.__runResults = [None] * len(self.__seeds)
+        self.__runErrors = {}
+        self.__writeHeaders()
+        startTime = time()
+        toLaunch = deque(range(len(self.__seeds)))
+        # Running runs by connection, as [process, run number]
+        running = {}
+        nbDone = 0
+        try:
+            while len(toLaunch) > 0 or len(running) > 0:
+                # 1- Launch runs up to the maximum number of runs at once
+                while len(toLaunch) > 0 and len(running) < self.__maxProcess:
+                    iRun = toLaunch.popleft()
+                    proc, connection = self.__startRun(self.__seeds[iRun])
+                    running[connection] = [proc, iRun]
+                # 2- Sleep until at least one run has sent its results or is dead
+                waitedObjects = {}
+                for connection, (proc, _) in running.items():
+                    waitedObjects[connection] = connection
+                    waitedObjects[proc.sentinel] = connection
+                for connection in set(waitedObjects[obj] for obj in wait(list(waitedObjects.keys()))):
+                    if connection not in running:
+                        # Cancelled meanwhile
+                        continue
+                    proc, iRun = running.pop(connection)
+                    try:
+                        messageType, data = connection.recv()
+                    except (EOFError, IOError, OSError):
+                        messageType, data = ERROR_MSG, "run process died (exit code " + str(proc.exitcode) + ')'
+                    connection.close()
+                    proc.join()
+                    nbDone += 1
+                    if messageType == ERROR_MSG:
+                        self.__runErrors[self.__seeds[iRun]] = data
+                        self.__print("\nERROR: run of seed " + str(self.__seeds[iRun]) + " failed:\n" + data)
+                        continue
+                    self.__runResults[iRun] = data
+                    # 3- Cancel the other runs when the target is reached
+                    if data[4]:
+                        toLaunch.clear()
+                        for otherConnection, (otherProc, _) in list(running.items()):
+                            del running[otherConnection]
+                            otherProc.kill()
+                            otherProc.join()
+                            otherConnection.close()
+                self.__print("\rRunning... " + str(nbDone) + '/' + str(len(self.__seeds)) + " runs done" + ' ' * 10)
+        finally:
+            for connection, (proc, _) in running.items():
+                if proc.is_alive():
+                    proc.kill()
+                proc.join()
+                connection.close()
+        self.__ensembleTime = time() - startTime
+        self.__writeStatistics()
+
+    def getBestIndividual(self):
+        """Returns the best individual of all the runs (of the last run of the ensemble)."""
+        population = self.__populationClass(self.__individualClass, None, self.__print)
+        for results in self.__runResults:
+            if results is None:
+                continue
+            bestIndividuals = results[0]
+            if not isinstance(bestIndividuals, list):
+                bestIndividuals = [bestIndividuals]
+            for individual in bestIndividuals:
+                population.addIndividual(individual)
+        if population.size() == 0:
+            return None
+        return population.getBestIndividual()
+
+    def getRunResults(self, seed):
+        """
+        Get the results of the run of a seed (of the last run of the ensemble).
+
+        :param seed: The random seed of the run.
+        :type seed: int
+        :return: The best individual, the history (best fitness of each generation, as
+                 [generation, best fitness, time]), the number of evaluations, the run time
+                 and True if the target fitness was reached (None if cancelled or failed).
+        :rtype: list
+        """
+        return self.__runResults[self.__seeds.index(seed)]
+
+    def getRunErrors(self):
+        """Get the errors of the failed runs (of the last run of the ensemble), by seed."""
+        return dict(self.__runErrors)
+
+    def getStatistics(self):
+        """
+        Get the statistics aggregated over the completed runs (of the last run of the ensemble).
+
+        :return: The number of completed, cancelled and failed runs, the best, mean and worst
+                 best fitness of the runs (None if multi objective or no completed run),
+                 the mean run time, the total number of evaluations and the duration of the
+                 ensemble (seconds).
+        :rtype: list
+        """
+        completed = [results for results in self.__runResults if results is not None]
+        nbFailed = len(self.__runErrors)
+        nbCancelled = len(self.__seeds) - len(completed) - nbFailed
+        fitnesses = [results[1][-1][1] for results in completed if len(results[1]) > 0]
+        fitnessStatistics = self.__aggregate([fitness for fitness in fitnesses if fitness is not None])
+        meanTime = None
+        if len(completed) > 0:
+            meanTime = sum(results[3] for results in completed) / len(completed)
+        nbEval = sum(results[2] for results in completed)
+        return [len(completed), nbCancelled, nbFailed] + fitnessStatistics + [meanTime, nbEval, self.__ensembleTime]
+
+    def getGenerationStatistics(self):
+        """
+        Get the best fitness of each generation aggregated over the completed runs (of the
+        last run of the ensemble, single objective only).
+
+        :return: The generation number, the number of runs having reached it, and the best,
+                 mean and worst best fitness of these runs at this generation.
+        :rtype: list of list
+        """
+        fitnessesByGeneration = {}
+        for results in self.__runResults:
+            if results is None:
+                continue
+            for iGeneration, fitness, _ in results[1]:
+                if fitness is not None:
+                    fitnessesByGeneration.setdefault(iGeneration, []).append(fitness)
+        return [[iGeneration, len(fitnessesByGeneration[iGeneration])] +
+                self.__aggregate(fitnessesByGeneration[iGeneration])
+                for iGeneration in sorted(fitnessesByGeneration.keys())]
+
+    # ==================
+    # ^ Public methods ^
+    # ==================
+
+    # ===================
+    # v Private methods v
+    # ===================
+
+    def __print(self, s):
+        """
+        Print s to the output stream given in constructor.
+
+        :param s: The string to print
+        :type s: str
+        """
+        self.__outputPrint.write(s)
+        self.__outputPrint.flush()
+
+    def __aggregate(self, fitnesses):
+        """
+        Aggregate fitnesses.
+
+        :param fitnesses: The fitnesses.
+        :type fitnesses: list of float
+        :return: The best, mean and worst fitness (None if no fitness).
+        :rtype: list
+        """
+        if len(fitnesses) == 0:
+            return [None, None, None]
+        best, worst = min(fitnesses), max(fitnesses)
+        if self.__maximize:
+            best, worst = worst, best
+        return [best, sum(fitnesses) / len(fitnesses), worst]
+
+    def __startRun(self, seed):
+        """
+        Start the process of a run (not daemonic: a run may start evaluation worker processes).
+
+        :param seed: The random seed of the run.
+        :type seed: int
+        :return: The run process and its connection.
+        :rtype: tuple
+        """
+        logFileName = None
+        if self.__logDirectory is not None:
+            logFileName = osjoin(self.__logDirectory, "run_" + str(seed) + ".log")
+        parentConnection, childConnection = Pipe()
+        proc = Process(target=_ensembleRun,
+                       args=(childConnection, self.__individualClass, self.__genAlgBehaviorClass,
+                             self.__populationClass, self.__debugMode, logFileName, seed,
+                             self.__parameters, self.__targetFitness, self.__maximize))
+        proc.start()
+        childConnection.close()
+        return proc, parentConnection
+
+    def __writeHeaders(self):
+        """Write the configuration of the ensemble at launch."""
+        self.__print("***********************************************************************\n")
+        targetStr = ""
+        if self.__targetFitness is not None:
+            targetStr = ", target fitness " + str(self.__targetFitness)
+        self.__print("Ensemble: " + str(len(self.__seeds)) + " runs (seeds " + str(self.__seeds[0]) + " to " +
+                     str(self.__seeds[-1]) + "), " + str(self.__maxProcess) + " at once" + targetStr + '\n')
+        self.__print("Parameters: " + str(self.__parameters) + '\n')
+        self.__print("Start time: " + str(asctime()) + '\n')
+        self.__print("\rRunning...")
+
+    def __writeStatistics(self):
+        """Write the statistics of the runs at the end of the ensemble."""
+        self.__print('\n')
+        for seed, results in zip(self.__seeds, self.__runResults):
+            if results is None:
+                continue
+            _, history, nbEval, runTime, targetReached = results
+            fitnessStr = ""
+            if len(history) > 0 and history[-1][1] is not None:
+                fitnessStr = "best fitness " + str(history[-1][1]) + ", "
+            targetStr = ""
+            if targetReached:
+                targetStr = " (target reached)"
+            self.__print("Seed " + str(seed) + ": " + fitnessStr + str(len(history) - 1) + " generations, " +
+                         str(nbEval) + " evaluations, " + str(round(runTime, 2)) + " seconds" + targetStr + '\n')
+        (nbCompleted, nbCancelled, nbFailed, bestFitness, meanFitness, worstFitness,
+         meanTime, nbEval, ensembleTime) = self.getStatistics()
+        self.__print("Runs: " + str(nbCompleted) + " completed, " + str(nbCancelled) + " cancelled, " +
+                     str(nbFailed) + " failed\n")
+        if bestFitness is not None:
+            self.__print("Best fitness of the runs: best " + str(bestFitness) + ", mean " + str(meanFitness) +
+                         ", worst " + str(worstFitness) + '\n')
+        if meanTime is not None:
+            self.__print("Mean run time: " + str(meanTime) + " seconds.\n")
+        self.__print("Total number of evaluation: " + str(nbEval) + '\n')
+        self.__print("Ensemble time: " + str(ensembleTime) + " seconds.\n")
+        self.__print("***********************************************************************\n")
+
+    # ===================
+    # ^ Private methods ^
+    # ===================
+
+
+def importClass(classPath):
+    """
+    Import a class from its path.
+
+    :param classPath: The path of the class, as "module:Class" (or "module.Class").
+    :type classPath: str
+    :return: The class.
+    :rtype: type
+    """
+    if ':' in classPath:
+        moduleName, className = classPath.split(':', 1)
+    else:
+        moduleName, className = classPath.rsplit('.', 1)
+    return getattr(import_module(moduleName), className)
+
+
+def main(argv=None):
+    """
+    Command line of the ensemble: run a GA configuration with several seeds.
+
+    The parameters of the GA are given as "name=value" (see Behavior for parameters
+    list), the value being a Python literal (or a string otherwise):
+        python -m PyGenAlg.core.PYGA_Ensemble myModule:MyIndividual --runs 20 --max-process 4
+                                              --target 1e-6 pop_size=100 nb_gen=50 selection=ranking
+
+    :param argv: The arguments (None for the arguments of the command line).
+    :type argv: list of str
+    :return: The ensemble, after its run.
+    :rtype: PYGA_Ensemble
+    """
+    parser = ArgumentParser(prog="python -m PyGenAlg.core.PYGA_Ensemble",
+                            description="Run a GA configuration with several random seeds in parallel.")
+    parser.add_argument("individual", help="individual class, as module:Class")
+    parser.add_argument("parameters", nargs='*', metavar="name=value", help="parameters of the GA")
+    parser.add_argument("--behavior", default=None, help="behavior class, as module:Class")
+    parser.add_argument("--runs", type=int, default=10, help="number of runs (seeds)")
+    parser.add_argument("--first-seed", type=int, default=0, help="random seed of the first run")
+    parser.add_argument("--max-process", type=int, default=0,
+                        help="maximum number of runs at once (0 for the number of available CPUs)")
+    parser.add_argument("--target", type=float, default=None, help="fitness stopping the ensemble")
+    parser.add_argument("--maximize", action="store_true", help="the fitness is maximized")
+    parser.add_argument("--log-dir", default=None, help="directory of the log files of the runs")
+    args = parser.parse_intermixed_args(argv)
+
+    parameters = {}
+    for parameter in args.parameters:
+        if '=' not in parameter:
+            parser.error("parameter must be given as name=value: " + parameter)
+        name, value = parameter.split('=', 1)
+        try:
+            value = literal_eval(value)
+        except (ValueError, SyntaxError):
+            pass
+        parameters[name] = value
+    genAlgBehaviorClass = PYGA_StandardGenAlgBehavior
+    if args.behavior is not None:
+        genAlgBehaviorClass = importClass(args.behavior)
+
+    ensemble = PYGA_Ensemble(importClass(args.individual), args.runs, genAlgBehaviorClass,
+                             firstSeed=args.first_seed, maxProcess=args.max_process, targetFitness=args.target,
+                             maximize=args.maximize, logDirectory=args.log_dir)
+    ensemble.setParameters(**parameters)
+    ensemble.run()
+    print(ensemble.getBestIndividual())
+    return ensemble
+
+
+if __name__ == '__main__':
+    main()
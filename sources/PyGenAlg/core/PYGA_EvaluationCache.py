@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+Python Genetic Algorithm module.
+
+This file contains the evaluation cache of the GA: PYGA_EvaluationCache.
+It keeps the evaluation results of the last evaluated genomes (see
+PYGA_Individual.getFingerprint) so that a genome created again is not evaluated again.
+
+License full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+
+
+
+Modification History:
+**** 18/10/2026 ****
+Creation
+- Persistence hooks (loadResult, saveResult, flush), see PYGA_DiskEvaluationCache
+
+TODO List:
+-
+"""
+# - Build-in imports -
+from collections import OrderedDict
+
+# - Local imports -
+
+# Meta information
+__author__ = "Raphaël Deau"
+__copyright__ = "Copyright 2016, Raphaël Deau"
+__license__ = "Creative Commons Attribution Non-commercial 4.0"
+__version__ = "1.0.0"
+__since__ = "18/10/2026"
+__date__ = "18/10/2026"
+
+
+class PYGA_EvaluationCache(object):
+    """
+    In memory evaluation cache, bounded in size: the least recently used
+    results are evicted first.
+
+    The results are stored as returned by PYGA_Individual.getEvaluationResult and
+    shared by all individuals having the same fingerprint: they must not be modified.
+
+    A persistent cache overloads loadResult/saveResult (called on memory misses
+    and stores), flush, and start/stop to open and close its storage.
+
+    Attributes:
+        :ivar __maxSize: The maximum number of stored results (0 for no limit).
+        :type __maxSize: int
+        :ivar __results: The results, by fingerprint (the last used at the end).
+        :type __results: OrderedDict
+        :ivar __nbHits: The number of results found in the cache.
+        :type __nbHits: int
+        :ivar __nbMisses: The number of results not found in the cache.
+        :type __nbMisses: int
+    """
+    # ==================
+    # v Public methods v
+    # ==================
+
+    def __init__(self, maxSize):
+        """
+        Constructor of the evaluation cache.
+
+        :param maxSize: The maximum number of stored results (0 for no limit).
+        :type maxSize: int
+        """
+        self.__maxSize = maxSize
+        self.__results = OrderedDict()
+        self.__nbHits = 0
+        self.__nbMisses = 0
+
+    def start(self):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Open the cache (called once at the beginning of the run).
+        """
+        pass
+
+    def stop(self):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Close the cache (called once at the end of the run).
+        """
+        pass
+
+    def flush(self):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Write the stored results (called after each evaluation of a population).
+        """
+        pass
+
+    def loadResult(self, fingerprint):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Look for a result not found in memory (in a persistent storage for instance).
+
+        :param fingerprint: The fingerprint of the genome (see PYGA_Individual.getFingerprint).
+        :type fingerprint: hashable
+        :return: True and the result if it is found, False and None otherwise.
+        :rtype: tuple
+        """
+        return False, None
+
+    def saveResult(self, fingerprint, result):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Save a new result (in a persistent storage for instance).
+
+        :param fingerprint: The fingerprint of the genome (see PYGA_Individual.getFingerprint).
+        :type fingerprint: hashable
+        :param result: The evaluation result (see PYGA_Individual.getEvaluationResult).
+        :type result: Depending on the individual
+        """
+        pass
+
+    def lookup(self, fingerprint):
+        """
+        Look for the evaluation result of a genome.
+
+        :param fingerprint: The fingerprint of the genome (see PYGA_Individual.getFingerprint).
+        :type fingerprint: hashable
+        :return: True and the result if it is found, False and None otherwise.
+        :rtype: tuple
+        """
+        try:
+            result = self.__results[fingerprint]
+        except KeyError:
+            found, result = self.loadResult(fingerprint)
+            if not found:
+                self.__nbMisses += 1
+                return False, None
+            self.storeInMemory(fingerprint, result)
+        self.__results.move_to_end(fingerprint)
+        self.__nbHits += 1
+        return True, result
+
+    def store(self, fingerprint, result):
+        """
+        Store the evaluation result of a genome (evicting the least recently used
+        results if the cache is full).
+
+        :param fingerprint: The fingerprint of the genome (see PYGA_Individual.getFingerprint).
+        :type fingerprint: hashable
+        :param result: The evaluation result (see PYGA_Individual.getEvaluationResult).
+        :type result: Depending on the individual
+        """
+        self.storeInMemory(fingerprint, result)
+        self.saveResult(fingerprint, result)
+
+    def storeInMemory(self, fingerprint, result):
+        """
+        Store a result in memory only (not saved, see saveResult).
+
+        :param fingerprint: The fingerprint of the genome (see PYGA_Individual.getFingerprint).
+        :type fingerprint: hashable
+        :param result: The evaluation result (see PYGA_Individual.getEvaluationResult).
+        :type result: Depending on the individual
+        """
+        self.__results[fingerprint] = result
+        self.__results.move_to_end(fingerprint)
+        while self.__maxSize > 0 and len(self.__results) > self.__maxSize:
+            self.__results.popitem(last=False)
+
+    def size(self):
+        """Get the number of stored results."""
+        return len(self.__results)
+
+    def getMaxSize(self):
+        """Get the maximum number of stored results (0 for no limit)."""
+        return self.__maxSize
+
+    def getNbHits(self):
+        """Get the number of results found in the cache."""
+        return self.__nbHits
+
+    def getNbMisses(self):
+        """Get the number of results not found in the cache."""
+        return self.__nbMisses
+
+    def getPrintInformation(self):
+        """Get the statistics of the cache, as printed at the end of the run."""
+        nbLookups = self.__nbHits + self.__nbMisses
+        hitRate = 0.0
+        if nbLookups > 0:
+            hitRate = 100.0 * self.__nbHits / nbLookups
+        return ("Evaluation cache: " + str(self.__nbHits) + " hits, " + str(self.__nbMisses) + " misses (" +
+                str(round(hitRate, 1)) + "% hit rate, " + str(self.size()) + " stored results)\n")
+
+    # ==================
+    # ^ Public methods ^
+    # ==================
@@ -0,0 +1,1189 @@
+# -*- coding: utf-8 -*-
+"""
+Python Genetic Algorithm module.
+
+This file contains the base class of the evaluation engine of the GA: PYGA_Evaluator.
+It defines how the objectives of the individuals of a population are computed.
+The base evaluator computes them one after the other in the current process.
+
+Available evaluators:
+    - PYGA_Evaluator: serial evaluation (in the current process)
+    - PYGA_ThreadEvaluator: pool of threads
+    - PYGA_ProcessEvaluator: pool of worker processes
+    - PYGA_AsyncEvaluator: coroutine fitness run on an event loop
+    - PYGA_ExecutorEvaluator: any concurrent.futures.Executor compatible object
+    - PYGA_RemoteEvaluator: workers connected over TCP, from any host
+
+License full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+
+
+
+Modification History:
+**** 18/10/2026 ****
+Creation
+- Evaluation worker initialisation (PYGA_Individual.initWorker)
+- Evaluator interface documented, chunk evaluation shared by the evaluators
+- Batch fitness (PYGA_Individual.fitnessBatch): one call per chunk
+- Evaluation cache (computeObjectives front-end)
+- Identical genomes of a population evaluated once (setMergeDuplicates)
+- Evaluation timeout and penalty (setEvaluationTimeout, applyPenalty)
+- Failed evaluations retried (failTask) and failure statistics
+- Individuals added while evaluating (live queue, see launchQueue)
+- Quorum evaluation: the generation goes on before the end of the evaluation (computeObjectivesQuorum),
+  run by a feeder thread, the context of the last population given to the launched individuals (getNewContext)
+- Most expensive evaluations launched first, chunks balanced by cost (sortByCost, popChunk)
+- Number of CPUs given by the CPU affinity (getNbAvailableCpus), chunk duration adapted to the IPC overhead
+- Generation of new individuals by the evaluation engine (generateIndividuals), evaluated at once if asked
+
+TODO List:
+-
+"""
+# - Build-in imports -
+from collections import deque
+from math import ceil
+import os
+import random
+from sys import version_info
+from threading import Lock, Thread
+from time import time
+from traceback import format_exc
+
+# Manage python versions compatibility
+if version_info[0] >= 3:
+    from queue import Empty, Queue
+else:
+    from Queue import Empty, Queue
+
+# - Local imports -
+from PyGenAlg.core.PYGA_Exceptions import PYGA_FitnessComputation
+
+# Meta information
+__author__ = "Raphaël Deau"
+__copyright__ = "Copyright 2016, Raphaël Deau"
+__license__ = "Creative Commons Attribution Non-commercial 4.0"
+__version__ = "1.0.0"
+__since__ = "18/10/2026"
+__date__ = "18/10/2026"
+
+# Types of evaluation failures (see PYGA_Evaluator.failTask)
+CRASH_FAILURE = "crash"
+ERROR_FAILURE = "error"
+TIMEOUT_FAILURE = "timeout"
+FAILURE_TYPES = [CRASH_FAILURE, ERROR_FAILURE, TIMEOUT_FAILURE]
+
+
+def getNbAvailableCpus():
+    """
+    Get the number of CPUs the current process may run on (its CPU affinity,
+    which may be less than the number of CPUs of the machine: taskset, cgroups, batch schedulers...).
+
+    :return: The number of available CPUs.
+    :rtype: int
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        # No CPU affinity on this platform
+        return os.cpu_count() or 1
+
+
+def launchQueue(individuals):
+    """
+    Get the queue of the individuals to launch of an evaluation.
+    A deque given to the evaluation is used as is: individuals may be added to it
+    while the evaluation runs (between two yielded individuals), they are evaluated
+    by the same evaluation (see PYGA_SteadyStateGenAlgBehavior).
+
+    :param individuals: The individuals to evaluate, as [indivID, individual].
+    :type individuals: list or deque
+    :return: The queue of the individuals to launch.
+    :rtype: deque
+    """
+    if isinstance(individuals, deque):
+        return individuals
+    return deque(individuals)
+
+
+def evaluateChunk(individualClass, context, chunk):
+    """
+    Compute the objectives of a chunk of individuals (in a worker).
+    With a batch fitness (see PYGA_Individual.fitnessBatch), the whole chunk is
+    computed in one call and its duration is shared between the individuals.
+
+    :param individualClass: The individual class to evaluate.
+    :type individualClass: type derived from PYGA_Individual
+    :param context: The evaluation context (see PYGA_Individual.getEvaluationContext).
+    :type context: Depending on the individual
+    :param chunk: The individuals to evaluate, as [indivID, individual].
+    :type chunk: list
+    :return: The results, as [indivID, evaluation result, evaluation duration]
+             (see PYGA_Individual.getEvaluationResult).
+    :rtype: list
+    """
+    if individualClass.hasFitnessBatch():
+        startTime = time()
+        individualClass.computeObjectivesBatch([individual for _, individual in chunk], context)
+        duration = (time() - startTime) / max(1, len(chunk))
+        return [[indivID, individual.getEvaluationResult(), duration] for indivID, individual in chunk]
+    results = []
+    for indivID, individual in chunk:
+        startTime = time()
+        individual.computeObjectives(context)
+        results.append([indivID, individual.getEvaluationResult(), time() - startTime])
+    return results
+
+
+def generateChunk(individualClass, context, nbIndividuals, evaluate, seed=None):
+    """
+    Generate new individuals (in a worker, see PYGA_Individual.generate), and compute
+    their objectives if asked. A failed evaluation does not fail the generation: its
+    traceback is returned with the individuals (see PYGA_Evaluator.failGeneration).
+
+    :param individualClass: The individual class to generate.
+    :type individualClass: type derived from PYGA_Individual
+    :param context: The evaluation context (see PYGA_Individual.getEvaluationContext).
+    :type context: Depending on the individual
+    :param nbIndividuals: The number of individuals to generate.
+    :type nbIndividuals: int
+    :param evaluate: True to compute the objectives of the generated individuals.
+    :type evaluate: bool
+    :param seed: The seed of the random module of the worker (None to keep its state).
+    :type seed: int
+    :return: The generated individuals and the evaluation error (None if no evaluation
+             failed, the formatted traceback otherwise), as [individuals, error].
+    :rtype: list
+    """
+    if seed is not None:
+        random.seed(seed)
+    individuals = [individualClass.generate() for _ in range(nbIndividuals)]
+    error = None
+    if evaluate:
+        try:
+            if individualClass.hasFitnessBatch():
+                individualClass.computeObjectivesBatch(individuals, context)
+            else:
+                for individual in individuals:
+                    individual.computeObjectives(context)
+        except Exception:
+            # The individuals not evaluated keep needing their computation: they are
+            # evaluated with their population (retries and penalty, see failTask)
+            error = format_exc()
+    return [individuals, error]
+
+
+class PYGA_Evaluator(object):
+    """
+    This class is the base for the GA evaluation engine.
+
+    An evaluator is created once per run: by PYGA_GenAlgBehavior.createEvaluator
+    according to the parameters (max_process, evaluation_backend...), or given
+    to the constructor of PYGA_GenAlg. The run calls:
+        - start: before the initialisation of the population.
+        - evaluate: each time individuals of a population must be computed.
+        - stop: at the end of the run (even if it failed).
+    So the same engine (workers, threads...) is used for every generation.
+
+    The populations call computeObjectives: it looks for the results in the
+    evaluation cache of the run (see PYGA_EvaluationCache), merges the
+    individuals having the same genome (see PYGA_Individual.getFingerprint),
+    then calls evaluate for one individual of each genome.
+
+    A new evaluator must overload evaluate (and start/stop if it has resources
+    to manage). It must set the objectives in the given individuals (never
+    replace them): evaluations done in other processes send back the evaluation
+    result (see PYGA_Individual.getEvaluationResult) and set it in the individual
+    of the main process (see PYGA_Individual.setEvaluationResult). The helper
+    functions of this class (measureEvaluation, getChunkSize, popChunk) may be used to
+    send individuals by chunks.
+    When the individual class estimates the cost of its evaluations (see
+    PYGA_Individual.estimateCost and getCostFeature), the individuals are given to
+    evaluate longest first (see sortByCost), and popChunk balances the chunks by cost.
+    An evaluator should stop the evaluations lasting more than the timeout of the run
+    (see setEvaluationTimeout), and give its failed tasks (crash, error, timeout)
+    to failTask, which launches them again or penalises them.
+
+    The individuals may be given in a deque, extended by the caller while the
+    evaluation runs (see launchQueue): an evaluator takes the individuals to launch
+    from the queue each time a worker is free, and ends when the queue is empty and
+    no evaluation is running. The evaluation context is the one of the population
+    at the beginning of the evaluation, unless a new one is given while it runs (see
+    getNewContext): an evaluator checks it before launching individuals.
+    A running evaluation yields [None, None] when the wake up time is reached
+    (see setWakeUpTime), so that the caller can stop waiting for the results:
+    an evaluator must not wait for its workers beyond it (see getWaitTime). The
+    evaluations still running when the caller closes the generator are abandoned.
+
+    The base evaluator computes the objectives serially, in the current process
+    (all individuals in one call with a batch fitness, see PYGA_Individual.fitnessBatch).
+
+    Attributes:
+        :ivar __individualClass: The individual class to evaluate.
+        :type __individualClass: type derived from PYGA_Individual
+        :ivar __printMethod: The method to call to print logs.
+        :type __printMethod: callable
+        :ivar __nbEvalMeasured: The number of evaluations timed since the creation.
+        :type __nbEvalMeasured: int
+        :ivar __evalTimeSum: The total time of the timed evaluations.
+        :type __evalTimeSum: float
+        :ivar __estimatedCostSum: The total estimated cost of the timed evaluations (see
+                                  PYGA_Individual.estimateCost), to convert the costs into durations.
+        :type __estimatedCostSum: float
+        :ivar __estimatedCostTimeSum: The total time of the timed evaluations having an estimated cost.
+        :type __estimatedCostTimeSum: float
+        :ivar __costFeatures: The number of timed evaluations and their total time, by cost
+                              feature (see PYGA_Individual.getCostFeature).
+        :type __costFeatures: dict
+        :ivar __evaluationCache: The evaluation cache of the run (None for no cache).
+        :type __evaluationCache: PYGA_EvaluationCache
+        :ivar __mergeDuplicates: True to evaluate once the individuals having the same fingerprint.
+        :type __mergeDuplicates: bool
+        :ivar __nbMergedEvaluations: The number of evaluations saved by the merge since the start of the run.
+        :type __nbMergedEvaluations: int
+        :ivar __timeout: The maximum duration of an evaluation (seconds, 0 for no limit).
+        :type __timeout: float
+        :ivar __penalty: The evaluation result of the individuals whose evaluation failed
+                         (None to stop the run instead).
+        :type __penalty: Depending on the individual
+        :ivar __penalisedIDs: The individuals penalised during the current evaluation (by indivID).
+        :type __penalisedIDs: set
+        :ivar __maxRetry: The number of times a failed evaluation is launched again.
+        :type __maxRetry: int
+        :ivar __nbFailuresByIndiv: The number of failed evaluations of the individuals
+                                   during the current evaluation (by indivID).
+        :type __nbFailuresByIndiv: dict
+        :ivar __failureStats: The number of failures by type, of retries and of penalties
+                              during the current evaluation, and since the start of the run.
+        :type __failureStats: list
+        :ivar __wakeUpTime: The time at which a running evaluation yields [None, None] (None for never).
+        :type __wakeUpTime: float
+        :ivar __quorumFeeder: The thread running the evaluation of the quorum mode (None if not started).
+        :type __quorumFeeder: Thread
+        :ivar __quorumLock: The lock of the start and of the end of the feeder thread.
+        :type __quorumLock: Lock
+        :ivar __quorumRunning: True while the feeder thread evaluates (see __feedQuorum).
+        :type __quorumRunning: bool
+        :ivar __quorumAbandoned: True to stop the feeder thread (see abandonEvaluations).
+        :type __quorumAbandoned: bool
+        :ivar __quorumPopulation: The copy of the population of the last quorum evaluation call.
+        :type __quorumPopulation: Derived from PYGA_Population
+        :ivar __quorumResults: The computed individuals of the quorum evaluation, as [quorumID, individual],
+                               and [None, error] when the feeder thread ends.
+        :type __quorumResults: Queue
+        :ivar __quorumQueue: The individuals to launch of the quorum evaluation, as [quorumID, individual].
+        :type __quorumQueue: deque
+        :ivar __nextQuorumID: The identifier of the next individual of the quorum evaluation.
+        :type __nextQuorumID: int
+        :ivar __nbQuorumRunning: The number of individuals of the quorum evaluation not computed yet.
+        :type __nbQuorumRunning: int
+        :ivar __postponedIndividuals: The computed individuals of the quorum evaluation waiting
+                                      for a place in a population (see postponeIndividuals).
+        :type __postponedIndividuals: deque
+        :ivar __contextUpdate: The version of the evaluation context and the context given to the
+                               individuals launched from now on (None out of the quorum mode, see getNewContext).
+        :type __contextUpdate: list
+        :ivar __nbContextUpdates: The number of evaluation contexts given (version of the next one).
+        :type __nbContextUpdates: int
+        :ivar __nbOverheadMeasured: The number of chunks whose communication overhead was measured.
+        :type __nbOverheadMeasured: int
+        :ivar __overheadSum: The sum of the measured communication overheads (seconds).
+        :type __overheadSum: float
+    """
+
+    # Minimum expected duration of a chunk in automatic mode (seconds)
+    AUTO_CHUNK_DURATION = 0.1
+    # Minimum ratio between the expected duration of a chunk and the communication overhead of a chunk
+    AUTO_CHUNK_OVERHEAD_RATIO = 20
+    # Period at which the feeder thread of the quorum mode checks if the evaluation is abandoned (seconds)
+    QUORUM_POLL_PERIOD = 0.1
+
+    # ==================
+    # v Public methods v
+    # ==================
+
+    def __init__(self, individualClass, printMethod=None):
+        """
+        Constructor of the evaluator.
+
+        :param individualClass: The individual class to evaluate.
+        :type individualClass: type derived from PYGA_Individual
+        :param printMethod: The method to call to print logs (None for no log).
+        :type printMethod: Python method
+        """
+        self.__individualClass = individualClass
+        self.__printMethod = printMethod
+        self.__nbEvalMeasured = 0
+        self.__evalTimeSum = 0.0
+        self.__estimatedCostSum = 0.0
+        self.__estimatedCostTimeSum = 0.0
+        self.__costFeatures = {}
+        self.__evaluationCache = None
+        self.__mergeDuplicates = False
+        self.__nbMergedEvaluations = 0
+        self.__timeout = 0
+        self.__penalty = None
+        self.__penalisedIDs = set()
+        self.__maxRetry = 0
+        self.__nbFailuresByIndiv = {}
+        self.__failureStats = [self.__newFailureStats(), self.__newFailureStats()]
+        self.__wakeUpTime = None
+        self.__quorumFeeder = None
+        self.__quorumLock = Lock()
+        self.__quorumRunning = False
+        self.__quorumAbandoned = False
+        self.__quorumPopulation = None
+        self.__quorumResults = Queue()
+        self.__quorumQueue = deque()
+        self.__nextQuorumID = 0
+        self.__nbQuorumRunning = 0
+        self.__postponedIndividuals = deque()
+        self.__contextUpdate = None
+        self.__nbContextUpdates = 0
+        self.__nbOverheadMeasured = 0
+        self.__overheadSum = 0.0
+
+    def getIndividualClass(self):
+        """Allows child classes to know the individual class."""
+        return self.__individualClass
+
+    def getNbWorkers(self):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Get the number of evaluations run at the same time (0 for no limit).
+        """
+        return 1
+
+    def setPrintMethod(self, printMethod):
+        """Set the method to call to print logs (done by PYGA_GenAlg)."""
+        self.__printMethod = printMethod
+
+    def printLog(self, s, debug=False):
+        """Print s with the print method given in constructor."""
+        if self.__printMethod is not None:
+            self.__printMethod(s, debug=debug)
+
+    def setEvaluationCache(self, evaluationCache):
+        """
+        /!\ MAY ONLY BE CALLED BY PYGA_GenAlg /!\
+
+        Set the evaluation cache of the run.
+
+        :param evaluationCache: The evaluation cache (None for no cache).
+        :type evaluationCache: PYGA_EvaluationCache
+        """
+        self.__evaluationCache = evaluationCache
+
+    def getEvaluationCache(self):
+        """Get the evaluation cache of the run (None for no cache)."""
+        return self.__evaluationCache
+
+    def setMergeDuplicates(self, mergeDuplicates):
+        """
+        /!\ MAY ONLY BE CALLED BY PYGA_GenAlg /!\
+
+        Set if the individuals having the same fingerprint are evaluated once
+        (called at the beginning of each run: the count of saved evaluations is reset).
+
+        :param mergeDuplicates: True to merge the evaluations.
+        :type mergeDuplicates: bool
+        """
+        self.__mergeDuplicates = mergeDuplicates
+        self.__nbMergedEvaluations = 0
+
+    def getNbMergedEvaluations(self):
+        """Get the number of evaluations saved by the merge of identical genomes since the start of the run."""
+        return self.__nbMergedEvaluations
+
+    def setEvaluationTimeout(self, timeout, penalty):
+        """
+        /!\ MAY ONLY BE CALLED BY PYGA_GenAlg /!\
+
+        Set the maximum duration of an evaluation and the penalty given to the
+        individuals whose evaluation is stopped (see PYGA_Individual.applyPenalty).
+
+        :param timeout: The maximum duration of an evaluation (seconds, 0 for no limit).
+        :type timeout: float
+        :param penalty: The fitness (objectives) of the penalised individuals (None to stop the run).
+        :type penalty: Depending on the individual
+        """
+        self.__timeout = timeout
+        self.__penalty = penalty
+
+    def getEvaluationTimeout(self):
+        """Get the maximum duration of an evaluation (seconds, 0 for no limit)."""
+        return self.__timeout
+
+    def setMaxRetry(self, maxRetry):
+        """
+        /!\ MAY ONLY BE CALLED BY PYGA_GenAlg /!\
+
+        Set the number of times a failed evaluation (crash, error) is launched again
+        before penalising the individual (called at the beginning of each run:
+        the failure statistics are reset).
+
+        :param maxRetry: The number of retries.
+        :type maxRetry: int
+        """
+        self.__maxRetry = maxRetry
+        self.__failureStats = [self.__newFailureStats(), self.__newFailureStats()]
+
+    def getMaxRetry(self):
+        """Get the number of times a failed evaluation is launched again."""
+        return self.__maxRetry
+
+    def failTask(self, task, toLaunchAlone, failureType, reason):
+        """
+        Manage a failed task (a chunk of individuals):
+            - the individuals of a task of several individuals are launched again one by one,
+            - an individual failing on its own is launched again (up to the number of retries,
+              a timeout is never launched again) or penalised (see applyPenalty).
+
+        :param task: The individuals of the task, as [indivID, individual].
+        :type task: list
+        :param toLaunchAlone: The individuals to launch one by one, where the individuals
+                              to launch again are added.
+        :type toLaunchAlone: deque
+        :param failureType: The type of failure (see FAILURE_TYPES).
+        :type failureType: str
+        :param reason: The reason of the failure (traceback...).
+        :type reason: str
+        :return: The penalised individuals (to yield), as [indivID, individual].
+        :rtype: list
+        """
+        for failureStats in self.__failureStats:
+            failureStats[failureType] += 1
+        if len(task) > 1:
+            toLaunchAlone.extend(task)
+            return []
+        indivID, individual = task[0]
+        if failureType != TIMEOUT_FAILURE:
+            nbFailures = self.__nbFailuresByIndiv.get(indivID, 0) + 1
+            self.__nbFailuresByIndiv[indivID] = nbFailures
+            if nbFailures <= self.__maxRetry:
+                for failureStats in self.__failureStats:
+                    failureStats["retry"] += 1
+                toLaunchAlone.append(task[0])
+                return []
+        self.applyPenalty(indivID, individual, failureType + ": " + reason)
+        for failureStats in self.__failureStats:
+            failureStats["penalty"] += 1
+        return [task[0]]
+
+    def failGeneration(self, reason):
+        """
+        Count a failed evaluation of generated individuals (see generateChunk) as an
+        error. The individuals not evaluated are evaluated with their population.
+
+        :param reason: The reason of the failure (traceback...).
+        :type reason: str
+        """
+        for failureStats in self.__failureStats:
+            failureStats[ERROR_FAILURE] += 1
+        self.printLog("PYGA_Evaluator / generateIndividuals - evaluation failed: " + reason + '\n', debug=True)
+
+    def getFailureInformation(self, sinceStart=False):
+        """
+        Get the failure statistics, as printed in the logs.
+
+        :param sinceStart: True for the statistics since the start of the run,
+                           False for the last evaluation.
+        :type sinceStart: bool
+        :return: The statistics (empty if no evaluation failed).
+        :rtype: str
+        """
+        failureStats = self.__failureStats[int(sinceStart)]
+        if sum(failureStats[failureType] for failureType in FAILURE_TYPES) == 0:
+            return ""
+        return ("Evaluation failures: " +
+                ", ".join(str(failureStats[failureType]) + ' ' + failureType for failureType in FAILURE_TYPES) +
+                " (" + str(failureStats["retry"]) + " retries, " + str(failureStats["penalty"]) + " penalised)\n")
+
+    def getPrintInformation(self):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Get the information on the evaluation engine printed at the end of the run (empty for none).
+        """
+        return ""
+
+    def applyPenalty(self, indivID, individual, reason):
+        """
+        Give the penalty to an individual whose evaluation failed.
+        The run is stopped if there is no penalty.
+
+        :param indivID: The index of the individual in the population.
+        :type indivID: int
+        :param individual: The individual.
+        :type individual: Derived from PYGA_Individual
+        :param reason: The reason of the failure (for the logs).
+        :type reason: str
+        """
+        if self.__penalty is None:
+            raise PYGA_FitnessComputation("ERROR: evaluation of individual #" + str(indivID) + " failed (" +
+                                          reason + ") and no penalty is defined (eval_penalty parameter)")
+        self.printLog("PYGA_Evaluator / applyPenalty - individual #" + str(indivID) + ": " + reason + '\n',
+                      debug=True)
+        individual.applyPenalty(self.__penalty)
+        self.__penalisedIDs.add(indivID)
+
+    def setWakeUpTime(self, wakeUpTime):
+        """
+        Set the time at which a running evaluation yields [None, None] if it is still
+        waiting for results (then at each wait, until the wake up time is changed).
+
+        :param wakeUpTime: The wake up time (as time.time, None for never).
+        :type wakeUpTime: float
+        """
+        self.__wakeUpTime = wakeUpTime
+
+    def isWakeUpTime(self):
+        """Check if the wake up time is reached (see setWakeUpTime)."""
+        return self.__wakeUpTime is not None and self.__wakeUpTime <= time()
+
+    def getWaitTime(self, deadlines):
+        """
+        Get the maximum time to wait for the results of the workers.
+
+        :param deadlines: The deadlines of the running tasks (None for a task without deadline).
+        :type deadlines: list
+        :return: The time to wait (seconds, None to wait until a result is received).
+        :rtype: float
+        """
+        deadlines = [deadline for deadline in deadlines if deadline is not None]
+        if self.__wakeUpTime is not None:
+            deadlines.append(self.__wakeUpTime)
+        if len(deadlines) == 0:
+            return None
+        return max(0.0, min(deadlines) - time())
+
+    def getEvaluationContext(self, population):
+        """
+        Get the evaluation context at the beginning of an evaluation: the one given
+        in quorum mode (see getNewContext), the one of the population otherwise
+        (see PYGA_Individual.getEvaluationContext).
+
+        :param population: The population given to the evaluation.
+        :type population: Derived from PYGA_Population
+        :return: The version of the context (None if not given) and the context, as [version, context].
+        :rtype: list
+        """
+        contextUpdate = self.__contextUpdate
+        if contextUpdate is not None:
+            return contextUpdate
+        return [None, self.__individualClass.getEvaluationContext(population)]
+
+    def getNewContext(self, contextVersion):
+        """
+        Get the evaluation context to give to the individuals launched from now on, if it
+        changed since the given version: in quorum mode, a single evaluation computes the
+        individuals of several generations, each generation giving the context of its
+        population (see computeObjectivesQuorum).
+
+        :param contextVersion: The version of the context of the evaluation (see getEvaluationContext).
+        :type contextVersion: int
+        :return: The new context, as [version, context] (None if it did not change).
+        :rtype: list
+        """
+        contextUpdate = self.__contextUpdate
+        if contextUpdate is None or contextUpdate[0] == contextVersion:
+            return None
+        return contextUpdate
+
+    def measureEvaluation(self, duration, individual=None):
+        """
+        Store the duration of an evaluation (used to compute the chunk size, and
+        to learn the cost of the evaluations, see estimateDuration).
+
+        :param duration: The duration of the evaluation (seconds).
+        :type duration: float
+        :param individual: The evaluated individual (None if unknown).
+        :type individual: Derived from PYGA_Individual
+        """
+        self.__nbEvalMeasured += 1
+        self.__evalTimeSum += duration
+        if individual is None or not self.__individualClass.hasCostEstimate():
+            return
+        cost = individual.estimateCost()
+        if cost is not None:
+            self.__estimatedCostSum += cost
+            self.__estimatedCostTimeSum += duration
+            return
+        feature = individual.getCostFeature()
+        if feature is not None:
+            featureMeasures = self.__costFeatures.setdefault(feature, [0, 0.0])
+            featureMeasures[0] += 1
+            featureMeasures[1] += duration
+
+    def getMeanEvaluationTime(self):
+        """Get the mean duration of an evaluation (None if no evaluation was measured)."""
+        if self.__nbEvalMeasured == 0:
+            return None
+        return self.__evalTimeSum / self.__nbEvalMeasured
+
+    def measureOverhead(self, overhead):
+        """
+        Store the communication overhead of a chunk: the time between the sending
+        of the chunk and the reception of its results, minus the evaluation durations
+        (used to compute the chunk duration, see getChunkDuration).
+
+        :param overhead: The overhead of the chunk (seconds).
+        :type overhead: float
+        """
+        self.__nbOverheadMeasured += 1
+        self.__overheadSum += max(0.0, overhead)
+
+    def getMeanOverhead(self):
+        """Get the mean communication overhead of a chunk (None if no chunk was measured)."""
+        if self.__nbOverheadMeasured == 0:
+            return None
+        return self.__overheadSum / self.__nbOverheadMeasured
+
+    def getChunkDuration(self):
+        """
+        Get the expected duration of a chunk in automatic mode: AUTO_CHUNK_DURATION,
+        or longer when the communication overhead of a chunk is high (see measureOverhead).
+
+        :return: The expected duration of a chunk (seconds).
+        :rtype: float
+        """
+        meanOverhead = self.getMeanOverhead()
+        if meanOverhead is None:
+            return self.AUTO_CHUNK_DURATION
+        return max(self.AUTO_CHUNK_DURATION, self.AUTO_CHUNK_OVERHEAD_RATIO * meanOverhead)
+
+    def estimateDuration(self, individual):
+        """
+        Estimate the duration of the evaluation of an individual, from its estimated
+        cost (see PYGA_Individual.estimateCost) or from the mean duration of the
+        evaluations having the same cost feature (see PYGA_Individual.getCostFeature).
+
+        :param individual: The individual.
+        :type individual: Derived from PYGA_Individual
+        :return: The estimated duration (seconds, None if unknown).
+        :rtype: float
+        """
+        cost = individual.estimateCost()
+        if cost is not None:
+            if self.__estimatedCostSum <= 0.0:
+                return None
+            return cost * self.__estimatedCostTimeSum / self.__estimatedCostSum
+        feature = individual.getCostFeature()
+        if feature is None or feature not in self.__costFeatures:
+            return None
+        nbMeasures, timeSum = self.__costFeatures[feature]
+        return timeSum / nbMeasures
+
+    def sortByCost(self, individuals):
+        """
+        Sort the individuals to evaluate, the most expensive first (when the individual
+        class estimates the cost of its evaluations), so that the longest evaluations
+        do not start at the end.
+
+        :param individuals: The individuals to evaluate, as [indivID, individual].
+        :type individuals: list
+        :return: The sorted individuals (the order is kept without estimation).
+        :rtype: list
+        """
+        individuals = list(individuals)
+        if len(individuals) < 2 or not self.__individualClass.hasCostEstimate():
+            return individuals
+        costs = []
+        for _, individual in individuals:
+            cost = self.estimateDuration(individual)
+            if cost is None:
+                # Not learned yet: the estimated costs are compared as they are
+                cost = individual.estimateCost()
+            costs.append(cost)
+        knownCosts = [cost for cost in costs if cost is not None]
+        if len(knownCosts) == 0:
+            return individuals
+        # (unknown costs are considered as average)
+        meanCost = sum(knownCosts) / len(knownCosts)
+        costs = [meanCost if cost is None else cost for cost in costs]
+        order = sorted(range(len(individuals)), key=lambda iIndiv: -costs[iIndiv])
+        return [individuals[iIndiv] for iIndiv in order]
+
+    def popChunk(self, toLaunch, chunkSize, nbWorkers):
+        """
+        Take the individuals of the next chunk from the individuals to launch.
+        In automatic mode, when the durations of the evaluations can be estimated
+        (see estimateDuration), the chunk lasts about getChunkDuration() (or less
+        at the end of the evaluation, so that each worker gets at least two chunks),
+        otherwise see getChunkSize.
+
+        :param toLaunch: The individuals waiting for a worker, as [indivID, individual].
+        :type toLaunch: deque
+        :param chunkSize: The chunk size parameter (0 for automatic).
+        :type chunkSize: int
+        :param nbWorkers: The number of workers.
+        :type nbWorkers: int
+        :return: The individuals of the chunk, as [indivID, individual].
+        :rtype: list
+        """
+        meanEvalTime = self.getMeanEvaluationTime()
+        if (chunkSize != 0 or meanEvalTime is None or self.__individualClass.hasFitnessBatch() or
+                not self.__individualClass.hasCostEstimate()):
+            nbToTake = self.getChunkSize(chunkSize, len(toLaunch), nbWorkers)
+            return [toLaunch.popleft() for _ in range(min(nbToTake, len(toLaunch)))]
+        maxDuration = min(self.getChunkDuration(), meanEvalTime * len(toLaunch) / (2 * nbWorkers))
+        chunk = []
+        chunkDuration = 0.0
+        while len(toLaunch) > 0:
+            duration = self.estimateDuration(toLaunch[0][1])
+            if duration is None:
+                duration = meanEvalTime
+            if len(chunk) > 0 and chunkDuration + duration > maxDuration:
+                break
+            chunk.append(toLaunch.popleft())
+            chunkDuration += duration
+        return chunk
+
+    def getChunkSize(self, chunkSize, nbToLaunch, nbWorkers):
+        """
+        Get the number of individuals to send in the next chunk.
+
+        :param chunkSize: The chunk size parameter (0 for automatic).
+        :type chunkSize: int
+        :param nbToLaunch: The number of individuals still waiting for a worker.
+        :type nbToLaunch: int
+        :param nbWorkers: The number of workers.
+        :type nbWorkers: int
+        :return: The chunk size
+        :rtype: int
+        """
+        if chunkSize != 0:
+            return chunkSize
+        if self.__individualClass.hasFitnessBatch():
+            # Batch fitness: share the remaining individuals between the workers
+            return max(1, -(-nbToLaunch // nbWorkers))
+        # Automatic mode: one individual per chunk until the evaluation time is known
+        meanEvalTime = self.getMeanEvaluationTime()
+        if meanEvalTime is None:
+            return 1
+        if meanEvalTime > 0.0:
+            chunkSize = int(self.getChunkDuration() / meanEvalTime)
+        else:
+            chunkSize = nbToLaunch
+        # Keep at least two chunks per worker so that the end of the evaluation is balanced
+        chunkSize = min(chunkSize, nbToLaunch // (2 * nbWorkers))
+        return max(1, chunkSize)
+
+    def start(self):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Start the evaluation engine (called once at the beginning of the run).
+        The main process being the evaluation worker, initialise it
+        (see PYGA_Individual.initWorker).
+        """
+        self.__individualClass.SET_WORKER_STATE(self.__individualClass.initWorker())
+
+    def stop(self):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Stop the evaluation engine (called once at the end of the run).
+        """
+        self.__individualClass.SET_WORKER_STATE(None)
+
+    def computeObjectives(self, population, individuals):
+        """
+        Compute the objectives of the given individuals, using the evaluation cache
+        and evaluating once the individuals having the same fingerprint.
+        This is a generator: each individual is yielded as soon as it is computed
+        (the cached ones first).
+
+        :param population: The entire population.
+        :type population: Derived from PYGA_Population
+        :param individuals: The individuals to compute, as [indivID, individual]
+                            (individuals may be added to a deque while computing, see launchQueue).
+        :type individuals: list or deque
+        :return: Yields [indivID, individual] once the objectives are set in the given individual.
+        :rtype: generator
+        """
+        self.__penalisedIDs = set()
+        self.__nbFailuresByIndiv = {}
+        self.__failureStats[0] = self.__newFailureStats()
+        if not isinstance(individuals, deque):
+            individuals = self.sortByCost(individuals)
+        if self.__evaluationCache is None and not self.__mergeDuplicates:
+            for indivID, individual in self.evaluate(population, individuals):
+                yield indivID, individual
+            self.__printFailures()
+            return
+        toLaunch = launchQueue(individuals)
+        toEvaluate = deque()
+        fingerprints = {}
+        # Individual being evaluated for each fingerprint, and its duplicates by indivID
+        representatives = {}
+        duplicates = {}
+        # 1- Set the cached results and merge the identical genomes
+        for indivID, individual in self.__dispatch(toLaunch, toEvaluate, fingerprints, representatives, duplicates):
+            yield indivID, individual
+        # 2- Evaluate the others, store their results and give them to the duplicates
+        for indivID, individual in self.evaluate(population, toEvaluate):
+            # (indivID is None when the wake up time is reached)
+            result = None
+            if indivID in fingerprints:
+                fingerprint = fingerprints.pop(indivID)
+                result = individual.getEvaluationResult()
+                # (a penalty is not the result of the genome: it is not cached)
+                if self.__evaluationCache is not None and indivID not in self.__penalisedIDs:
+                    self.__evaluationCache.store(fingerprint, result)
+                if representatives.get(fingerprint) == indivID:
+                    del representatives[fingerprint]
+            yield indivID, individual
+            for duplicateID, duplicate in duplicates.pop(indivID, []):
+                duplicate.setEvaluationResult(result)
+                yield duplicateID, duplicate
+            # (individuals may have been added to the queue by the caller)
+            for indivID, individual in self.__dispatch(toLaunch, toEvaluate, fingerprints,
+                                                       representatives, duplicates):
+                yield indivID, individual
+        if self.__evaluationCache is not None:
+            self.__evaluationCache.flush()
+        self.__printFailures()
+
+    def generateIndividuals(self, population, nbIndividuals, evaluate=False):
+        """
+        Generate new individuals with the evaluation engine (see generate), storing
+        the results of the evaluated ones in the evaluation cache.
+        This is a generator: each individual is yielded as soon as it is generated.
+
+        :param population: The population of the new individuals (its evaluation context is used).
+        :type population: Derived from PYGA_Population
+        :param nbIndividuals: The number of individuals to generate.
+        :type nbIndividuals: int
+        :param evaluate: True to compute the objectives of the individuals as soon as they
+                         are generated (ignored if the fitness needs the population, see
+                         PYGA_Individual.NEED_POPULATION).
+        :type evaluate: bool
+        :return: Yields the generated individuals.
+        :rtype: generator
+        """
+        evaluate = evaluate and not self.__individualClass.NEED_POPULATION
+        self.__failureStats[0] = self.__newFailureStats()
+        context = None
+        if evaluate:
+            context = self.__individualClass.getEvaluationContext(population)
+        for individual in self.generate(context, nbIndividuals, evaluate):
+            if self.__evaluationCache is not None and not individual.needCompute():
+                fingerprint = individual.getFingerprint()
+                if fingerprint is not None:
+                    self.__evaluationCache.store(fingerprint, individual.getEvaluationResult())
+            yield individual
+        if self.__evaluationCache is not None:
+            self.__evaluationCache.flush()
+        self.__printFailures()
+
+    def splitGeneration(self, nbIndividuals, nbWorkers):
+        """
+        Split the generation of new individuals in tasks for the workers (four tasks
+        per worker, so that the end of the generation is balanced). Each task has its
+        own seed drawn from the random module of the main process: the workers do not
+        generate the same individuals, and a seeded run generates the same individuals
+        (the individuals of the tasks being yielded in the order of the tasks).
+
+        :param nbIndividuals: The number of individuals to generate.
+        :type nbIndividuals: int
+        :param nbWorkers: The number of workers.
+        :type nbWorkers: int
+        :return: The tasks, as [task index, number of individuals, seed].
+        :rtype: deque
+        """
+        taskSize = max(1, -(-nbIndividuals // (4 * max(1, nbWorkers))))
+        tasks = deque()
+        while nbIndividuals > 0:
+            tasks.append([len(tasks), min(taskSize, nbIndividuals), random.getrandbits(32)])
+            nbIndividuals -= taskSize
+        return tasks
+
+    def computeObjectivesQuorum(self, population, individuals, quorum, deadline):
+        """
+        Compute the objectives of the given individuals until a quorum of them is
+        computed, or until the deadline (once at least one of them is computed).
+        The other individuals are still computed in background: they are yielded
+        by the next calls, once computed (see computeObjectives), after the individuals
+        postponed by the previous call (see postponeIndividuals).
+        A single evaluation, run by a feeder thread, computes the individuals of all
+        calls until abandonEvaluations is called: the individuals keep being launched
+        while the caller breeds the next generation. The individuals launched after a
+        call get the evaluation context of its population (see getNewContext).
+
+        :param population: The entire population.
+        :type population: Derived from PYGA_Population
+        :param individuals: The individuals to compute, as [indivID, individual].
+        :type individuals: list
+        :param quorum: The percentage of the individuals to compute before returning.
+        :type quorum: int
+        :param deadline: The maximum time to wait for the quorum (seconds, 0 for no limit).
+        :type deadline: float
+        :return: Yields [indivID, individual] once the objectives are set in the given individual,
+                 and [None, individual] for the individuals of the previous calls.
+        :rtype: generator
+        """
+        while len(self.__postponedIndividuals) > 0:
+            yield None, self.__postponedIndividuals.popleft()
+        # The population is modified by the caller while the feeder thread evaluates: its context
+        # is taken from a copy
+        individualIDs = {}
+        with self.__quorumLock:
+            self.__quorumPopulation = population.duplicate()
+            self.__contextUpdate = [self.__nbContextUpdates,
+                                    self.__individualClass.getEvaluationContext(self.__quorumPopulation)]
+            self.__nbContextUpdates += 1
+            for indivID, individual in self.sortByCost(individuals):
+                individualIDs[self.__nextQuorumID] = indivID
+                self.__quorumQueue.append([self.__nextQuorumID, individual])
+                self.__nextQuorumID += 1
+            self.__nbQuorumRunning += len(individuals)
+            if not self.__quorumRunning:
+                if self.__quorumFeeder is not None:
+                    # (ended feeder thread, putting its last result)
+                    self.__quorumFeeder.join()
+                self.__quorumRunning = True
+                self.__quorumAbandoned = False
+                self.__quorumFeeder = Thread(target=self.__feedQuorum)
+                self.__quorumFeeder.daemon = True
+                self.__quorumFeeder.start()
+        nbToWait = int(ceil(quorum * len(individuals) / 100.0))
+        endTime = None
+        if deadline > 0:
+            endTime = time() + deadline
+        nbComputed = 0
+        deadlineReached = False
+        while nbComputed < nbToWait and not (deadlineReached and nbComputed > 0):
+            waitTime = None
+            if endTime is not None and not deadlineReached:
+                waitTime = max(0.0, endTime - time())
+            try:
+                quorumID, individual = self.__quorumResults.get(timeout=waitTime)
+            except Empty:
+                deadlineReached = True
+                continue
+            if quorumID is None:
+                # End of a feeder thread (the one of a previous call if a new one is running)
+                if individual is not None:
+                    raise individual
+                with self.__quorumLock:
+                    if not self.__quorumRunning:
+                        break
+                continue
+            self.__nbQuorumRunning -= 1
+            if quorumID in individualIDs:
+                nbComputed += 1
+                yield individualIDs.pop(quorumID), individual
+            else:
+                yield None, individual
+
+    def postponeIndividuals(self, individuals):
+        """
+        /!\ MAY ONLY BE CALLED BY PYGA_Population /!\
+
+        Keep computed individuals of the quorum evaluation having no place in their population:
+        they are yielded first by the next call of computeObjectivesQuorum.
+
+        :param individuals: The individuals (yielded as [None, individual] by computeObjectivesQuorum).
+        :type individuals: list
+        """
+        self.__postponedIndividuals.extend(individuals)
+
+    def abandonEvaluations(self):
+        """
+        Abandon the individuals still computed in background in quorum mode, and
+        the postponed ones (see computeObjectivesQuorum). The feeder thread stops
+        at its next wake up time (see QUORUM_POLL_PERIOD), or once the running
+        evaluation ends for the serial evaluator.
+
+        :return: The number of abandoned individuals.
+        :rtype: int
+        """
+        nbAbandoned = self.__nbQuorumRunning + len(self.__postponedIndividuals)
+        if self.__quorumFeeder is not None:
+            self.__quorumAbandoned = True
+            self.__quorumFeeder.join()
+            self.__quorumFeeder = None
+        self.__quorumRunning = False
+        self.__quorumPopulation = None
+        self.__quorumResults = Queue()
+        self.__quorumQueue = deque()
+        self.__nbQuorumRunning = 0
+        self.__postponedIndividuals = deque()
+        self.__contextUpdate = None
+        return nbAbandoned
+
+    def generate(self, context, nbIndividuals, evaluate):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Generate new individuals (see generateChunk), in the current process by default.
+        This is a generator: each individual is yielded as soon as it is generated.
+
+        :param context: The evaluation context (see PYGA_Individual.getEvaluationContext).
+        :type context: Depending on the individual
+        :param nbIndividuals: The number of individuals to generate.
+        :type nbIndividuals: int
+        :param evaluate: True to compute the objectives of the generated individuals.
+        :type evaluate: bool
+        :return: Yields the generated individuals.
+        :rtype: generator
+        """
+        for _ in range(nbIndividuals):
+            individuals, error = generateChunk(self.__individualClass, context, 1, evaluate)
+            if error is not None:
+                self.failGeneration(error)
+            for individual in individuals:
+                yield individual
+
+    def evaluate(self, population, individuals):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Compute the objectives of the given individuals.
+        This is a generator: each individual is yielded as soon as it is evaluated.
+
+        :param population: The entire population (its evaluation context is given to
+                           the fitness, see PYGA_Individual.getEvaluationContext).
+        :type population: Derived from PYGA_Population
+        :param individuals: The individuals to evaluate, as [indivID, individual]
+                            (indivID being a unique identifier, the index of the individual
+                            in the population by default). Individuals may be added to a
+                            deque while evaluating (see launchQueue).
+        :type individuals: list or deque
+        :return: Yields [indivID, individual] once the objectives are set in the given
+                 individual (the individuals are never replaced by copies).
+        :rtype: generator
+        """
+        contextVersion, context = self.getEvaluationContext(population)
+        toLaunch = launchQueue(individuals)
+        toLaunchAlone = deque()
+        while len(toLaunch) > 0 or len(toLaunchAlone) > 0:
+            newContext = self.getNewContext(contextVersion)
+            if newContext is not None:
+                contextVersion, context = newContext
+            # All waiting individuals in one task with a batch fitness, one task per individual otherwise
+            if len(toLaunchAlone) > 0:
+                task = [toLaunchAlone.popleft()]
+            elif self.__individualClass.hasFitnessBatch():
+                task = list(toLaunch)
+                toLaunch.clear()
+            else:
+                task = [toLaunch.popleft()]
+            try:
+                if self.__individualClass.hasFitnessBatch():
+                    self.__individualClass.computeObjectivesBatch([individual for _, individual in task], context)
+                else:
+                    task[0][1].computeObjectives(context)
+            except Exception:
+                task = self.failTask(task, toLaunchAlone, ERROR_FAILURE, format_exc())
+            for indivID, individual in task:
+                yield indivID, individual
+            if self.isWakeUpTime():
+                yield None, None
+
+    # ==================
+    # ^ Public methods ^
+    # ==================
+
+    # ===================
+    # v Private methods v
+    # ===================
+
+    @staticmethod
+    def __newFailureStats():
+        """Get empty failure statistics (see failTask)."""
+        failureStats = dict((failureType, 0) for failureType in FAILURE_TYPES)
+        failureStats["retry"] = 0
+        failureStats["penalty"] = 0
+        return failureStats
+
+    def __feedQuorum(self):
+        """
+        Evaluate the individuals of the quorum mode (run in the feeder thread, see
+        computeObjectivesQuorum) until the queue is empty or the evaluation is abandoned.
+        The computed individuals are put in the results queue, followed by [None, error]
+        (error being None if the evaluation succeeded).
+        """
+        error = None
+        try:
+            while not self.__quorumAbandoned:
+                self.setWakeUpTime(time() + self.QUORUM_POLL_PERIOD)
+                evaluations = self.computeObjectives(self.__quorumPopulation, self.__quorumQueue)
+                try:
+                    for quorumID, individual in evaluations:
+                        if self.__quorumAbandoned:
+                            break
+                        if quorumID is None:
+                            # Wake up time reached
+                            self.setWakeUpTime(time() + self.QUORUM_POLL_PERIOD)
+                            continue
+                        self.__quorumResults.put([quorumID, individual])
+                finally:
+                    evaluations.close()
+                with self.__quorumLock:
+                    # (individuals may have been queued after the end of the evaluation)
+                    if len(self.__quorumQueue) == 0 or self.__quorumAbandoned:
+                        self.__quorumRunning = False
+                        break
+        except BaseException as exception:
+            error = exception
+            with self.__quorumLock:
+                self.__quorumRunning = False
+        finally:
+            self.setWakeUpTime(None)
+            self.__quorumResults.put([None, error])
+
+    def __dispatch(self, toLaunch, toEvaluate, fingerprints, representatives, duplicates):
+        """
+        Move the individuals to launch to the individuals to evaluate, except the
+        cached ones (yielded) and the ones whose genome is being evaluated (merged).
+        See computeObjectives.
+
+        :param toLaunch: The individuals to launch, as [indivID, individual] (emptied).
+        :type toLaunch: deque
+        :param toEvaluate: The individuals to evaluate, as [indivID, individual].
+        :type toEvaluate: deque
+        :param fingerprints: The fingerprints of the individuals to evaluate (by indivID).
+        :type fingerprints: dict
+        :param representatives: The evaluated individual of each fingerprint (indivID).
+        :type representatives: dict
+        :param duplicates: The individuals merged with each evaluated individual (by indivID).
+        :type duplicates: dict
+        :return: Yields [indivID, individual] of the cached individuals.
+        :rtype: generator
+        """
+        nbMerged = 0
+        while len(toLaunch) > 0:
+            indivID, individual = toLaunch.popleft()
+            fingerprint = individual.getFingerprint()
+            if fingerprint is not None:
+                if self.__evaluationCache is not None:
+                    found, result = self.__evaluationCache.lookup(fingerprint)
+                    if found:
+                        individual.setEvaluationResult(result)
+                        yield indivID, individual
+                        continue
+                if self.__mergeDuplicates:
+                    if fingerprint in representatives:
+                        duplicates[representatives[fingerprint]].append([indivID, individual])
+                        nbMerged += 1
+                        continue
+                    representatives[fingerprint] = indivID
+                    duplicates[indivID] = []
+                fingerprints[indivID] = fingerprint
+            toEvaluate.append([indivID, individual])
+        if nbMerged > 0:
+            self.__nbMergedEvaluations += nbMerged
+            self.printLog("PYGA_Evaluator / computeObjectives - " + str(nbMerged) +
+                          " evaluations saved (identical genomes)\n", debug=True)
+
+    def __printFailures(self):
+        """Print the failure statistics of the last evaluation (if any evaluation failed)."""
+        failureInformation = self.getFailureInformation()
+        if failureInformation != "":
+            # (after the progress line of the evaluation, which stays visible)
+            self.printLog('\n' + failureInformation)
+
+    # ===================
+    # ^ Private methods ^
+    # ===================
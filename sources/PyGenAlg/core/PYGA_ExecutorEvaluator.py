@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""
+Python Genetic Algorithm module.
+
+This file contains the executor evaluation engine of the GA: PYGA_ExecutorEvaluator.
+It sends the individuals to evaluate to any concurrent.futures.Executor compatible
+object (ProcessPoolExecutor, ThreadPoolExecutor, cluster client...).
+
+License full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+
+
+
+Modification History:
+**** 18/10/2026 ****
+Creation
+- Evaluation timeout: late tasks abandoned
+- Failed evaluations retried
+- Individuals added while evaluating (see launchQueue)
+- Wake up time, running evaluations abandoned when the evaluation is closed
+- Longest evaluations first: durations measured by individual, chunks balanced by cost
+- Number of workers given by the CPU affinity
+- Generation of new individuals in the executor (see PYGA_Evaluator.generateIndividuals)
+
+TODO List:
+-
+"""
+# - Build-in imports -
+from concurrent.futures import wait, BrokenExecutor, ThreadPoolExecutor, FIRST_COMPLETED
+from collections import deque
+from threading import Lock
+from time import time
+
+# - Local imports -
+from PyGenAlg.core.PYGA_Evaluator import PYGA_Evaluator, getNbAvailableCpus, evaluateChunk, generateChunk, launchQueue
+from PyGenAlg.core.PYGA_Evaluator import CRASH_FAILURE, ERROR_FAILURE, TIMEOUT_FAILURE
+from PyGenAlg.core.PYGA_Exceptions import PYGA_PopulationError
+
+# Meta information
+__author__ = "Raphaël Deau"
+__copyright__ = "Copyright 2016, Raphaël Deau"
+__license__ = "Creative Commons Attribution Non-commercial 4.0"
+__version__ = "1.0.0"
+__since__ = "18/10/2026"
+__date__ = "18/10/2026"
+
+# Individual classes initialised in the current process (see PYGA_Individual.initWorker)
+_initialisedClasses = set()
+_initLock = Lock()
+
+
+def _executorTask(individualClass, context, chunk):
+    """
+    Task submitted to the executor: initialise the worker if it is the first
+    task of this process, then compute the chunk (see evaluateChunk).
+
+    :param individualClass: The individual class to evaluate.
+    :type individualClass: type derived from PYGA_Individual
+    :param context: The evaluation context (see PYGA_Individual.getEvaluationContext).
+    :type context: Depending on the individual
+    :param chunk: The individuals to evaluate, as [indivID, individual].
+    :type chunk: list
+    :return: The results, as [indivID, evaluation result, evaluation duration].
+    :rtype: list
+    """
+    _initWorker(individualClass)
+    return evaluateChunk(individualClass, context, chunk)
+
+
+def _executorGenerateTask(individualClass, context, nbIndividuals, evaluate, seed):
+    """
+    Generation task submitted to the executor: initialise the worker if it is the
+    first task of this process, then generate the individuals (see generateChunk).
+
+    :param individualClass: The individual class to generate.
+    :type individualClass: type derived from PYGA_Individual
+    :param context: The evaluation context (see PYGA_Individual.getEvaluationContext).
+    :type context: Depending on the individual
+    :param nbIndividuals: The number of individuals to generate.
+    :type nbIndividuals: int
+    :param evaluate: True to compute the objectives of the generated individuals.
+    :type evaluate: bool
+    :param seed: The seed of the random module of the worker (None to keep its state,
+                 see PYGA_ExecutorEvaluator.generate).
+    :type seed: int
+    :return: The generated individuals and the evaluation error, as [individuals, error].
+    :rtype: list
+    """
+    _initWorker(individualClass)
+    return generateChunk(individualClass, context, nbIndividuals, evaluate, seed)
+
+
+def _initWorker(individualClass):
+    """
+    Initialise the worker state of the current process if it is the first task
+    of this process (see PYGA_Individual.initWorker).
+
+    :param individualClass: The individual class to evaluate.
+    :type individualClass: type derived from PYGA_Individual
+    """
+    with _initLock:
+        if individualClass not in _initialisedClasses:
+            individualClass.SET_WORKER_STATE(individualClass.initWorker())
+            _initialisedClasses.add(individualClass)
+
+
+class PYGA_ExecutorEvaluator(PYGA_Evaluator):
+    """
+    Evaluation engine using an executor given by the user.
+
+    The executor only needs a submit(function, *args) method returning a future
+    compatible with concurrent.futures.wait. It belongs to the user: it is not
+    shut down at the end of the run.
+    The individuals are sent by chunks with the evaluation context (an executor
+    cannot keep it between two tasks). The results are set in the individuals
+    of the main process (see PYGA_Individual.setEvaluationResult).
+    With an evaluation timeout, the late tasks are cancelled if possible, and
+    abandoned (an executor cannot kill its workers). The failed tasks are given
+    to PYGA_Evaluator.failTask (launched again, or penalised). A broken executor
+    (dead worker of a ProcessPoolExecutor) cannot be repaired by the evaluator.
+
+    Attributes:
+        :ivar __executor: The executor.
+        :type __executor: concurrent.futures.Executor compatible
+        :ivar __nbWorkers: The number of workers of the executor.
+        :type __nbWorkers: int
+        :ivar __chunkSize: The number of individuals sent in one task (0 for automatic).
+        :type __chunkSize: int
+        :ivar __abandoned: The late tasks still running in the executor (their workers are not free).
+        :type __abandoned: list
+        :ivar __seedWorkers: False for a thread executor: its tasks share the random module of the
+                             process, which is not seeded by the generation tasks.
+        :type __seedWorkers: bool
+    """
+    # ==================
+    # v Public methods v
+    # ==================
+
+    def __init__(self, individualClass, executor, nbWorkers=0, chunkSize=0, printMethod=None):
+        """
+        Constructor of the executor evaluator.
+
+        :param individualClass: The individual class to evaluate.
+        :type individualClass: type derived from PYGA_Individual
+        :param executor: The executor.
+        :type executor: concurrent.futures.Executor compatible
+        :param nbWorkers: The number of workers of the executor (0 for the number of available CPUs).
+        :type nbWorkers: int
+        :param chunkSize: The number of individuals sent in one task (0 for automatic).
+        :type chunkSize: int
+        :param printMethod: The method to call to print logs.
+        :type printMethod: Python method
+        """
+        PYGA_Evaluator.__init__(self, individualClass, printMethod)
+        self.__executor = executor
+        if nbWorkers == 0:
+            nbWorkers = getNbAvailableCpus()
+        self.__nbWorkers = nbWorkers
+        self.__chunkSize = chunkSize
+        self.__abandoned = []
+        self.__seedWorkers = not isinstance(executor, ThreadPoolExecutor)
+
+    def getNbWorkers(self):
+        """Get the number of workers of the executor."""
+        return self.__nbWorkers
+
+    def start(self):
+        """Initialise the worker state of the main process (used by thread executors)."""
+        PYGA_Evaluator.start(self)
+        with _initLock:
+            _initialisedClasses.add(self.getIndividualClass())
+
+    def stop(self):
+        """Clear the worker state of the main process (the executor is not shut down)."""
+        with _initLock:
+            _initialisedClasses.discard(self.getIndividualClass())
+        PYGA_Evaluator.stop(self)
+
+    def generate(self, context, nbIndividuals, evaluate):
+        """
+        Generate new individuals with the executor (a failed task stops the run).
+        See PYGA_Evaluator.generate.
+        The random module of the workers is seeded by each task, except with a thread
+        executor: its threads share the random module of the process.
+        """
+        individualClass = self.getIndividualClass()
+        futures = deque(self.__executor.submit(_executorGenerateTask, individualClass, context, nbToGenerate,
+                                               evaluate, seed if self.__seedWorkers else None)
+                        for _, nbToGenerate, seed in self.splitGeneration(nbIndividuals, self.__nbWorkers))
+        try:
+            # The individuals are yielded in the order of the tasks (see splitGeneration)
+            while len(futures) > 0:
+                try:
+                    individuals, evaluationError = futures[0].result()
+                except Exception as error:
+                    raise PYGA_PopulationError("ERROR: generation of individuals failed (" + repr(error) + ')')
+                futures.popleft()
+                if evaluationError is not None:
+                    self.failGeneration(evaluationError)
+                for individual in individuals:
+                    yield individual
+        finally:
+            for future in futures:
+                if not future.cancel():
+                    self.__abandoned.append(future)
+
+    def evaluate(self, population, individuals):
+        """
+        Compute the objectives of the given individuals with the executor.
+        See PYGA_Evaluator.evaluate.
+        """
+        individualClass = self.getIndividualClass()
+        contextVersion, context = self.getEvaluationContext(population)
+        timeout = self.getEvaluationTimeout()
+        toLaunch = launchQueue(individuals)
+        # Individuals of failed chunks, to send one by one
+        toLaunchAlone = deque()
+        # With a timeout, one chunk per worker so that a chunk starts when it is submitted
+        maxRunning = 2 * self.__nbWorkers
+        if timeout > 0:
+            maxRunning = self.__nbWorkers
+        running = {}
+        try:
+            while len(toLaunch) > 0 or len(toLaunchAlone) > 0 or len(running) > 0:
+                # (the context given since the beginning of the evaluation, see PYGA_Evaluator.getNewContext)
+                newContext = self.getNewContext(contextVersion)
+                if newContext is not None:
+                    contextVersion, context = newContext
+                # 1- Keep chunks in the executor for each free worker (the chunk size may change)
+                self.__abandoned = [future for future in self.__abandoned if not future.done()]
+                while ((len(toLaunch) > 0 or len(toLaunchAlone) > 0) and
+                       len(running) < maxRunning - len(self.__abandoned)):
+                    if len(toLaunchAlone) > 0:
+                        chunk = [toLaunchAlone.popleft()]
+                    else:
+                        chunk = self.popChunk(toLaunch, self.__chunkSize, self.__nbWorkers)
+                    future = self.__executor.submit(_executorTask, individualClass, context, chunk)
+                    deadline = None
+                    if timeout > 0:
+                        deadline = time() + timeout * len(chunk)
+                    running[future] = [dict(chunk), deadline]
+                # 2- Wait until at least one chunk is done (or late), or a worker is free (or the wake up time)
+                waitTime = self.getWaitTime([deadline for _, deadline in running.values()])
+                done, _ = wait(list(running.keys()) + self.__abandoned, waitTime, return_when=FIRST_COMPLETED)
+                done = [future for future in done if future in running]
+                if len(done) == 0:
+                    # 3- Abandon the late chunks
+                    for future in [future for future, (_, deadline) in running.items()
+                                   if deadline is not None and deadline <= time()]:
+                        launched, _ = running.pop(future)
+                        if not future.cancel():
+                            self.__abandoned.append(future)
+                        for indivID, individual in self.failTask(list(launched.items()), toLaunchAlone, TIMEOUT_FAILURE,
+                                                                 "timeout after " + str(timeout) + " seconds"):
+                            yield indivID, individual
+                for future in done:
+                    launched, _ = running.pop(future)
+                    try:
+                        results = future.result()
+                    except Exception as error:
+                        failureType = ERROR_FAILURE
+                        if isinstance(error, BrokenExecutor):
+                            failureType = CRASH_FAILURE
+                        for indivID, individual in self.failTask(list(launched.items()), toLaunchAlone,
+                                                                 failureType, repr(error)):
+                            yield indivID, individual
+                        continue
+                    for indivID, result, duration in results:
+                        individual = launched[indivID]
+                        self.measureEvaluation(duration, individual)
+                        individual.setEvaluationResult(result)
+                        yield indivID, individual
+                if self.isWakeUpTime():
+                    yield None, None
+        finally:
+            # Evaluation closed by the caller (or failed): the running chunks are abandoned
+            for future in running:
+                if not future.cancel():
+                    self.__abandoned.append(future)
+
+    # ==================
+    # ^ Public methods ^
+    # ==================
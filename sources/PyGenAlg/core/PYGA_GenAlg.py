@@ -22,11 +22,26 @@ Global:
 Coding:
 - __print definition
 - __oneIteration definition
+**** 18/10/2026 ****
+- Evaluation engine created once per run
+- Evaluation engine (or executor) given to the constructor
+- Evaluation cache (statistics printed at the end of the run)
+- Identical genomes evaluated once (saved evaluations printed at the end of the run)
+- Evaluation timeout and penalty
+- Failed evaluations retried (failure statistics printed at the end of the run)
+- Non generational evolution run by the behavior (see PYGA_GenAlgBehavior.evolve)
+- Quorum evaluation of the offspring (evaluations still running at the end of the run printed)
+- Pipelined generations: offspring of the next generation bred during the evaluation
+- Evaluation engine information printed at the end of the run (see PYGA_Evaluator.getPrintInformation)
+- Migration of individuals at the end of the generations (island model, see PYGA_Islands)
+- Number of evaluations of the last run (getNbEvaluations)
+- Generation observer, called after the evaluation of each generation, may stop the evolution (see PYGA_Ensemble)
 
 TODO List:
 -
 """
 # - Build-in imports -
+from threading import Thread
 from time import time, asctime
 from sys import stdout, version_info
 
@@ -34,6 +49,8 @@ from sys import stdout, version_info
 from PyGenAlg.core.PYGA_Population import PYGA_Population
 from PyGenAlg.core.PYGA_Individual import PYGA_Individual
 from PyGenAlg.core.PYGA_GenAlgBehavior import PYGA_GenAlgBehavior
+from PyGenAlg.core.PYGA_Evaluator import PYGA_Evaluator
+from PyGenAlg.core.PYGA_ExecutorEvaluator import PYGA_ExecutorEvaluator
 from PyGenAlg.core.PYGA_Exceptions import PYGA_CreationError
 from PyGenAlg.standards.PYGA_StandardGenAlgBehavior import PYGA_StandardGenAlgBehavior
 
@@ -47,7 +64,7 @@ __copyright__ = "Copyright 2016, Raphaël Deau"
 __license__ = "Creative Commons Attribution Non-commercial 4.0"
 __version__ = "1.0.0"
 __since__ = "18/07/2011"
-__date__ = "26/09/2016"
+__date__ = "18/10/2026"
 
 
 class PYGA_GenAlg:
@@ -68,8 +85,19 @@ class PYGA_GenAlg:
         :type __individualClass: type derived from PYGA_Individual
         :ivar __population: The population
         :type __population: subclass of PYGA_Population
+        :ivar __evaluator: The evaluation engine given to the constructor (None to use the parameters)
+        :type __evaluator: Derived from PYGA_Evaluator
         :ivar __evolveStartTime: The start time of the evolution
         :type __evolveStartTime: float
+        :ivar __nextReproducedPopulation: The offspring of the next generation, bred during
+                                          the evaluation in pipelined mode (None if not bred).
+        :type __nextReproducedPopulation: subclass of PYGA_Population
+        :ivar __migration: The migration of the island of the GA (None if not run as an island).
+        :type __migration: PYGA_Migration
+        :ivar __nbEvaluations: The number of evaluations of the last run.
+        :type __nbEvaluations: int
+        :ivar __generationObserver: The method called after the evaluation of each generation (None if not set).
+        :type __generationObserver: Python method
     """
     # ==================
     # v Public methods v
@@ -82,7 +110,8 @@ class PYGA_GenAlg:
                  genAlgBehaviorClass=PYGA_StandardGenAlgBehavior,
                  populationClass=PYGA_Population,
                  debugMode=False,
-                 outputPrint=None):
+                 outputPrint=None,
+                 evaluator=None):
         """
         The constructor of PYGA_GenAlg.
 
@@ -96,6 +125,11 @@ class PYGA_GenAlg:
         :type debugMode: Bool
         :param outputPrint: A stream within the logs will be written
         :type outputPrint: Opened output stream
+        :param evaluator: The evaluation engine to use instead of the one defined
+                          by the parameters (max_process, evaluation_backend...):
+                          a PYGA_Evaluator (built for individualClass) or any
+                          concurrent.futures.Executor compatible object.
+        :type evaluator: Derived from PYGA_Evaluator, or Executor
         """
         
         self.__debugMode = debugMode
@@ -110,6 +144,12 @@ class PYGA_GenAlg:
             raise PYGA_CreationError("ERROR: behavior class must inherit from PYGA_GenAlgBehavior")
         if not issubclass(populationClass, PYGA_Population):
             raise PYGA_CreationError("ERROR: population class must inherit from PYGA_Population")
+        if evaluator is not None and not isinstance(evaluator, PYGA_Evaluator):
+            if not hasattr(evaluator, "submit"):
+                raise PYGA_CreationError("ERROR: evaluator must inherit from PYGA_Evaluator or be an Executor")
+            evaluator = PYGA_ExecutorEvaluator(individualClass, evaluator)
+        if evaluator is not None and evaluator.getIndividualClass() is not individualClass:
+            raise PYGA_CreationError("ERROR: evaluator must be created for the individual class of the GA")
 
         # 2- Store class information
         self.__genAlgBehavior = genAlgBehaviorClass(individualClass, populationClass, self.__print)
@@ -121,7 +161,16 @@ class PYGA_GenAlg:
         # 3- Create the population
         self.__population = populationClass(individualClass, self.__genAlgBehavior, self.__print)
 
+        # 4- Store the evaluation engine (created at each run if None)
+        self.__evaluator = evaluator
+        if self.__evaluator is not None:
+            self.__evaluator.setPrintMethod(self.__print)
+
         self.__evolveStartTime = None
+        self.__nextReproducedPopulation = None
+        self.__migration = None
+        self.__nbEvaluations = 0
+        self.__generationObserver = None
     # Public - End of Constructor
     # ---------------------------
 
@@ -140,49 +189,45 @@ class PYGA_GenAlg:
          6- Reproduction
          7- Set the new population according to siblings
          8- Evaluate the new population
-         9- Check for stop criteria
+         9- Check for stop criteria (and the generation observer, see setGenerationObserver)
+            -> Migrate individuals with the other islands (island model, see setMigration)
             -> Go to "3-" if not stopped
+        A non generational behavior runs the steps 3 to 9 itself
+        (see PYGA_GenAlgBehavior.evolve).
+
+        In pipelined mode (pipelined_generations parameter), the step 6 of the next
+        generation is done during the step 8, the population being evaluated in
+        background: the offspring are bred from the genomes of the population being
+        evaluated (or from the previous selected individuals if only the selected
+        individuals reproduce), before its selection.
+
+        The evaluation engine (see PYGA_Evaluator) is created (if not given to
+        the constructor) and started once before the initialisation, and
+        stopped at the end of the run. So is the evaluation cache (see
+        PYGA_EvaluationCache), if any.
         """
-        self.__writeHeaders()
-        # Get the start time
-        self.__evolveStartTime = time()
-        iGen = 0  # Current generation number
-        # 1- Generate the initial population
-        infoStr = "\rInitialising..."
-        self.__genAlgBehavior.initPopulation(self.__population, infoStr)
-        # 2- Try an evaluation: maybe initial population already have best solution...
-        #    Or not...
-        infoStr = "\rFirst evaluation..."
-        self.__print(infoStr)
-        percent, continueEvolution, nbEval = self.__evaluation(iGen, infoStr)
-        self.__print(infoStr + " Done" + ' '*50 + '\n')
-        # 3- Population is initialised, process to the evolution loop
-        while continueEvolution:
-            infoStr = "\rEvolving... " + unicode(percent) + "% (Generation #" + unicode(iGen) + ')'
-            self.__print(infoStr + ' ' * 10)
-            curNbEval, percent, continueEvolution = self.__oneIteration(iGen, infoStr)
-            nbEval += curNbEval
-            iGen += 1
-        self.__print("\rEvolving... 100% (Generation #" + unicode(iGen) + ')' + ' ' * 70 + '\n')
-        # 4- Compute the time of evolving
-        evolveEndTime = time()
-        evolveTime = evolveEndTime - self.__evolveStartTime
-        # 5- Get a human readable time
-        evolveHour = int(evolveTime / 3600)
-        evolveMin = int((evolveTime / 60) % 60)
-        evolveSec = int(evolveTime % 60)
-        strEvolveHour = unicode(evolveHour)
-        strEvolveMin = unicode(evolveMin)
-        if evolveMin < 10:
-            strEvolveMin = '0' + strEvolveMin
-        strEvolveSec = unicode(evolveSec)
-        if evolveSec < 10:
-            strEvolveSec = '0' + strEvolveSec
-        strEvolveTime = strEvolveHour + ':' + strEvolveMin + ':' + strEvolveSec
-        # 6- Display final statistics
-        self.__print("Total number of evaluation: " + unicode(nbEval) + '\n')
-        self.__print("Evolution time: " + strEvolveTime + " (" + unicode(evolveTime) + " seconds).\n")
-        self.__print("***********************************************************************\n")
+        evaluator = self.__evaluator
+        if evaluator is None:
+            evaluator = self.__genAlgBehavior.createEvaluator()
+        evaluationCache = self.__genAlgBehavior.createEvaluationCache()
+        if evaluationCache is not None:
+            evaluationCache.start()
+        evaluator.setEvaluationCache(evaluationCache)
+        evaluator.setMergeDuplicates(self.__genAlgBehavior.getParam(self.__genAlgBehavior.MERGE_DUPLICATED_EVAL_LABEL))
+        evaluator.setEvaluationTimeout(self.__genAlgBehavior.getParam(self.__genAlgBehavior.EVAL_TIMEOUT_LABEL),
+                                       self.__genAlgBehavior.getParam(self.__genAlgBehavior.EVAL_PENALTY_LABEL))
+        evaluator.setMaxRetry(self.__genAlgBehavior.getParam(self.__genAlgBehavior.EVAL_MAX_RETRY_LABEL))
+        self.__genAlgBehavior.setEvaluator(evaluator)
+        evaluator.start()
+        try:
+            self.__run()
+        finally:
+            evaluator.abandonEvaluations()
+            evaluator.stop()
+            evaluator.setEvaluationCache(None)
+            if evaluationCache is not None:
+                evaluationCache.stop()
+            self.__genAlgBehavior.setEvaluator(None)
     # Public - End of Main loop
     # -------------------------
 
@@ -194,6 +239,35 @@ class PYGA_GenAlg:
         """Returns the current population."""
         return self.__population
 
+    def getNbEvaluations(self):
+        """Returns the number of evaluations of the last run."""
+        return self.__nbEvaluations
+
+    def setMigration(self, migration):
+        """
+        /!\ MAY ONLY BE CALLED BY PYGA_Islands /!\
+
+        Set the migration of the island run by this GA: called at the end of each
+        generation but the last one (generational behaviors only).
+
+        :param migration: The migration of the island (None if not run as an island).
+        :type migration: PYGA_Migration
+        """
+        self.__migration = migration
+
+    def setGenerationObserver(self, generationObserver):
+        """
+        Set the method called after the evaluation of each generation (and of the
+        initial population), as generationObserver(population, iGeneration) with
+        iGeneration the number of the generation (0 for the initial population).
+        The evolution stops if it returns True. A non generational behavior (see
+        PYGA_GenAlgBehavior.isGenerational) only calls it for the initial population.
+
+        :param generationObserver: The observer (None to remove it).
+        :type generationObserver: Python method
+        """
+        self.__generationObserver = generationObserver
+
     def setParameters(self, **kwargs):
         """Set the given parameters values (see Behavior for parameters list)."""
         self.__genAlgBehavior.setParameters(**kwargs)
@@ -246,7 +320,71 @@ class PYGA_GenAlg:
         self.__outputPrint.write("\rInitialising...")
         self.__outputPrint.flush()
 
-    def __evaluation(self, iGeneration, infoStr):
+    def __run(self):
+        """Run the GA steps (see run), the evaluation engine being started."""
+        self.__writeHeaders()
+        # Get the start time
+        self.__evolveStartTime = time()
+        self.__nextReproducedPopulation = None
+        self.__nbEvaluations = 0
+        iGen = 0  # Current generation number
+        # 1- Generate the initial population
+        infoStr = "\rInitialising..."
+        self.__genAlgBehavior.initPopulation(self.__population, infoStr)
+        # 2- Try an evaluation: maybe initial population already have best solution...
+        #    Or not...
+        infoStr = "\rFirst evaluation..."
+        self.__print(infoStr)
+        percent, continueEvolution, nbEval = self.__evaluation(iGen, infoStr)
+        if self.__generationObserver is not None and self.__generationObserver(self.__population, iGen):
+            continueEvolution = False
+        self.__print(infoStr + " Done" + ' '*50 + '\n')
+        # 3- Population is initialised, process to the evolution loop
+        if self.__genAlgBehavior.isGenerational():
+            while continueEvolution:
+                infoStr = "\rEvolving... " + unicode(percent) + "% (Generation #" + unicode(iGen) + ')'
+                self.__print(infoStr + ' ' * 10)
+                curNbEval, percent, continueEvolution = self.__oneIteration(iGen, infoStr)
+                nbEval += curNbEval
+                iGen += 1
+            self.__print("\rEvolving... 100% (Generation #" + unicode(iGen) + ')' + ' ' * 70 + '\n')
+        else:
+            if continueEvolution:
+                nbEval += self.__genAlgBehavior.evolve(self.__population, self.__evolveStartTime, "\rEvolving...")
+            self.__print("\rEvolving... 100%" + ' ' * 70 + '\n')
+        # 4- Compute the time of evolving
+        evolveEndTime = time()
+        evaluator = self.__genAlgBehavior.getEvaluator()
+        nbAbandoned = evaluator.abandonEvaluations()
+        evolveTime = evolveEndTime - self.__evolveStartTime
+        # 5- Get a human readable time
+        evolveHour = int(evolveTime / 3600)
+        evolveMin = int((evolveTime / 60) % 60)
+        evolveSec = int(evolveTime % 60)
+        strEvolveHour = unicode(evolveHour)
+        strEvolveMin = unicode(evolveMin)
+        if evolveMin < 10:
+            strEvolveMin = '0' + strEvolveMin
+        strEvolveSec = unicode(evolveSec)
+        if evolveSec < 10:
+            strEvolveSec = '0' + strEvolveSec
+        strEvolveTime = strEvolveHour + ':' + strEvolveMin + ':' + strEvolveSec
+        # 6- Display final statistics
+        self.__nbEvaluations = nbEval
+        self.__print("Total number of evaluation: " + unicode(nbEval) + '\n')
+        if nbAbandoned > 0:
+            self.__print("Evaluations abandoned at the end of the run (quorum): " + unicode(nbAbandoned) + '\n')
+        if evaluator.getNbMergedEvaluations() > 0:
+            self.__print("Evaluations saved (identical genomes): " + unicode(evaluator.getNbMergedEvaluations()) + '\n')
+        evaluationCache = evaluator.getEvaluationCache()
+        if evaluationCache is not None:
+            self.__print(evaluationCache.getPrintInformation())
+        self.__print(evaluator.getFailureInformation(sinceStart=True))
+        self.__print(evaluator.getPrintInformation())
+        self.__print("Evolution time: " + strEvolveTime + " (" + unicode(evolveTime) + " seconds).\n")
+        self.__print("***********************************************************************\n")
+
+    def __evaluation(self, iGeneration, infoStr, selectedPopulation=None, previousPopulation=None):
         """
         Launch the evaluation of the current population.
 
@@ -254,6 +392,14 @@ class PYGA_GenAlg:
         :type iGeneration: int
         :param infoStr: A string within logs are propagated.
         :type infoStr: str
+        :param selectedPopulation: The selected individuals of the current population, to breed the
+                                   offspring of the next generation during the evaluation in pipelined
+                                   mode (None to evaluate only).
+        :type selectedPopulation: subclass of PYGA_Population
+        :param previousPopulation: The population of the previous generation, whose individuals replace
+                                 the offspring still evaluated in quorum mode (None for the initial
+                                 population: all its individuals are evaluated).
+        :type previousPopulation: subclass of PYGA_Population
         :return: The percent of GA progress (if known),\
                  the stop flag (True to continue),\
                  the number of evaluated individuals
@@ -261,7 +407,11 @@ class PYGA_GenAlg:
         """
         self.__print("PYGA_GenAlg / __evaluation - launch Population.computObjectives\n", debug=True)
         # 1- Compute all objectives
-        nbEval = self.__population.computeObjectives(infoStr)
+        if selectedPopulation is not None and \
+                self.__genAlgBehavior.getParam(self.__genAlgBehavior.PIPELINED_GENERATIONS_LABEL):
+            nbEval = self.__pipelinedEvaluation(selectedPopulation, previousPopulation, infoStr)
+        else:
+            nbEval = self.__population.computeObjectives(infoStr, previousPopulation)
 
         self.__print("PYGA_GenAlg / __evaluation - launch Behavior.stopCriteria\n", debug=True)
         # 2- Check stop criteria
@@ -277,6 +427,56 @@ class PYGA_GenAlg:
         self.__print(debugMsg, debug=True)
         return percent, not stopCriteria, nbEval
 
+    def __pipelinedEvaluation(self, selectedPopulation, previousPopulation, infoStr):
+        """
+        Evaluate the current population in background, and breed the offspring of
+        the next generation meanwhile (see run).
+
+        :param selectedPopulation: The selected individuals of the current population.
+        :type selectedPopulation: subclass of PYGA_Population
+        :param previousPopulation: The population of the previous generation (see __evaluation).
+        :type previousPopulation: subclass of PYGA_Population
+        :param infoStr: A string within logs are propagated.
+        :type infoStr: str
+        :return: The number of evaluated individuals
+        :rtype: int
+        """
+        # The parents are chosen in a copy: the population is read by the evaluation
+        parentPopulation = self.__population.duplicate()
+        evaluationResult = {}
+        evaluationThread = Thread(target=self.__backgroundEvaluation,
+                                  args=(self.__population, previousPopulation, infoStr, evaluationResult))
+        evaluationThread.start()
+        try:
+            self.__print("PYGA_GenAlg / run - Reproducing during the evaluation\n", debug=True)
+            self.__nextReproducedPopulation = self.__genAlgBehavior.reproduction(parentPopulation,
+                                                                                 selectedPopulation, infoStr)
+        finally:
+            evaluationThread.join()
+        if "error" in evaluationResult:
+            raise evaluationResult["error"]
+        return evaluationResult["nbEval"]
+
+    @staticmethod
+    def __backgroundEvaluation(population, previousPopulation, infoStr, evaluationResult):
+        """
+        Evaluate a population (run in the evaluation thread of the pipelined mode).
+
+        :param population: The population to evaluate.
+        :type population: subclass of PYGA_Population
+        :param previousPopulation: The population of the previous generation (see __evaluation).
+        :type previousPopulation: subclass of PYGA_Population
+        :param infoStr: A string within logs are propagated.
+        :type infoStr: str
+        :param evaluationResult: Where the number of evaluated individuals ("nbEval")
+                                 or the raised exception ("error") is stored.
+        :type evaluationResult: dict
+        """
+        try:
+            evaluationResult["nbEval"] = population.computeObjectives(infoStr, previousPopulation)
+        except BaseException as error:
+            evaluationResult["error"] = error
+
     def __oneIteration(self, iGen, infoStr):
         """
         One iteration of the GA.
@@ -299,17 +499,26 @@ class PYGA_GenAlg:
         # 3- Select the kept individuals in this generation
         self.__print("PYGA_GenAlg / run - Selecting\n", debug=True)
         selectedPopulation = self.__genAlgBehavior.selection(self.__population, infoStr)
-        # 4- Applie reproduction method
-        self.__print("PYGA_GenAlg / run - Reproducing\n", debug=True)
-        reproducedPopulation = self.__genAlgBehavior.reproduction(self.__population, selectedPopulation, infoStr)
+        # 4- Applie reproduction method (already done in pipelined mode)
+        reproducedPopulation = self.__nextReproducedPopulation
+        self.__nextReproducedPopulation = None
+        if reproducedPopulation is None:
+            self.__print("PYGA_GenAlg / run - Reproducing\n", debug=True)
+            reproducedPopulation = self.__genAlgBehavior.reproduction(self.__population, selectedPopulation, infoStr)
         # 5- Set the new population
         self.__print("PYGA_GenAlg / run - Setting new population\n", debug=True)
-        del self.__population
+        previousPopulation = self.__population
         self.__population = reproducedPopulation + selectedPopulation
         # 6- Manage end of generations
         self.__print("PYGA_GenAlg / run - Evaluating\n", debug=True)
-        percent, continueEvolution, nbEval = self.__evaluation(iGen, infoStr)
+        percent, continueEvolution, nbEval = self.__evaluation(iGen, infoStr, selectedPopulation, previousPopulation)
+        del previousPopulation
+        if self.__generationObserver is not None and self.__generationObserver(self.__population, iGen + 1):
+            continueEvolution = False
         self.__genAlgBehavior.endOfGeneration(self.__population, iGen, not continueEvolution, infoStr)
+        # 7- Exchange individuals with the other islands
+        if self.__migration is not None and continueEvolution:
+            self.__migration.migrate(self.__population, iGen, infoStr)
         return nbEval, percent, continueEvolution
 
     # ===================
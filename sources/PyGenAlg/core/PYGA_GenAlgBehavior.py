@@ -19,6 +19,16 @@ Global:
 - Meta data
 - Removed unused methods
 - Removed method that had no sens to be here (used in Standard behavior)
+**** 18/10/2026 ****
+- Evaluation engine creation (createEvaluator)
+- Chunk size of the parallel evaluation
+- Evaluation backend (processes, threads or asyncio)
+- Evaluation cache creation (createEvaluationCache)
+- Evaluation cache saved in a file (eval_cache_file)
+- One worker process instead of the serial evaluation with an evaluation timeout
+- Non generational evolution (isGenerational, evolve)
+- Remote evaluation backend (workers connected over TCP)
+- Genomes sent to the worker processes in shared memory (shared_genomes, results still pickled)
 
 TODO List:
 -
@@ -30,6 +40,13 @@ from sys import version_info
 
 # - Local imports -
 from PyParamManager.PYPM_ParamManager import PYPM_ParamManager
+from PyGenAlg.core.PYGA_Evaluator import PYGA_Evaluator
+from PyGenAlg.core.PYGA_EvaluationCache import PYGA_EvaluationCache
+from PyGenAlg.core.PYGA_DiskEvaluationCache import PYGA_DiskEvaluationCache
+from PyGenAlg.core.PYGA_AsyncEvaluator import PYGA_AsyncEvaluator
+from PyGenAlg.core.PYGA_ProcessEvaluator import PYGA_ProcessEvaluator
+from PyGenAlg.core.PYGA_RemoteEvaluator import PYGA_RemoteEvaluator
+from PyGenAlg.core.PYGA_ThreadEvaluator import PYGA_ThreadEvaluator
 from PyGenAlg.core.PYGA_Exceptions import PYGA_ParametersError, PYGA_MethodMustBeOverloaded
 
 # Manage python versions compatibility
@@ -42,7 +59,7 @@ __copyright__ = "Copyright 2016, Raphaël Deau"
 __license__ = "Creative Commons Attribution Non-commercial 4.0"
 __version__ = "1.0.0"
 __since__ = "20/07/2011"
-__date__ = "28/09/2016"
+__date__ = "18/10/2026"
 
 
 class PYGA_GenAlgBehavior(object):
@@ -57,6 +74,7 @@ class PYGA_GenAlgBehavior(object):
                 + getParam
                 + setParameters
                 + getParameters
+        - The evaluation engine used during the run (createEvaluator)
         - The behavior of the GA for following basic actions that must be overwritten:
             * stopCriteria
             * startOfGeneration
@@ -65,6 +83,8 @@ class PYGA_GenAlgBehavior(object):
             * reproduction
             * selfOptimize
             * optimise
+        - A non generational evolution (isGenerational, evolve), see
+          PYGA_SteadyStateGenAlgBehavior.
 
     A "standard behavior and parameters set" is provided in PYGA_StandardGenAlgBehavior.
 
@@ -75,6 +95,8 @@ class PYGA_GenAlgBehavior(object):
         :type __individualClass: type derived from PYGA_Individual
         :ivar __populationClass: The population class to use.
         :type __populationClass: type derived from PYGa_Population
+        :ivar __evaluator: The evaluation engine of the current run.
+        :type __evaluator: Derived from PYGA_Evaluator
     """
 
     ALL_PARAMS = []
@@ -131,6 +153,7 @@ class PYGA_GenAlgBehavior(object):
         self.__paramManager = PYPM_ParamManager()
         self.__individualClass = individualClass
         self.__populationClass = populationClass
+        self.__evaluator = None
         # Store outputPrint public so derived class can use it.
         self.printLog = printMethod
         for param in self.ALL_PARAMS:
@@ -173,6 +196,90 @@ class PYGA_GenAlgBehavior(object):
         """Create a new population."""
         return self.__populationClass(self.__individualClass, self, self.printLog)
 
+    def createEvaluator(self):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Create the evaluation engine of the run according to the parameters
+        (max_process, evaluation_backend).
+        The serial evaluation cannot be stopped: with an evaluation timeout,
+        max_process=1 means one worker process.
+        The remote backend does not depend on max_process (all the connected workers are used).
+
+        :return: The evaluator (not started).
+        :rtype: Derived from PYGA_Evaluator
+        """
+        maxProcess = int(self.getParam(self.MAX_PROCESS_LABEL))
+        backendName = self.getParam(self.EVALUATION_BACKEND_LABEL)
+        if maxProcess == 1 and backendName.upper() != "REMOTE":
+            if self.getParam(self.EVAL_TIMEOUT_LABEL) > 0:
+                return self.createProcessEvaluator(maxProcess)
+            return PYGA_Evaluator(self.__individualClass, self.printLog)
+        return eval('self.' + self.EVALUATION_BACKEND_DICT[backendName])(maxProcess)
+
+    def createProcessEvaluator(self, maxProcess):
+        """Create an evaluator using worker processes (backend "PROCESS")."""
+        return PYGA_ProcessEvaluator(self.__individualClass, self.printLog, maxProcess,
+                                     self.getParam(self.CHUNK_SIZE_LABEL), self.getParam(self.SHARED_GENOMES_LABEL))
+
+    def createThreadEvaluator(self, maxProcess):
+        """Create an evaluator using threads (backend "THREAD")."""
+        return PYGA_ThreadEvaluator(self.__individualClass, self.printLog, maxProcess)
+
+    def createAsyncEvaluator(self, maxProcess):
+        """Create an evaluator running coroutine fitness on an event loop (backend "ASYNC")."""
+        return PYGA_AsyncEvaluator(self.__individualClass, self.printLog, maxProcess)
+
+    def createRemoteEvaluator(self, maxProcess):
+        """
+        Create an evaluator using remote workers connected over TCP (backend "REMOTE",
+        see PYGA_RemoteEvaluator.runRemoteWorker).
+        """
+        authkey = self.getParam(self.REMOTE_AUTHKEY_LABEL)
+        if authkey is None:
+            error = 'ERROR: The remote evaluation backend needs an authentication key (remote_authkey).'
+            raise PYGA_ParametersError(error)
+        return PYGA_RemoteEvaluator(self.__individualClass, self.printLog, self.getParam(self.REMOTE_ADDRESS_LABEL),
+                                    authkey, self.getParam(self.REMOTE_HEARTBEAT_TIMEOUT_LABEL),
+                                    self.getParam(self.CHUNK_SIZE_LABEL))
+
+    def createEvaluationCache(self):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Create the evaluation cache of the run according to the parameters
+        (eval_cache_size, eval_cache_file).
+
+        :return: The evaluation cache (None for no cache).
+        :rtype: PYGA_EvaluationCache
+        """
+        cacheSize = self.getParam(self.EVAL_CACHE_SIZE_LABEL)
+        cacheFile = self.getParam(self.EVAL_CACHE_FILE_LABEL)
+        if cacheFile is not None:
+            return PYGA_DiskEvaluationCache(cacheFile, max(0, cacheSize), self.__individualClass)
+        if cacheSize == 0:
+            return None
+        if cacheSize < 0:
+            cacheSize = 0
+        return PYGA_EvaluationCache(cacheSize)
+
+    def setEvaluator(self, evaluator):
+        """
+        /!\ MAY ONLY BE CALLED BY PYGA_GenAlg /!\
+
+        Set the evaluation engine of the current run.
+
+        :param evaluator: The evaluator to use (None at the end of the run).
+        :type evaluator: Derived from PYGA_Evaluator
+        """
+        self.__evaluator = evaluator
+
+    def getEvaluator(self):
+        """Get the evaluation engine of the current run (serial evaluator out of a run)."""
+        if self.__evaluator is None:
+            return PYGA_Evaluator(self.__individualClass, self.printLog)
+        return self.__evaluator
+
     def initPopulation(self, population, infoStr):
         """
         [ MUST BE OVERLOADED ]
@@ -205,6 +312,37 @@ class PYGA_GenAlgBehavior(object):
         """
         raise PYGA_MethodMustBeOverloaded("GenAlgBehavior.stopCriteria")
 
+    def isGenerational(self):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Defines how the evaluated initial population evolves: generation by
+        generation (see PYGA_GenAlg.run), or by evolve.
+
+        :return: True for a generational evolution, False to call evolve.
+        :rtype: bool
+        """
+        return True
+
+    def evolve(self, population, startTime, infoStr):
+        """
+        [ MUST BE OVERLOADED IF NOT GENERATIONAL ]
+
+        Run the whole evolution of the population (already initialised and
+        evaluated) when it is not generational (see isGenerational).
+        The population must be modified in place.
+
+        :param population: The current population.
+        :type population: Derived from PYGA_Population
+        :param startTime: The start time of the evolution
+        :type startTime: float
+        :param infoStr: The log string to concatenate.
+        :type infoStr: str
+        :return: The number of evaluated individuals.
+        :rtype: int
+        """
+        raise PYGA_MethodMustBeOverloaded("GenAlgBehavior.evolve")
+
     def startOfGeneration(self, population, iGeneration, infoStr):
         """
         [ MUST BE OVERLOADED ]
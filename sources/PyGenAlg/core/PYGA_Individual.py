@@ -17,20 +17,35 @@ Global:
 - Docstring
 - Meta data
 TODO: complete the list!
+**** 18/10/2026 ****
+- Parallel launch moved to the evaluators (PYGA_Evaluator)
+- Evaluation result sent back by the workers (getEvaluationResult, setEvaluationResult)
+- Evaluation context given to the fitness instead of the population (NEED_POPULATION, getEvaluationContext)
+- Evaluation worker initialisation (initWorker, getWorkerState)
+- Coroutine fitness support (launchObjectives, storeObjectives)
+- Batch fitness support (fitnessBatch, computeObjectivesBatch)
+- Genome fingerprint for the evaluation cache (getFingerprint)
+- Penalty of the failed evaluations (applyPenalty)
+- Evaluation cost estimate for the scheduling of the evaluations (estimateCost, getCostFeature)
+- Genome sent to the worker processes in shared memory (getGenomeBuffer, fromGenomeBuffer)
 
 TODO List:
 -
 """
 # - Build-in imports -
-from multiprocessing import Process
 from sys import version_info
 
 # - Local imports -
-from PyGenAlg.core.PYGA_Exceptions import PYGA_MethodMustBeOverloaded
+from PyGenAlg.core.PYGA_Exceptions import PYGA_MethodMustBeOverloaded, PYGA_FitnessComputation
 
 # Manage python versions compatibility
 if version_info[0] >= 3:
     unicode = str
+    from inspect import iscoroutine
+else:
+    # No coroutine fitness in python 2
+    def iscoroutine(obj):
+        return False
 
 # Meta information
 __author__ = "Raphaël Deau"
@@ -38,7 +53,7 @@ __copyright__ = "Copyright 2016, Raphaël Deau"
 __license__ = "Creative Commons Attribution Non-commercial 4.0"
 __version__ = "1.0.0"
 __since__ = "18/07/2011"
-__date__ = "29/09/2016"
+__date__ = "18/10/2026"
 
 
 class PYGA_Individual(object):
@@ -54,8 +69,10 @@ class PYGA_Individual(object):
     """
 
     MULTI_OBJ = False # TODO: set this in standardIndiv
+    NEED_POPULATION = True # Set to False if fitness/objectives do not use the population
     CURRENT_GENERATION = 0 # Keep the current generation to store birth generation
     __behav = None # Keep the behavior to be able to get the parameters
+    __workerState = None # Keep the resources of the evaluation worker (see initWorker)
 
     @classmethod
     def SET_BEHAVIOR(cls, behaviorInstance):
@@ -69,6 +86,38 @@ class PYGA_Individual(object):
         """
         cls.__behav = behaviorInstance
 
+    @classmethod
+    def SET_WORKER_STATE(cls, workerState):
+        """
+        /!\ MAY ONLY BE CALLED BY THE EVALUATORS (PYGA_Evaluator) /!\
+
+        Set the state of the current evaluation worker (see initWorker).
+
+        :param workerState: The state returned by initWorker.
+        :type workerState: Depending on the individual
+        """
+        cls.__workerState = workerState
+
+    @classmethod
+    def initWorker(cls):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Called once by each evaluation worker when it starts (once by the main
+        process when the evaluation is not parallel), before any fitness computation.
+        Expensive resources needed by the fitness (lookup tables, models...) should
+        be loaded here so that they are loaded once per worker for the whole run.
+
+        :return: The worker state, available in fitness/objectives with getWorkerState.
+        :rtype: Depending on the individual
+        """
+        return None
+
+    @classmethod
+    def getWorkerState(cls):
+        """Get the state of the current evaluation worker (see initWorker)."""
+        return cls.__workerState
+
     @classmethod
     def getParam(cls, paramKeyword):
         """
@@ -151,79 +200,291 @@ class PYGA_Individual(object):
         [ MUST BE OVERLOADED ]
 
         Returns the computed fitness of the individual.
+        May be defined as a coroutine function ("async def"), for instance to wait
+        for external solvers (see the "ASYNC" evaluation backend).
 
         :param population: The entire population (if needed).
+                           In fact, the evaluation context (see getEvaluationContext).
         :type population: Derived from PYGA_Population
         :return: The fitness of the individual
         :rtype: Depending on the individual
         """
         raise PYGA_MethodMustBeOverloaded("Individual.fitness")
 
+    @classmethod
+    def fitnessBatch(cls, individuals, population):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Returns the computed fitnesses of several individuals at once (for instance
+        by stacking their genomes in one array for a vectorized computation).
+        When it is overloaded, it is used instead of fitness/objectives: the
+        evaluators give it all the individuals to compute, or one part per worker.
+        May be defined as a coroutine function ("async def").
+
+        :param individuals: The individuals to compute.
+        :type individuals: list
+        :param population: The entire population (if needed).
+                           In fact, the evaluation context (see getEvaluationContext).
+        :type population: Derived from PYGA_Population
+        :return: The fitnesses, in the order of the individuals (as returned
+                 by fitness/objectives).
+        :rtype: sequence
+        """
+        raise PYGA_MethodMustBeOverloaded("Individual.fitnessBatch")
+
+    @classmethod
+    def hasFitnessBatch(cls):
+        """Check if the individual class computes its fitness by batch (see fitnessBatch)."""
+        return cls.fitnessBatch.__func__ is not PYGA_Individual.fitnessBatch.__func__
+
+    @classmethod
+    def getEvaluationContext(cls, population):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Get the object given to fitness/objectives as "population".
+        It is built once per evaluation of a population and sent once to each
+        worker process (not with each individual), so it must be read only.
+
+        By default, it is the population itself, or None if NEED_POPULATION is False.
+        Overload it to give a lighter object (statistics, reference values...).
+
+        :param population: The entire population.
+        :type population: Derived from PYGA_Population
+        :return: The evaluation context.
+        :rtype: Depending on the individual
+        """
+        if cls.NEED_POPULATION:
+            return population
+        return None
+
     def objectives(self, population):
         # TODO: Set this in StandardIndiv
         raise PYGA_MethodMustBeOverloaded("Individual.objectives")
 
+    def getFingerprint(self):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Get the fingerprint of the genome, used as key by the evaluation cache
+        (see the eval_cache_size parameter): two individuals with the same
+        fingerprint must have the same evaluation result.
+        Overload it only if the fitness does not depend on the population.
+
+        :return: A hashable key (a tuple of the genes for instance), None if the
+                 individual must not be cached.
+        :rtype: hashable
+        """
+        return None
+
+    def estimateCost(self):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Estimate the duration of the evaluation of the individual: the evaluators
+        launch the most expensive evaluations first and balance the chunks sent to
+        the workers (see PYGA_Evaluator.sortByCost).
+
+        :return: The estimated cost, in any unit proportional to the duration of the
+                 evaluation (the evaluators learn the ratio), None if unknown.
+        :rtype: float
+        """
+        return None
+
+    def getCostFeature(self):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Get the feature of the genome the duration of the evaluation depends on
+        (the number of objects to place for instance), when it cannot be estimated
+        (see estimateCost): the evaluators learn the mean duration of the evaluations
+        for each value of the feature.
+
+        :return: A hashable value, None if unknown.
+        :rtype: hashable
+        """
+        return None
+
+    @classmethod
+    def hasCostEstimate(cls):
+        """Check if the individual class estimates the cost of its evaluations (see estimateCost, getCostFeature)."""
+        return (cls.estimateCost is not PYGA_Individual.estimateCost or
+                cls.getCostFeature is not PYGA_Individual.getCostFeature)
+
+    def getGenomeBuffer(self):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Get the genome as one contiguous buffer, copied in shared memory by the
+        process evaluation backend each time the individual is sent to a worker,
+        instead of pickling the individual (see the shared_genomes parameter and
+        fromGenomeBuffer). The results of the worker are still pickled.
+
+        :return: An object supporting the buffer protocol (bytes, bytearray,
+                 array.array, contiguous NumPy array...), None to pickle the individual.
+        :rtype: bytes-like
+        """
+        return None
+
+    @classmethod
+    def fromGenomeBuffer(cls, genomeBuffer):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Build the individual to evaluate in a worker process from its genome buffer
+        (see getGenomeBuffer). The buffer is a read only view of the shared memory,
+        valid during the evaluation only: numpy.frombuffer(genomeBuffer, dtype)
+        gives the genome without any copy.
+
+        :param genomeBuffer: The genome, as returned by getGenomeBuffer.
+        :type genomeBuffer: memoryview
+        :return: The individual to evaluate.
+        :rtype: cls
+        """
+        raise PYGA_MethodMustBeOverloaded("Individual.fromGenomeBuffer")
+
+    @classmethod
+    def hasGenomeBuffer(cls):
+        """Check if the genome of the individual class may be sent in shared memory (see getGenomeBuffer)."""
+        return (cls.getGenomeBuffer is not PYGA_Individual.getGenomeBuffer and
+                cls.fromGenomeBuffer.__func__ is not PYGA_Individual.fromGenomeBuffer.__func__)
+
+    def applyPenalty(self, penalty):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Set the penalty as result of an evaluation which failed (timeout...),
+        see the eval_penalty parameter.
+
+        :param penalty: The penalty, as returned by fitness/objectives.
+        :type penalty: Depending on the individual
+        """
+        self.storeObjectives(penalty)
+
     def needCompute(self):
         # TODO: Set this in StandardIndiv? (See Population)
         """Check if the individual needs computation of fitness."""
         return self.__fitness is None
 
-    def __computeObjectives(self, population, pipe=None, indivID=None):
+    def launchObjectives(self, population):
         # TODO: Set this in StandardIndiv? (See Population)
         """
-        Launch the fitness computation.
-        May be in separate thread.
+        Launch the fitness computation, without storing the result (see storeObjectives).
+        fitness/objectives may be coroutine functions ("async def"): the returned
+        coroutine must then be awaited before storing its result.
 
         :param population: The entire population (if needed)
         :type population: Derived from PYGA_Population
-        :param pipe: The associated pipe to return to the parent thread.
-        :type pipe: Pipe
-        :param indivID: The id of the individual (in the parent thread)
-        :type indivID: int
-        :return: The fitness
+        :return: The fitness (or a coroutine returning it)
         :rtype: Depending on the individual
         """
         if self.MULTI_OBJ: # TODO: Set this in StandardIndiv
             obj = self.objectives(population)
         else:
             obj = self.fitness(population)
-        if pipe is not None:
-            # TODO: may not work, use shared object
-            # TODO: Check if it works... Fitness is not set...
-            pipe.send([self, indivID])
-            pipe.close()
         return obj
 
-    def computeObjectives(self, population, processList=None, pipe=None, indivID=None):
+    def storeObjectives(self, obj):
+        """
+        Store the result of the fitness computation (see launchObjectives).
+
+        :param obj: The fitness returned by fitness/objectives.
+        :type obj: Depending on the individual
+        """
+        # TODO: check why self.__fitness is set (and sometimes not)
+        self.__fitness = obj
+        # TODO: check how optimised fit works.
+        self.__optimised_fitness = self.__fitness
+
+    def computeObjectives(self, population):
         # TODO: Set this in StandardIndiv? (See Population)
         """
-        Launch the fitness computation.
-        Manage parallel launch.
+        Launch the fitness computation (in the current process).
+        Parallel evaluation is managed by the evaluator (see PYGA_Evaluator).
+        A coroutine fitness is run until complete in its own event loop.
 
         :param population: The entire population (if needed)
         :type population: Derived from PYGA_Population
-        :param processList: The parent thread process list to update
-        :type processList: list
-        :param pipe: The pipe to connect to the parent thread.
-        :type pipe: Pipe
-        :param indivID: The id of the individual in the parent thread.
-        :type indivID: int
         :return: True if the fitness has been computed. False otherwise.
         :rtype: bool
         """
         needCompute = self.needCompute()
         if needCompute:
-            if self.getParam("max_process") != 1:
-                p = Process(target=self.__computeObjectives, args=(population, pipe, indivID))
-                p.start()
-                processList.append(p)
-            else:
-                # TODO: check why self.__fitness is set (and sometimes not)
-                self.__fitness = self.__computeObjectives(population)
-                # TODO: check how optimised fit works.
-                self.__optimised_fitness = self.__fitness
+            obj = self.launchObjectives(population)
+            if iscoroutine(obj):
+                # asyncio is only needed by the coroutine fitness
+                from asyncio import run as asyncio_run
+                obj = asyncio_run(obj)
+            self.storeObjectives(obj)
         return needCompute
 
+    @classmethod
+    def computeObjectivesBatch(cls, individuals, population):
+        """
+        Launch the batch fitness computation of the given individuals (in the current process).
+        See fitnessBatch.
+
+        :param individuals: The individuals to compute (the computed ones are skipped).
+        :type individuals: list
+        :param population: The entire population (if needed)
+        :type population: Derived from PYGA_Population
+        :return: The number of computed individuals.
+        :rtype: int
+        """
+        toCompute = [individual for individual in individuals if individual.needCompute()]
+        if len(toCompute) > 0:
+            objs = cls.fitnessBatch(toCompute, population)
+            if iscoroutine(objs):
+                # asyncio is only needed by the coroutine fitness
+                from asyncio import run as asyncio_run
+                objs = asyncio_run(objs)
+            cls.storeObjectivesBatch(toCompute, objs)
+        return len(toCompute)
+
+    @classmethod
+    def storeObjectivesBatch(cls, individuals, objs):
+        """
+        Store the result of the batch fitness computation (see fitnessBatch).
+
+        :param individuals: The computed individuals.
+        :type individuals: list
+        :param objs: The fitnesses returned by fitnessBatch.
+        :type objs: sequence
+        """
+        objs = list(objs)
+        if len(objs) != len(individuals):
+            raise PYGA_FitnessComputation("ERROR: fitnessBatch returned " + str(len(objs)) +
+                                          " fitnesses for " + str(len(individuals)) + " individuals")
+        for individual, obj in zip(individuals, objs):
+            individual.storeObjectives(obj)
+
+    def getEvaluationResult(self):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Get the result of the evaluation, as sent back by a worker to the main process.
+        The individual itself is not sent back: the main process calls
+        setEvaluationResult with this result on its own instance of the individual.
+        Overload both methods to send other data computed by the fitness (metadata).
+
+        :return: The computed fitness
+        :rtype: Depending on the individual
+        """
+        return self.__fitness
+
+    def setEvaluationResult(self, result):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Set the result of an evaluation done in another process (see getEvaluationResult).
+
+        :param result: The result returned by getEvaluationResult in the worker.
+        :type result: Depending on the individual
+        """
+        self.__fitness = result
+        self.__optimised_fitness = result
+
     @classmethod
     def computeMultiObjFitness(cls, population):
         # TODO: Set this in StandardIndiv?
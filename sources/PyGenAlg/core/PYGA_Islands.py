@@ -0,0 +1,456 @@
+# -*- coding: utf-8 -*-
+"""
+Python Genetic Algorithm module.
+
+This file contains the island model of the GA: PYGA_Islands.
+It runs several GAs (the islands) in separate processes, and migrates
+individuals between them every few generations.
+
+License full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+
+
+
+Modification History:
+**** 18/10/2026 ****
+Creation
+
+TODO List:
+-
+"""
+# - Build-in imports -
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import wait
+from os import devnull
+from os.path import join as osjoin
+from sys import stdout
+import random
+from time import time, asctime
+from traceback import format_exc
+
+# - Local imports -
+from PyGenAlg.core.PYGA_GenAlg import PYGA_GenAlg
+from PyGenAlg.core.PYGA_Population import PYGA_Population
+from PyGenAlg.core.PYGA_Individual import PYGA_Individual
+from PyGenAlg.core.PYGA_GenAlgBehavior import PYGA_GenAlgBehavior
+from PyGenAlg.core.PYGA_Migration import PYGA_Migration, MIGRANTS_MSG, DONE_MSG, ERROR_MSG
+from PyGenAlg.core.PYGA_Exceptions import PYGA_CreationError, PYGA_ParametersError, PYGA_PopulationError
+from PyGenAlg.standards.PYGA_StandardGenAlgBehavior import PYGA_StandardGenAlgBehavior
+
+# Meta information
+__author__ = "Raphaël Deau"
+__copyright__ = "Copyright 2016, Raphaël Deau"
+__license__ = "Creative Commons Attribution Non-commercial 4.0"
+__version__ = "1.0.0"
+__since__ = "18/10/2026"
+__date__ = "18/10/2026"
+
+
+def _islandLoop(connection, individualClass, genAlgBehaviorClass, populationClass, debugMode, logFileName,
+                seed, parameters, migrationParameters):
+    """
+    Main function of an island process: run a GA with the migration of the island
+    (see PYGA_Migration), then send [DONE_MSG, [best individual, number of generations,
+    number of evaluations, number of immigrants, evolution time]] to the coordinator
+    ([ERROR_MSG, formatted traceback] if the GA failed).
+
+    :param connection: The connection to the coordinator.
+    :type connection: multiprocessing Connection
+    :param individualClass: The individual class to use.
+    :type individualClass: type derived from PYGA_Individual
+    :param genAlgBehaviorClass: The behavior class of the GA.
+    :type genAlgBehaviorClass: type derived from PYGA_GenAlgBehavior
+    :param populationClass: The population class of the GA.
+    :type populationClass: type derived from PYGA_Population
+    :param debugMode: Setting debug mode up or down.
+    :type debugMode: bool
+    :param logFileName: The file where the GA writes its logs (None to drop them).
+    :type logFileName: str
+    :param seed: The seed of the random module of the island.
+    :type seed: int
+    :param parameters: The parameters of the GA of the island.
+    :type parameters: dict
+    :param migrationParameters: The migration interval, number of migrants and migrant
+                                selection (see PYGA_Migration).
+    :type migrationParameters: list
+    """
+    if logFileName is None:
+        logFileName = devnull
+    outputPrint = open(logFileName, 'w')
+    try:
+        random.seed(seed)
+        genAlg = PYGA_GenAlg(individualClass, genAlgBehaviorClass, populationClass, debugMode, outputPrint)
+        genAlg.setParameters(**parameters)
+        migration = PYGA_Migration(connection, *migrationParameters)
+        genAlg.setMigration(migration)
+        startTime = time()
+        genAlg.run()
+        connection.send([DONE_MSG, [genAlg.getBestIndividual(), individualClass.CURRENT_GENERATION,
+                                    genAlg.getNbEvaluations(), migration.getNbImmigrants(), time() - startTime]])
+    except Exception:
+        connection.send([ERROR_MSG, format_exc()])
+    finally:
+        outputPrint.close()
+        connection.close()
+
+
+class PYGA_Islands(object):
+    """
+    Island model: nbIslands GAs run in separate processes, each one with its own
+    population, random seed and parameters (see setParameters).
+
+    Every migrationInterval generations, each island sends copies of nbMigrants
+    individuals (its best, or random ones) to the coordinator (this object, in
+    the main process), and waits for its immigrants, which replace its worst
+    individuals (see PYGA_Migration). When all the running islands have sent their
+    emigrants, the coordinator gives them to the other islands along the topology:
+        - RING: each island sends to the next one (island number order),
+        - FULL: each island sends to all the other ones,
+        - RANDOM: each island sends to another island chosen at random at each migration.
+    An island stopped by its stop criteria leaves the topology. The islands only
+    wait for each other at the migrations: the islands run in parallel between them.
+    Migrations only happen between generational behaviors (see
+    PYGA_GenAlgBehavior.isGenerational).
+
+    The statistics of the islands (best fitness at each migration, number of
+    generations and evaluations, evolution time) and their best individuals are
+    gathered by the coordinator, and printed at the end of the run.
+    An island may use parallel evaluation (max_process parameter...): its worker
+    processes add to the island processes.
+
+    Attributes:
+        :ivar __individualClass: The individual class to use.
+        :type __individualClass: type derived from PYGA_Individual
+        :ivar __genAlgBehaviorClass: The behavior class of the islands.
+        :type __genAlgBehaviorClass: type derived from PYGA_GenAlgBehavior
+        :ivar __populationClass: The population class of the islands.
+        :type __populationClass: type derived from PYGA_Population
+        :ivar __migrationInterval: The number of generations between two migrations.
+        :type __migrationInterval: int
+        :ivar __nbMigrants: The number of individuals sent by an island at each migration.
+        :type __nbMigrants: int
+        :ivar __migrationTopology: Where the emigrants are sent (see POSSIBLE_MIGRATION_TOPOLOGIES).
+        :type __migrationTopology: str
+        :ivar __migrantSelection: How the emigrants are chosen (see PYGA_Migration.POSSIBLE_MIGRANT_SELECTIONS).
+        :type __migrantSelection: str
+        :ivar __debugMode: Defines if debug is activated (in the islands).
+        :type __debugMode: bool
+        :ivar __outputPrint: The output stream to write log in.
+        :type __outputPrint: Opened output stream
+        :ivar __logDirectory: The directory of the log files of the islands (None to drop their logs).
+        :type __logDirectory: str
+        :ivar __parameters: The parameters of the GA of each island.
+        :type __parameters: list of dict
+        :ivar __islandResults: The results of each island, as [best individual, number of
+                               generations, number of evaluations, number of immigrants,
+                               evolution time] (None if not run).
+        :type __islandResults: list
+        :ivar __islandHistories: The statistics of each island at each migration, as
+                                 [generation, best fitness (None if multi objective), evolution time].
+        :type __islandHistories: list of list
+        :ivar __nbMigrations: The number of migrations of the last run.
+        :type __nbMigrations: int
+    """
+
+    # Where the emigrants of an island are sent
+    POSSIBLE_MIGRATION_TOPOLOGIES = ['RING', 'FULL', 'RANDOM']
+
+    # ==================
+    # v Public methods v
+    # ==================
+
+    def __init__(self,
+                 individualClass,
+                 nbIslands,
+                 genAlgBehaviorClass=PYGA_StandardGenAlgBehavior,
+                 populationClass=PYGA_Population,
+                 migrationInterval=10,
+                 nbMigrants=1,
+                 migrationTopology='RING',
+                 migrantSelection='BEST',
+                 debugMode=False,
+                 outputPrint=None,
+                 logDirectory=None):
+        """
+        The constructor of PYGA_Islands.
+
+        :param individualClass: The individual class to use
+        :type individualClass: Python class, inherited from PYGA_Individual
+        :param nbIslands: The number of islands (processes).
+        :type nbIslands: int
+        :param genAlgBehaviorClass: A class defining the behavior of the islands.
+        :type genAlgBehaviorClass: Python class, inherited from PYGA_GenAlgBehavior
+        :param populationClass: A class defining the structure of a population of the islands
+        :type populationClass: Python class, inherited from PYGA_Population
+        :param migrationInterval: The number of generations between two migrations.
+        :type migrationInterval: int
+        :param nbMigrants: The number of individuals sent by an island at each migration.
+        :type nbMigrants: int
+        :param migrationTopology: Where the emigrants are sent: 'RING', 'FULL' or 'RANDOM'.
+        :type migrationTopology: str
+        :param migrantSelection: How the emigrants are chosen: 'BEST' or 'RANDOM'.
+        :type migrantSelection: str
+        :param debugMode: Setting debug mode up or down (in the islands).
+        :type debugMode: Bool
+        :param outputPrint: A stream within the logs will be written
+        :type outputPrint: Opened output stream
+        :param logDirectory: The directory where each island writes its logs (island_<number>.log),
+                             None to drop the logs of the islands.
+        :type logDirectory: str
+        """
+        # 1- Check given classes and parameters
+        if not issubclass(individualClass, PYGA_Individual):
+            raise PYGA_CreationError("ERROR: individual class must inherit from PYGA_Individual")
+        if not issubclass(genAlgBehaviorClass, PYGA_GenAlgBehavior):
+            raise PYGA_CreationError("ERROR: behavior class must inherit from PYGA_GenAlgBehavior")
+        if not issubclass(populationClass, PYGA_Population):
+            raise PYGA_CreationError("ERROR: population class must inherit from PYGA_Population")
+        if type(nbIslands) != type(0) or nbIslands < 1:
+            raise PYGA_ParametersError("ERROR: Number of islands must be a strictly positive integer.")
+        if type(migrationInterval) != type(0) or migrationInterval < 1:
+            raise PYGA_ParametersError("ERROR: Migration interval must be a strictly positive integer.")
+        if type(nbMigrants) != type(0) or nbMigrants < 0:
+            raise PYGA_ParametersError("ERROR: Number of migrants must be a positive integer.")
+        if migrationTopology.upper() not in self.POSSIBLE_MIGRATION_TOPOLOGIES:
+            error = 'ERROR: Unkown given migration topology (' + migrationTopology + ').\n'
+            error += 'Possible topologies: ' + str(self.POSSIBLE_MIGRATION_TOPOLOGIES)
+            raise PYGA_ParametersError(error)
+        if migrantSelection.upper() not in PYGA_Migration.POSSIBLE_MIGRANT_SELECTIONS:
+            error = 'ERROR: Unkown given migrant selection (' + migrantSelection + ').\n'
+            error += 'Possible selections: ' + str(PYGA_Migration.POSSIBLE_MIGRANT_SELECTIONS)
+            raise PYGA_ParametersError(error)
+
+        # 2- Store the configuration
+        self.__individualClass = individualClass
+        self.__genAlgBehaviorClass = genAlgBehaviorClass
+        self.__populationClass = populationClass
+        self.__migrationInterval = migrationInterval
+        self.__nbMigrants = nbMigrants
+        self.__migrationTopology = migrationTopology.upper()
+        self.__migrantSelection = migrantSelection.upper()
+        self.__debugMode = debugMode
+        if outputPrint is None:
+            outputPrint = stdout
+        self.__outputPrint = outputPrint
+        self.__logDirectory = logDirectory
+        self.__parameters = [{} for _ in range(nbIslands)]
+        self.__islandResults = [None] * nbIslands
+        self.__islandHistories = [[] for _ in range(nbIslands)]
+        self.__nbMigrations = 0
+
+    def setParameters(self, iIsland=None, **kwargs):
+        """
+        Set the given parameters values (see Behavior for parameters list) of all the
+        islands, or of one island only. The parameters are checked by the islands, at
+        the start of the run.
+
+        :param iIsland: The number of the island (None for all the islands).
+        :type iIsland: int
+        """
+        if iIsland is None:
+            for parameters in self.__parameters:
+                parameters.update(kwargs)
+        else:
+            self.__parameters[iIsland].update(kwargs)
+
+    def getNbIslands(self):
+        """Returns the number of islands."""
+        return len(self.__parameters)
+
+    def run(self):
+        """
+        Run the islands until they are all stopped by their stop criteria (see the
+        class documentation). Each island gets a random seed from the random module
+        of the main process: a seeded run is reproducible.
+        """
+        nbIslands = self.getNbIslands()
+        self.__islandResults = [None] * nbIslands
+        self.__islandHistories = [[] for _ in range(nbIslands)]
+        self.__nbMigrations = 0
+        self.__writeHeaders()
+        startTime = time()
+        migrationParameters = [self.__migrationInterval, self.__nbMigrants, self.__migrantSelection]
+        islands = []
+        try:
+            # 1- Start the islands (not daemonic: an island may start evaluation worker processes)
+            for iIsland in range(nbIslands):
+                logFileName = None
+                if self.__logDirectory is not None:
+                    logFileName = osjoin(self.__logDirectory, "island_" + str(iIsland) + ".log")
+                parentConnection, childConnection = Pipe()
+                proc = Process(target=_islandLoop,
+                               args=(childConnection, self.__individualClass, self.__genAlgBehaviorClass,
+                                     self.__populationClass, self.__debugMode, logFileName,
+                                     random.getrandbits(32), self.__parameters[iIsland], migrationParameters))
+                proc.start()
+                childConnection.close()
+                islands.append([proc, parentConnection])
+            # 2- Route the migrants until all the islands are stopped
+            self.__coordinate(islands)
+        finally:
+            for proc, connection in islands:
+                if proc.is_alive():
+                    proc.kill()
+                proc.join()
+                connection.close()
+        self.__writeStatistics(time() - startTime)
+
+    def getBestIndividual(self):
+        """Returns the best individual of all the islands (of the last run)."""
+        population = self.__populationClass(self.__individualClass, None, self.__print)
+        for results in self.__islandResults:
+            if results is None:
+                continue
+            bestIndividuals = results[0]
+            if not isinstance(bestIndividuals, list):
+                bestIndividuals = [bestIndividuals]
+            for individual in bestIndividuals:
+                population.addIndividual(individual)
+        if population.size() == 0:
+            return None
+        return population.getBestIndividual()
+
+    def getIslandResults(self, iIsland):
+        """
+        Get the results of an island (of the last run).
+
+        :param iIsland: The number of the island.
+        :type iIsland: int
+        :return: The best individual, the number of generations, the number of evaluations,
+                 the number of immigrants and the evolution time of the island (None if not run).
+        :rtype: list
+        """
+        return self.__islandResults[iIsland]
+
+    def getIslandHistory(self, iIsland):
+        """
+        Get the statistics of an island at each migration (of the last run).
+
+        :param iIsland: The number of the island.
+        :type iIsland: int
+        :return: The generation, the best fitness (None if multi objective) and the evolution
+                 time of the island at each migration.
+        :rtype: list of list
+        """
+        return self.__islandHistories[iIsland]
+
+    # ==================
+    # ^ Public methods ^
+    # ==================
+
+    # ===================
+    # v Private methods v
+    # ===================
+
+    def __print(self, s):
+        """
+        Print s to the output stream given in constructor.
+
+        :param s: The string to print
+        :type s: str
+        """
+        self.__outputPrint.write(s)
+        self.__outputPrint.flush()
+
+    def __writeHeaders(self):
+        """Write the configuration of the island model at launch."""
+        self.__print("***********************************************************************\n")
+        self.__print("Island model: " + str(self.getNbIslands()) + " islands, " + str(self.__nbMigrants) +
+                     " individuals (" + self.__migrantSelection + ") migrating every " +
+                     str(self.__migrationInterval) + " generations (" + self.__migrationTopology + " topology)\n")
+        self.__print("Start time: " + str(asctime()) + '\n')
+        self.__print("\rEvolving...")
+
+    def __writeStatistics(self, evolveTime):
+        """
+        Write the statistics of the islands at the end of the run.
+
+        :param evolveTime: The duration of the run (seconds).
+        :type evolveTime: float
+        """
+        self.__print("\rEvolving... 100% (" + str(self.__nbMigrations) + " migrations)" + ' ' * 50 + '\n')
+        nbEval = 0
+        for iIsland, results in enumerate(self.__islandResults):
+            best, nbGenerations, nbIslandEval, nbImmigrants, islandTime = results
+            nbEval += nbIslandEval
+            bestStr = ""
+            if not self.__individualClass.MULTI_OBJ:
+                bestStr = "best fitness " + str(best.getFitness()) + ", "
+            self.__print("Island " + str(iIsland) + ": " + bestStr + str(nbGenerations) + " generations, " +
+                         str(nbIslandEval) + " evaluations, " + str(nbImmigrants) + " immigrants, " +
+                         str(round(islandTime, 2)) + " seconds\n")
+        self.__print("Total number of evaluation: " + str(nbEval) + '\n')
+        self.__print("Evolution time: " + str(evolveTime) + " seconds.\n")
+        self.__print("***********************************************************************\n")
+
+    def __coordinate(self, islands):
+        """
+        Receive the emigrants and the results of the islands, and send them their
+        immigrants when all the running islands have sent their emigrants.
+
+        :param islands: The island processes and their connections, as [process, connection].
+        :type islands: list
+        """
+        running = set(range(len(islands)))
+        # Emigrants of the islands waiting for their immigrants, by island number
+        pending = {}
+        while len(running) > 0:
+            # 1- Sleep until at least one island has sent a message or is dead
+            waitedObjects = {}
+            for iIsland in running:
+                proc, connection = islands[iIsland]
+                waitedObjects[connection] = iIsland
+                waitedObjects[proc.sentinel] = iIsland
+            for iIsland in set(waitedObjects[obj] for obj in wait(list(waitedObjects.keys()))):
+                proc, connection = islands[iIsland]
+                try:
+                    messageType, data = connection.recv()
+                except (EOFError, IOError, OSError):
+                    proc.join()
+                    raise PYGA_PopulationError("ERROR: island " + str(iIsland) + " died (exit code " +
+                                               str(proc.exitcode) + ')')
+                if messageType == ERROR_MSG:
+                    raise PYGA_PopulationError("ERROR: island " + str(iIsland) + " failed:\n" + data)
+                if messageType == DONE_MSG:
+                    self.__islandResults[iIsland] = data
+                    running.discard(iIsland)
+                    proc.join()
+                elif messageType == MIGRANTS_MSG:
+                    emigrants, statistics = data
+                    pending[iIsland] = emigrants
+                    self.__islandHistories[iIsland].append(statistics)
+            # 2- Migrate when all the running islands wait for their immigrants
+            if len(pending) > 0 and all(iIsland in pending for iIsland in running):
+                for iIsland, immigrants in self.__route(pending).items():
+                    islands[iIsland][1].send(immigrants)
+                pending = {}
+                self.__nbMigrations += 1
+                self.__print("\rEvolving... (" + str(self.__nbMigrations) + " migrations)")
+
+    def __route(self, emigrants):
+        """
+        Give the emigrants of the islands to the other islands along the topology.
+
+        :param emigrants: The emigrants, by island number.
+        :type emigrants: dict
+        :return: The immigrants, by island number.
+        :rtype: dict
+        """
+        islandNumbers = sorted(emigrants.keys())
+        immigrants = dict((iIsland, []) for iIsland in islandNumbers)
+        if len(islandNumbers) < 2:
+            return immigrants
+        for i, iIsland in enumerate(islandNumbers):
+            others = [iOther for iOther in islandNumbers if iOther != iIsland]
+            if self.__migrationTopology == 'RING':
+                destinations = [islandNumbers[(i + 1) % len(islandNumbers)]]
+            elif self.__migrationTopology == 'FULL':
+                destinations = others
+            else:
+                destinations = [random.choice(others)]
+            for iDestination in destinations:
+                immigrants[iDestination].extend(emigrants[iIsland])
+        return immigrants
+
+    # ===================
+    # ^ Private methods ^
+    # ===================
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+Python Genetic Algorithm module.
+
+This file contains the migration of an island of the island model: PYGA_Migration.
+It is called by the GA of the island at the end of the generations (see
+PYGA_GenAlg.setMigration), and exchanges individuals with the other islands
+through the coordinator of PYGA_Islands.
+
+License full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+
+
+
+Modification History:
+**** 18/10/2026 ****
+Creation
+
+TODO List:
+-
+"""
+# - Build-in imports -
+from functools import cmp_to_key
+from random import sample
+from time import time
+
+# - Local imports -
+
+# Meta information
+__author__ = "Raphaël Deau"
+__copyright__ = "Copyright 2016, Raphaël Deau"
+__license__ = "Creative Commons Attribution Non-commercial 4.0"
+__version__ = "1.0.0"
+__since__ = "18/10/2026"
+__date__ = "18/10/2026"
+
+# Types of the messages sent by the islands to the coordinator
+MIGRANTS_MSG = 0
+DONE_MSG = 1
+ERROR_MSG = 2
+
+
+class PYGA_Migration(object):
+    """
+    Migration of an island: every migrationInterval generations, the emigrants
+    (copies of the best or of random individuals) are sent to the coordinator
+    with the statistics of the island, as [MIGRANTS_MSG, [emigrants, [generation, best fitness,
+    evolution time]]]. The island then waits for its immigrants (sent by the other
+    islands, see PYGA_Islands for the topology): they replace its worst individuals.
+
+    The migrants keep their evaluation: they are not evaluated again. The fitness
+    of a multi objective population is computed again with its immigrants.
+
+    Attributes:
+        :ivar __connection: The connection to the coordinator.
+        :type __connection: multiprocessing Connection
+        :ivar __migrationInterval: The number of generations between two migrations.
+        :type __migrationInterval: int
+        :ivar __nbMigrants: The number of individuals sent by the island at each migration.
+        :type __nbMigrants: int
+        :ivar __migrantSelection: How the emigrants are chosen (see POSSIBLE_MIGRANT_SELECTIONS).
+        :type __migrantSelection: str
+        :ivar __startTime: The start time of the evolution of the island.
+        :type __startTime: float
+        :ivar __nbImmigrants: The number of individuals received by the island.
+        :type __nbImmigrants: int
+    """
+
+    # Emigrants: the best individuals of the island, or random individuals
+    POSSIBLE_MIGRANT_SELECTIONS = ['BEST', 'RANDOM']
+
+    # ==================
+    # v Public methods v
+    # ==================
+
+    def __init__(self, connection, migrationInterval, nbMigrants, migrantSelection):
+        """
+        Constructor of the migration.
+
+        :param connection: The connection to the coordinator.
+        :type connection: multiprocessing Connection
+        :param migrationInterval: The number of generations between two migrations.
+        :type migrationInterval: int
+        :param nbMigrants: The number of individuals sent by the island at each migration.
+        :type nbMigrants: int
+        :param migrantSelection: How the emigrants are chosen (see POSSIBLE_MIGRANT_SELECTIONS).
+        :type migrantSelection: str
+        """
+        self.__connection = connection
+        self.__migrationInterval = migrationInterval
+        self.__nbMigrants = nbMigrants
+        self.__migrantSelection = migrantSelection.upper()
+        self.__startTime = time()
+        self.__nbImmigrants = 0
+
+    def getNbImmigrants(self):
+        """Get the number of individuals received by the island."""
+        return self.__nbImmigrants
+
+    def migrate(self, population, iGeneration, infoStr):
+        """
+        /!\ MAY ONLY BE CALLED BY PYGA_GenAlg /!\
+
+        Exchange individuals with the other islands if it is a migration generation.
+        The population is modified in place.
+
+        :param population: The current population (evaluated).
+        :type population: Derived from PYGA_Population
+        :param iGeneration: The current generation number.
+        :type iGeneration: int
+        :param infoStr: The log string to concatenate.
+        :type infoStr: str
+        """
+        if (iGeneration + 1) % self.__migrationInterval != 0 or population.size() == 0:
+            return
+        individualClass = population[0].__class__
+        bestFitness = None
+        if not individualClass.MULTI_OBJ:
+            bestFitness = population.getBestIndividual().getFitness()
+        # 1- Send the emigrants (copies: they are pickled) and wait for the immigrants
+        emigrants = self.__getEmigrants(population)
+        self.__connection.send([MIGRANTS_MSG, [emigrants, [iGeneration + 1, bestFitness, time() - self.__startTime]]])
+        immigrants = self.__connection.recv()
+        # 2- The immigrants replace the worst individuals
+        if len(immigrants) == 0:
+            return
+        for individual in self.__getWorstIndividuals(population, len(immigrants)):
+            population.removeIndividual(individual)
+        for individual in immigrants:
+            population.addIndividual(individual)
+        self.__nbImmigrants += len(immigrants)
+        if individualClass.MULTI_OBJ:
+            individualClass.computeMultiObjFitness(population)
+
+    # ==================
+    # ^ Public methods ^
+    # ==================
+
+    # ===================
+    # v Private methods v
+    # ===================
+
+    def __getEmigrants(self, population):
+        """
+        Choose the individuals to send to the other islands.
+
+        :param population: The current population (evaluated).
+        :type population: Derived from PYGA_Population
+        :return: The emigrants.
+        :rtype: list
+        """
+        nbMigrants = min(self.__nbMigrants, population.size())
+        if self.__migrantSelection == 'RANDOM':
+            return sample(list(population), nbMigrants)
+        if population[0].MULTI_OBJ:
+            # No order in the best individuals (Pareto front)
+            front = population.getBestIndividual()
+            return sample(list(front), min(nbMigrants, len(front)))
+        return self.__sortIndividuals(population)[:nbMigrants]
+
+    def __getWorstIndividuals(self, population, nbIndividuals):
+        """
+        Get the individuals to replace by the immigrants.
+
+        :param population: The current population.
+        :type population: Derived from PYGA_Population
+        :param nbIndividuals: The number of immigrants.
+        :type nbIndividuals: int
+        :return: The worst individuals (random individuals out of the Pareto front for
+                 a multi objective population).
+        :rtype: list
+        """
+        nbIndividuals = min(nbIndividuals, population.size())
+        if population[0].MULTI_OBJ:
+            front = population.getBestIndividual()
+            others = [individual for individual in population
+                      if not any(individual is frontIndividual for frontIndividual in front)]
+            if len(others) < nbIndividuals:
+                others = list(population)
+            return sample(others, nbIndividuals)
+        return self.__sortIndividuals(population)[population.size() - nbIndividuals:]
+
+    @staticmethod
+    def __sortIndividuals(population):
+        """
+        Sort the individuals of a single objective population, the best first.
+
+        :param population: The population.
+        :type population: Derived from PYGA_Population
+        :return: The sorted individuals.
+        :rtype: list
+        """
+        def compare(individual1, individual2):
+            if individual1.isBetter(individual2, population):
+                return -1
+            if individual2.isBetter(individual1, population):
+                return 1
+            return 0
+        return sorted(population, key=cmp_to_key(compare))
+
+    # ===================
+    # ^ Private methods ^
+    # ===================
@@ -20,6 +20,12 @@ Global:
 **** 06/10/2016 ****
 - Docstring
 TODO: complete the list
+**** 18/10/2026 ****
+- Evaluation through the evaluator of the run (PYGA_Evaluator)
+- Parsed population evaluated through the evaluator of the run
+- Quorum evaluation: the individuals still evaluated join a later generation
+- Initial population generated by the evaluation engine (parallel generation, duplicates filtered afterwards)
+- Quorum evaluation of the offspring only: the population keeps its size (parents in place of unfinished offspring)
 
 TODO List:
 -
@@ -27,7 +33,6 @@ TODO List:
 # - Build-in imports -
 from os.path import isfile
 from random import sample
-from multiprocessing import Pipe
 from sys import version_info
 
 # - Local imports -
@@ -43,7 +48,7 @@ __copyright__ = "Copyright 2016, Raphaël Deau"
 __license__ = "Creative Commons Attribution Non-commercial 4.0"
 __version__ = "1.0.0"
 __since__ = "18/07/2011"
-__date__ = "06/10/2016"
+__date__ = "18/10/2026"
 
 
 class PYGA_Population:
@@ -102,26 +107,71 @@ class PYGA_Population:
         self.__uncaughtIndividuals = []
         while len(self.__individuals) < nbIndividuals:
             newInd = self.__individualClass.generate()
-            add= True
-            if noDuplication:
-                i = 0
-                while add and i < len(self.__individuals):
-                    indiv = self.__individuals[i]
-                    if newInd.isDuplication(indiv):
-                        add=False
-                    i += 1
-            if add:
-                self.__uncaughtIndividuals.append(newInd)
-                self.__individuals.append(newInd)
-                infoStr2 = infoStr + ' Initialisation: ' + str(len(self.__individuals)) + '/'+str(nbIndividuals)+' generated.'
-                self.__printMethod(infoStr2)
+            self.__addGeneratedIndividual(newInd, nbIndividuals, noDuplication, infoStr)
+
+    def __generateInitPopParallel(self, nbIndividuals, noDuplication=False, evaluate=False, infoStr=''):
+        """
+        Generates the initial population with the evaluation engine of the run
+        (see PYGA_Evaluator.generateIndividuals): the individuals are generated in
+        the workers, then the duplicates are filtered in this process, and
+        generated again.
+
+        :param nbIndividuals: The number of individual to create.
+        :type nbIndividuals: int
+        :param noDuplication: Whether individuals can be duplicated or not.
+        :type noDuplication: bool
+        :param evaluate: Whether individuals are evaluated in the worker generating them.
+        :type evaluate: bool
+        :param infoStr: The log string to concatenate.
+        :type infoStr: str
+        """
+        self.__individuals = []
+        self.__uncaughtIndividuals = []
+        evaluator = self.__behaviorInstance.getEvaluator()
+        while len(self.__individuals) < nbIndividuals:
+            for newInd in evaluator.generateIndividuals(self, nbIndividuals - len(self.__individuals), evaluate):
+                self.__addGeneratedIndividual(newInd, nbIndividuals, noDuplication, infoStr)
+
+    def __addGeneratedIndividual(self, newInd, nbIndividuals, noDuplication, infoStr):
+        """
+        Adds a generated individual to the initial population, unless it is a duplicate.
+
+        :param newInd: The generated individual.
+        :type newInd: Derived from PYGA_Individual
+        :param nbIndividuals: The number of individual to create.
+        :type nbIndividuals: int
+        :param noDuplication: Whether individuals can be duplicated or not.
+        :type noDuplication: bool
+        :param infoStr: The log string to concatenate.
+        :type infoStr: str
+        """
+        add= True
+        if noDuplication:
+            i = 0
+            while add and i < len(self.__individuals):
+                indiv = self.__individuals[i]
+                if newInd.isDuplication(indiv):
+                    add=False
+                i += 1
+        if add:
+            self.__uncaughtIndividuals.append(newInd)
+            self.__individuals.append(newInd)
+            infoStr2 = infoStr + ' Initialisation: ' + str(len(self.__individuals)) + '/'+str(nbIndividuals)+' generated.'
+            self.__printMethod(infoStr2)
 
     # ----------------------
     # Public - Generate initial population
     def generateInitPop(self, nbIndividuals, noDuplication=False, 
-                        maxProcess=1, infoStr=''):
-        #TODO: multiprocess
-        self.__generateInitPop(nbIndividuals, noDuplication, infoStr)
+                        maxProcess=1, infoStr='', evaluate=False):
+        """
+        Generates the initial population: in this process, or by the evaluation engine
+        of the run with parallel evaluation (maxProcess not 1), each individual being
+        evaluated at once in its worker if evaluate is True.
+        """
+        if maxProcess == 1:
+            self.__generateInitPop(nbIndividuals, noDuplication, infoStr)
+        else:
+            self.__generateInitPopParallel(nbIndividuals, noDuplication, evaluate, infoStr)
     # Public - End of Generate initial population
     # ----------------------
 
@@ -196,11 +246,15 @@ class PYGA_Population:
     
     def parsePopulation(self, population):
         # TODO: Check pop size
+        indivToComp = []
         for indiv in population:
             indiv, setFitness = self.__individualClass.parseIndividual(indiv)
             self.addIndividual(indiv)
-            if setFitness:
-                indiv.computeObjectives(self)
+            if setFitness and indiv.needCompute():
+                indivToComp.append([self.size() - 1, indiv])
+        # Compute the asked fitness with the evaluator of the run
+        for _ in self.__behaviorInstance.getEvaluator().computeObjectives(self, indivToComp):
+            pass
     
     # ----------------------
     # Public - Duplicate
@@ -361,101 +415,121 @@ class PYGA_Population:
     
     # ----------------------
     # Public - Compute the objective of all individuals
-    def computeObjectives(self, infoStr):
-        nbIndivToComp = 0
-        for indiv in self.__individuals:
+    def computeObjectives(self, infoStr, previousPopulation=None):
+        # 1- Get the individuals to compute
+        indivToComp = []
+        for indivID, indiv in enumerate(self.__individuals):
             if indiv.needCompute():
-                nbIndivToComp += 1
-        # 1- Non parallel computing
-        if self.__behaviorInstance.getParam(self.__behaviorInstance.MAX_PROCESS_LABEL) == 1:
-            nbIndivEvaluated = 0
-            for indiv in self.__individuals:
-                infoStr2 = infoStr + ' Evaluated individuals: ' + str(nbIndivEvaluated) + '/' + str(nbIndivToComp)
-                self.__printMethod(infoStr2)
-                if indiv.computeObjectives(self):
-                    nbIndivEvaluated += 1
-                infoStr2 = infoStr + ' Evaluated individuals: ' + str(nbIndivEvaluated) + '/' + str(nbIndivToComp)
-                self.__printMethod(infoStr2)
-        # 2- Parallel computing
+                indivToComp.append([indivID, indiv])
+        nbIndivToComp = len(indivToComp)
+        # 2- Launch the evaluation (serial or parallel according to the evaluator)
+        # -- In quorum mode (offspring of a parent population only), the generation goes on before
+        # -- the end of the evaluation: the individuals still evaluated are removed, and join a later
+        # -- population in place of parents (see __replaceUnfinished)
+        evaluator = self.__behaviorInstance.getEvaluator()
+        quorum = self.__behaviorInstance.getParam(self.__behaviorInstance.EVAL_QUORUM_LABEL)
+        deadline = self.__behaviorInstance.getParam(self.__behaviorInstance.EVAL_QUORUM_DEADLINE_LABEL)
+        quorumMode = previousPopulation is not None and (quorum < 100 or deadline > 0)
+        if quorumMode:
+            evaluations = evaluator.computeObjectivesQuorum(self, indivToComp, quorum, deadline)
         else:
-            # 2.1- Store process list and pipes
-            processList = []
-            parentPipe = []
-            # 2.2- Get max simultaneous process
-            max_proc = self.__behaviorInstance.getParam(self.__behaviorInstance.MAX_PROCESS_LABEL)
-            # 2.3- Treat each individual
-            nbIndivLaunched = 0
-            nbIndivDone = 0
-            for indivID, indiv in enumerate(self.__individuals):
-                # 2.3.1- Create a specific pipe for this individual
-                pipe_parent, pipe_child = Pipe(False)
-                parentPipe.append(pipe_parent)
-                # 2.3.2- If simultaneous process are limited and reached, wait...
-                while max_proc != 0 and len(processList) == max_proc:
-                    i = 0
-                    while i < len(processList):
-                        if not self.__checkProcessEnd(i, parentPipe, processList):
-                            i += 1
-                        else:
-                            nbIndivDone += 1
-                # 2.3.3- A new computation can be launched simultaneously with others
-                if indiv.computeObjectives(self, processList, pipe_child, indivID):
-                    nbIndivLaunched += 1
-                infoStr2 = infoStr + ' Evaluating individuals: ' + str(nbIndivLaunched) + '/' + str(nbIndivToComp) + ' launched, '
-                infoStr3 = infoStr2 + str(nbIndivDone) + ' Done.    '
-                self.__printMethod(infoStr3)
-
-            # 2.4- Wait for computing obectives
-            i = 0
-            infoStr3 = infoStr2 + str(nbIndivDone) + ' Done.     '
-            self.__printMethod(infoStr3)
-            while len(processList) > 0:
-                if not self.__checkProcessEnd(i, parentPipe, processList):
-                    i += 1
-                else:
-                    nbIndivDone += 1
-                    infoStr3 = infoStr2 + str(nbIndivDone) + ' Done.    '
-                    self.__printMethod(infoStr3)
-                if i != 0:
-                    i %= len(processList)
+            evaluations = evaluator.computeObjectives(self, indivToComp)
+        nbIndivEvaluated = 0
+        computedIDs = set()
+        joinedIndividuals = []
+        infoStr2 = infoStr + ' Evaluated individuals: ' + str(nbIndivEvaluated) + '/' + str(nbIndivToComp)
+        self.__printMethod(infoStr2)
+        for indivID, indiv in evaluations:
+            if indivID is None:
+                # Individual of a previous generation
+                joinedIndividuals.append(indiv)
+                continue
+            computedIDs.add(indivID)
+            nbIndivEvaluated += 1
+            infoStr2 = infoStr + ' Evaluated individuals: ' + str(nbIndivEvaluated) + '/' + str(nbIndivToComp)
+            self.__printMethod(infoStr2)
+        if quorumMode:
+            unfinishedIndividuals = [indiv for indivID, indiv in indivToComp if indivID not in computedIDs]
+            joinedIndividuals = self.__replaceUnfinished(unfinishedIndividuals, joinedIndividuals, previousPopulation)
+            self.__printMethod(infoStr2 + ' (' + str(len(unfinishedIndividuals)) + ' still evaluated, ' +
+                               str(len(joinedIndividuals)) + ' joined)')
 
         # 3- For multi obj, call fitness function (obj have been computed)
         if self.__individualClass.MULTI_OBJ:
             self.__individualClass.computeMultiObjFitness(self)
-        return nbIndivToComp
-    # Public - End of Get bet individual
+        return nbIndivEvaluated + len(joinedIndividuals)
+    # Public - End of Compute the objective of all individuals
     # ----------------------
 
     # ==================
     # ^ Public methods ^
     # ==================
 
-    # =====================
-    # v Specifics methods v
-    # =====================
-
-    def __checkProcessEnd(self, processNum, parentPipe, processList):
-        terminated = False
-        # poll() check if any data is available in the pipe
-        if parentPipe[processNum].poll():
-            # Get the new individual (with computed objectives)
-            try:
-                [indiv, indivId] = parentPipe[processNum].recv()
-                self.__individuals[indivId] = indiv
-            except:
-                pass
-            # Close pipe and process
-            parentPipe[processNum].close()
-            parentPipe.pop(processNum)
-            proc = processList[processNum]
-            proc.join()
-            processList.pop(processNum)
-            terminated = True
-
-        return terminated
-    # =====================
-    # ^ Specifics methods ^
-    # =====================
+    # ===================
+    # v Private methods v
+    # ===================
+
+    # ----------------------
+    # Private - Replace the unfinished individuals (quorum mode)
+    def __replaceUnfinished(self, unfinishedIndividuals, joinedIndividuals, previousPopulation):
+        """
+        Keep the size of the population in quorum mode: the individuals still evaluated
+        are replaced by the joined individuals of the previous generations, then by the
+        best parents not in the population. The joined individuals having no place are
+        postponed to the next generation (see PYGA_Evaluator.postponeIndividuals).
+
+        :param unfinishedIndividuals: The individuals still evaluated (removed).
+        :type unfinishedIndividuals: list
+        :param joinedIndividuals: The computed individuals of the previous generations.
+        :type joinedIndividuals: list
+        :param previousPopulation: The population of the previous generation (evaluated).
+        :type previousPopulation: subclass of PYGA_Population
+        :return: The joined individuals added to the population.
+        :rtype: list
+        """
+        for indiv in unfinishedIndividuals:
+            self.removeIndividual(indiv)
+        nbPlaces = len(unfinishedIndividuals)
+        self.__behaviorInstance.getEvaluator().postponeIndividuals(joinedIndividuals[nbPlaces:])
+        joinedIndividuals = joinedIndividuals[:nbPlaces]
+        for indiv in joinedIndividuals:
+            self.addIndividual(indiv)
+        nbPlaces -= len(joinedIndividuals)
+        if nbPlaces > 0:
+            if self.__individualClass.MULTI_OBJ:
+                # No order in the parents out of the Pareto front
+                parents = list(previousPopulation)
+            else:
+                parents = previousPopulation.getBestIndividual(previousPopulation.size())
+            parents = [parent for parent in parents if not any(parent is indiv for indiv in self.__individuals)]
+            for parent in parents[:nbPlaces]:
+                self.addIndividual(parent)
+        return joinedIndividuals
+    # Private - End of Replace the unfinished individuals (quorum mode)
+    # ----------------------
+
+    # ===================
+    # ^ Private methods ^
+    # ===================
+
+    # ==============
+    # v Pickling v
+    # ==============
+
+    # ----------------------
+    # Get state to pickle
+    def __getstate__(self):
+        # The behavior and the print method stay in the main process
+        # (a population sent to a worker is only read by the fitness)
+        state = self.__dict__.copy()
+        state['_PYGA_Population__behaviorInstance'] = None
+        state['_PYGA_Population__printMethod'] = None
+        return state
+    # ----------------------
+
+    # ==============
+    # ^ Pickling ^
+    # ==============
 
     # =========================
     # v Operators overloading v
@@ -0,0 +1,602 @@
+# -*- coding: utf-8 -*-
+"""
+Python Genetic Algorithm module.
+
+This file contains the multiprocess evaluation engine of the GA: PYGA_ProcessEvaluator.
+It keeps a pool of worker processes alive during the whole run and sends them
+the individuals to evaluate.
+
+License full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+
+
+
+Modification History:
+**** 18/10/2026 ****
+Creation
+- Results collected as soon as any worker ends (no busy wait)
+- Individuals sent to the workers by chunks
+- Workers send back the evaluation results only (not the individuals)
+- Evaluation context sent once to each worker (not with each chunk)
+- Workers initialised once at start (PYGA_Individual.initWorker)
+- Evaluation timeout: late workers killed and replaced
+- Dead workers detected and replaced, failed evaluations retried
+- Individuals added while evaluating (see launchQueue)
+- Wake up time, running evaluations abandoned when the evaluation is closed
+- Longest evaluations first: durations measured by individual, chunks balanced by cost
+- Automatic mode (max_process=0): number of workers tuned on the first evaluation, serial evaluation
+  when the parallelism does not pay
+- Generation of new individuals in the worker processes (see PYGA_Evaluator.generateIndividuals)
+- Genomes sent in shared memory (shared_genomes parameter, see PYGA_SharedGenomes), results still pickled
+
+TODO List:
+-
+"""
+# - Build-in imports -
+from collections import deque
+from math import ceil
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import wait
+from multiprocessing.reduction import ForkingPickler
+from time import time
+from traceback import format_exc
+
+# - Local imports -
+from PyGenAlg.core.PYGA_Evaluator import PYGA_Evaluator, getNbAvailableCpus, evaluateChunk, generateChunk, launchQueue
+from PyGenAlg.core.PYGA_Evaluator import CRASH_FAILURE, ERROR_FAILURE, TIMEOUT_FAILURE
+from PyGenAlg.core.PYGA_Exceptions import PYGA_PopulationError
+from PyGenAlg.core.PYGA_SharedGenomes import PYGA_SharedGenomes, attachChunk
+
+# Meta information
+__author__ = "Raphaël Deau"
+__copyright__ = "Copyright 2016, Raphaël Deau"
+__license__ = "Creative Commons Attribution Non-commercial 4.0"
+__version__ = "1.0.0"
+__since__ = "18/10/2026"
+__date__ = "18/10/2026"
+
+# Types of the messages sent to the workers
+CONTEXT_MSG = 0
+CHUNK_MSG = 1
+GENERATE_MSG = 2
+
+
+def _workerLoop(connection, individualClass):
+    """
+    Main loop of a worker process.
+
+    Initialise the worker (see PYGA_Individual.initWorker), then receive
+    [messageType, data] from the connection:
+        - CONTEXT_MSG: data is the evaluation context, kept for the next chunks
+          (see PYGA_Individual.getEvaluationContext).
+        - CHUNK_MSG: data is a list of [indivID, individual] (or of genomes in shared
+          memory, see attachChunk). Compute the objectives of the whole chunk and
+          send back [results, error] in one message:
+            * results: a list of [indivID, evaluation result, evaluation duration]
+              (see PYGA_Individual.getEvaluationResult)
+            * error: None if the computations succeeded, the formatted traceback otherwise.
+        - GENERATE_MSG: data is [nbIndividuals, evaluate, seed]. Generate the individuals
+          (see generateChunk) and send back [[individuals, evaluation error], error].
+    Stops when None is received.
+
+    :param connection: The connection to the parent process.
+    :type connection: multiprocessing Connection
+    :param individualClass: The individual class to evaluate.
+    :type individualClass: type derived from PYGA_Individual
+    """
+    initError = None
+    try:
+        individualClass.SET_WORKER_STATE(individualClass.initWorker())
+    except Exception:
+        initError = format_exc()
+    context = None
+    # Shared memory blocks of the genomes, by name (see PYGA_SharedGenomes)
+    attachedBlocks = {}
+    chunk = None
+    while True:
+        message = connection.recv()
+        if message is None:
+            break
+        messageType, data = message
+        if messageType == CONTEXT_MSG:
+            context = data
+            continue
+        if initError is not None:
+            connection.send([[], initError])
+            continue
+        try:
+            if messageType == GENERATE_MSG:
+                connection.send([generateChunk(individualClass, context, *data), None])
+            else:
+                chunk = attachChunk(individualClass, data, attachedBlocks)
+                connection.send([evaluateChunk(individualClass, context, chunk), None])
+        except Exception:
+            connection.send([[], format_exc()])
+        # The genome views are only valid during the evaluation (a block cannot be closed while they exist)
+        chunk = None
+    for block in attachedBlocks.values():
+        block.close()
+    connection.close()
+
+
+class PYGA_ProcessEvaluator(PYGA_Evaluator):
+    """
+    Evaluation engine using a persistent pool of worker processes.
+
+    The workers are created by start() and stopped by stop(): they are reused
+    for all evaluations of the run.
+    The evaluation context of the population is sent once to each worker, then
+    the individuals are sent by chunks, each worker returning the results of a
+    whole chunk in one message (see PYGA_Evaluator.getChunkSize for the automatic
+    chunk size).
+    A worker late on its chunk (evaluation timeout) is killed and replaced, so is
+    a dead worker (crash, killed by the system...): the parent process waits for
+    the results and for the end of the busy workers at once. The failed chunks
+    are given to PYGA_Evaluator.failTask (launched again, or penalised).
+
+    With shared genomes (see PYGA_Individual.getGenomeBuffer), the genome of each
+    sent individual is copied in a shared memory slot instead of being pickled (at
+    each send): the workers build their individuals from the slots (see
+    PYGA_SharedGenomes). The results are still pickled and sent back through the pipes.
+
+    The communication overhead of each chunk (round trip time minus evaluation
+    durations) is measured, so that the automatic chunks last long enough to
+    amortize it (see PYGA_Evaluator.getChunkDuration).
+    New individuals may be generated by the workers (see PYGA_Evaluator.generateIndividuals):
+    a generation task of a dead worker is launched again (up to the number of retries),
+    a failed generation stops the run (there is no timeout).
+
+    In automatic mode (no number of worker processes given), one worker is started
+    by available CPU (see getNbAvailableCpus), then the first complete evaluation
+    measures the speedup of the pool (evaluation durations / evaluation time):
+        - lower than AUTO_MIN_SPEEDUP: the evaluations are too short for the
+          communications, the workers are stopped and the next evaluations are
+          computed in the main process (unless there is an evaluation timeout),
+        - otherwise the workers waiting for the main process (or for individuals)
+          are stopped: the speedup plus one are kept.
+    The mean evaluation duration of each next complete evaluation is compared to the
+    one of the measure: beyond AUTO_RETUNE_DRIFT times longer or shorter, all the workers
+    are started again and the next complete evaluation measures the speedup again.
+
+    Attributes:
+        :ivar __maxProcess: The number of worker processes (0 for automatic).
+        :type __maxProcess: int
+        :ivar __nbWorkers: The number of worker processes to run.
+        :type __nbWorkers: int
+        :ivar __chunkSize: The number of individuals sent at once to a worker (0 for automatic).
+        :type __chunkSize: int
+        :ivar __workers: The worker processes and their connections, as [process, connection].
+        :type __workers: list
+        :ivar __sharedGenomes: The shared memory blocks of the genomes (None if the genomes are pickled).
+        :type __sharedGenomes: PYGA_SharedGenomes
+        :ivar __autoSpeedup: The speedup measured in automatic mode, as [number of workers, speedup]
+                             (None if not measured yet).
+        :type __autoSpeedup: list
+        :ivar __autoEvalDuration: The mean evaluation duration when the speedup was measured (seconds).
+        :type __autoEvalDuration: float
+        :ivar __nbAutoTunes: The number of speedup measures in automatic mode.
+        :type __nbAutoTunes: int
+        :ivar __serial: True if the evaluations are computed in the main process (automatic mode).
+        :type __serial: bool
+    """
+
+    # Minimum speedup of the worker processes in automatic mode (serial evaluation otherwise)
+    AUTO_MIN_SPEEDUP = 1.5
+    # Ratio of the mean evaluation duration to the measured one from which the speedup is measured again
+    AUTO_RETUNE_DRIFT = 2.0
+    # ==================
+    # v Public methods v
+    # ==================
+
+    def __init__(self, individualClass, printMethod, maxProcess, chunkSize=0, sharedGenomes=False):
+        """
+        Constructor of the process evaluator.
+
+        :param individualClass: The individual class to evaluate.
+        :type individualClass: type derived from PYGA_Individual
+        :param printMethod: The method to call to print logs.
+        :type printMethod: Python method
+        :param maxProcess: The number of worker processes (0 for automatic).
+        :type maxProcess: int
+        :param chunkSize: The number of individuals sent at once to a worker (0 for automatic).
+        :type chunkSize: int
+        :param sharedGenomes: True to send the genomes in shared memory (only if the individual class
+                              gives its genome buffer, see PYGA_Individual.hasGenomeBuffer).
+        :type sharedGenomes: bool
+        """
+        PYGA_Evaluator.__init__(self, individualClass, printMethod)
+        self.__maxProcess = maxProcess
+        self.__nbWorkers = maxProcess
+        if maxProcess == 0:
+            self.__nbWorkers = getNbAvailableCpus()
+        self.__chunkSize = chunkSize
+        self.__workers = []
+        self.__sharedGenomes = None
+        if sharedGenomes and individualClass.hasGenomeBuffer():
+            self.__sharedGenomes = PYGA_SharedGenomes()
+        self.__autoSpeedup = None
+        self.__autoEvalDuration = 0.0
+        self.__nbAutoTunes = 0
+        self.__serial = False
+
+    def getNbWorkers(self):
+        """Get the number of worker processes (1 when the evaluations are computed in the main process)."""
+        if self.__serial:
+            return 1
+        return self.__nbWorkers
+
+    def start(self):
+        """Start the worker processes (each one calls PYGA_Individual.initWorker)."""
+        if self.__serial:
+            PYGA_Evaluator.start(self)
+            return
+        while len(self.__workers) < self.__nbWorkers:
+            self.__workers.append(self.__startWorker())
+        self.printLog("PYGA_ProcessEvaluator / start - " + str(self.__nbWorkers) + " workers started\n", debug=True)
+
+    def stop(self):
+        """Stop the worker processes."""
+        self.__stopWorkers(self.__workers)
+        if self.__sharedGenomes is not None:
+            self.__sharedGenomes.close()
+        if self.__serial:
+            PYGA_Evaluator.stop(self)
+
+    def getPrintInformation(self):
+        """Get the result of the automatic mode and of the shared genomes, as printed at the end of the run."""
+        infoStr = ""
+        if self.__autoSpeedup is not None:
+            if self.__serial:
+                workersStr = "serial evaluation"
+            else:
+                workersStr = str(self.__nbWorkers) + " worker processes"
+            nbMeasured, speedup = self.__autoSpeedup
+            infoStr += ("Automatic parallelization: " + workersStr + " (speedup of " + str(nbMeasured) +
+                        " worker processes: " + str(round(speedup, 2)) + ", measured " +
+                        str(self.__nbAutoTunes) + " times)\n")
+        if self.__sharedGenomes is not None:
+            infoStr += self.__sharedGenomes.getPrintInformation()
+        return infoStr
+
+    def generate(self, context, nbIndividuals, evaluate):
+        """
+        Generate new individuals in the worker processes.
+        See PYGA_Evaluator.generate.
+        """
+        if self.__serial:
+            for individual in PYGA_Evaluator.generate(self, context, nbIndividuals, evaluate):
+                yield individual
+            return
+        if len(self.__workers) == 0:
+            self.start()
+        for worker in [worker for worker in self.__workers if not worker[0].is_alive()]:
+            self.__replaceWorker(worker, None)
+        contextMsg = None
+        if evaluate:
+            contextMsg = ForkingPickler.dumps([CONTEXT_MSG, context])
+            for _, connection in self.__workers:
+                connection.send_bytes(contextMsg)
+        toLaunch = self.splitGeneration(nbIndividuals, len(self.__workers))
+        # Individuals of the tasks done before a previous task (yielded in the order of the tasks)
+        doneTasks = {}
+        nextTask = 0
+        nbFailures = 0
+        idleWorkers = list(self.__workers)
+        busyWorkers = {}
+        try:
+            while len(toLaunch) > 0 or len(busyWorkers) > 0:
+                # 1- Give a generation task to each idle worker
+                while len(toLaunch) > 0 and len(idleWorkers) > 0:
+                    task = toLaunch.popleft()
+                    _, nbToGenerate, seed = task
+                    worker = idleWorkers.pop()
+                    try:
+                        worker[1].send([GENERATE_MSG, [nbToGenerate, evaluate, seed]])
+                    except (IOError, OSError):
+                        worker = self.__replaceWorker(worker, contextMsg)
+                        worker[1].send([GENERATE_MSG, [nbToGenerate, evaluate, seed]])
+                    busyWorkers[worker[1]] = [worker, task]
+                # 2- Sleep until at least one worker has sent its individuals or is dead
+                waitedObjects = {}
+                for connection, busy in busyWorkers.items():
+                    waitedObjects[connection] = connection
+                    waitedObjects[busy[0][0].sentinel] = connection
+                for connection in set(waitedObjects[obj] for obj in wait(list(waitedObjects.keys()))):
+                    worker, task = busyWorkers.pop(connection)
+                    try:
+                        generated, error = connection.recv()
+                    except (EOFError, IOError, OSError):
+                        # 3- Replace the dead workers, and launch their task again
+                        proc = worker[0]
+                        proc.join()
+                        idleWorkers.append(self.__replaceWorker(worker, contextMsg))
+                        nbFailures += 1
+                        if nbFailures > self.getMaxRetry():
+                            raise PYGA_PopulationError("ERROR: generation of individuals failed (worker process " +
+                                                       str(proc.pid) + " died, exit code " + str(proc.exitcode) + ')')
+                        toLaunch.append(task)
+                        continue
+                    idleWorkers.append(worker)
+                    if error is not None:
+                        raise PYGA_PopulationError("ERROR: generation of individuals failed:\n" + error)
+                    individuals, evaluationError = generated
+                    if evaluationError is not None:
+                        self.failGeneration(evaluationError)
+                    doneTasks[task[0]] = individuals
+                    while nextTask in doneTasks:
+                        for individual in doneTasks.pop(nextTask):
+                            yield individual
+                        nextTask += 1
+        finally:
+            # Generation closed by the caller (or failed): the running tasks are abandoned
+            for worker, _ in busyWorkers.values():
+                worker[0].kill()
+                worker[0].join()
+
+    def evaluate(self, population, individuals):
+        """
+        Compute the objectives of the given individuals in the worker processes.
+        See PYGA_Evaluator.evaluate.
+        """
+        if self.__serial:
+            # (evaluation time measured without the time spent by the caller between two individuals)
+            evalTimeSum = 0.0
+            nbMeasured = 0
+            resumeTime = time()
+            for indivID, individual in PYGA_Evaluator.evaluate(self, population, individuals):
+                evalTimeSum += time() - resumeTime
+                nbMeasured += 1
+                yield indivID, individual
+                resumeTime = time()
+            if nbMeasured > 1:
+                self.__autoMeasure(None, evalTimeSum / nbMeasured)
+            return
+        if len(self.__workers) == 0:
+            self.start()
+        # Replace the workers dead since the last evaluation
+        for worker in [worker for worker in self.__workers if not worker[0].is_alive()]:
+            self.__replaceWorker(worker, None)
+        # Send the evaluation context once to each worker (pickled only once)
+        contextVersion, context = self.getEvaluationContext(population)
+        contextMsg = ForkingPickler.dumps([CONTEXT_MSG, context])
+        for _, connection in self.__workers:
+            connection.send_bytes(contextMsg)
+        # Workers having the current context, by connection
+        contextConnections = set(connection for _, connection in self.__workers)
+        timeout = self.getEvaluationTimeout()
+        toLaunch = launchQueue(individuals)
+        # Individuals of failed chunks, to send one by one
+        toLaunchAlone = deque()
+        idleWorkers = list(self.__workers)
+        # Measures of the automatic mode
+        startTime = time()
+        evalTimeSum = 0.0
+        nbMeasured = 0
+        # Busy workers, by connection (the parent blocks on all of them at once)
+        busyWorkers = {}
+        try:
+            while len(toLaunch) > 0 or len(toLaunchAlone) > 0 or len(busyWorkers) > 0:
+                # (the context given since the beginning of the evaluation, sent before the next chunk
+                # of each worker, see PYGA_Evaluator.getNewContext)
+                newContext = self.getNewContext(contextVersion)
+                if newContext is not None:
+                    contextVersion, context = newContext
+                    contextMsg = ForkingPickler.dumps([CONTEXT_MSG, context])
+                    contextConnections = set()
+                # 1- Give a chunk of individuals to each idle worker
+                while (len(toLaunch) > 0 or len(toLaunchAlone) > 0) and len(idleWorkers) > 0:
+                    if len(toLaunchAlone) > 0:
+                        chunk = [toLaunchAlone.popleft()]
+                    else:
+                        chunk = self.popChunk(toLaunch, self.__chunkSize, len(self.__workers))
+                    worker = idleWorkers.pop()
+                    # Genomes copied in shared memory, their slots are used until the results are received
+                    message = [CHUNK_MSG, chunk]
+                    slots = []
+                    if self.__sharedGenomes is not None:
+                        sharedChunk, slots = self.__sharedGenomes.share(chunk)
+                        message = [CHUNK_MSG, sharedChunk]
+                    try:
+                        if worker[1] not in contextConnections:
+                            worker[1].send_bytes(contextMsg)
+                        worker[1].send(message)
+                    except (IOError, OSError):
+                        # The worker died while idle
+                        worker = self.__replaceWorker(worker, contextMsg)
+                        worker[1].send(message)
+                    contextConnections.add(worker[1])
+                    sendTime = time()
+                    deadline = None
+                    if timeout > 0:
+                        deadline = sendTime + timeout * len(chunk)
+                    busyWorkers[worker[1]] = [worker, dict(chunk), deadline, sendTime, slots]
+                # 2- Sleep until at least one worker has sent its results, is dead or is late (or the wake up time)
+                waitTime = self.getWaitTime([busy[2] for busy in busyWorkers.values()])
+                # (the sentinel of a process is ready when it ends)
+                waitedObjects = {}
+                for connection, busy in busyWorkers.items():
+                    waitedObjects[connection] = connection
+                    waitedObjects[busy[0][0].sentinel] = connection
+                readyConnections = set(waitedObjects[obj] for obj in wait(list(waitedObjects.keys()), waitTime))
+                if len(readyConnections) == 0:
+                    # 3- Replace the late workers
+                    for connection in [connection for connection, busy in busyWorkers.items()
+                                       if busy[2] is not None and busy[2] <= time()]:
+                        worker, launched, _, _, slots = busyWorkers.pop(connection)
+                        self.__releaseSlots(slots)
+                        idleWorkers.append(self.__replaceWorker(worker, contextMsg))
+                        for indivID, individual in self.failTask(list(launched.items()), toLaunchAlone, TIMEOUT_FAILURE,
+                                                                 "timeout after " + str(timeout) + " seconds"):
+                            yield indivID, individual
+                for connection in readyConnections:
+                    worker, launched, _, sendTime, slots = busyWorkers.pop(connection)
+                    try:
+                        results, error = connection.recv()
+                    except (EOFError, IOError, OSError):
+                        # 4- Replace the dead workers
+                        proc = worker[0]
+                        proc.join()
+                        self.__releaseSlots(slots)
+                        idleWorkers.append(self.__replaceWorker(worker, contextMsg))
+                        for indivID, individual in self.failTask(list(launched.items()), toLaunchAlone, CRASH_FAILURE,
+                                                                 "worker process " + str(proc.pid) +
+                                                                 " died (exit code " + str(proc.exitcode) + ')'):
+                            yield indivID, individual
+                        continue
+                    idleWorkers.append(worker)
+                    self.__releaseSlots(slots)
+                    if error is not None:
+                        for indivID, individual in self.failTask(list(launched.items()), toLaunchAlone,
+                                                                 ERROR_FAILURE, error):
+                            yield indivID, individual
+                        continue
+                    chunkTime = sum(duration for _, _, duration in results)
+                    self.measureOverhead(time() - sendTime - chunkTime)
+                    evalTimeSum += chunkTime
+                    nbMeasured += len(results)
+                    for indivID, result, duration in results:
+                        # Set the result in the individual of this process
+                        individual = launched[indivID]
+                        self.measureEvaluation(duration, individual)
+                        individual.setEvaluationResult(result)
+                        yield indivID, individual
+                if self.isWakeUpTime():
+                    yield None, None
+            if self.__maxProcess == 0 and nbMeasured > 1:
+                self.__autoMeasure(evalTimeSum / max(time() - startTime, 1e-9), evalTimeSum / nbMeasured)
+        finally:
+            # Evaluation closed by the caller (or failed): the running chunks are abandoned
+            # (the killed workers are replaced at the next evaluation)
+            for worker, _, _, _, slots in busyWorkers.values():
+                worker[0].kill()
+                worker[0].join()
+                self.__releaseSlots(slots)
+
+    # ==================
+    # ^ Public methods ^
+    # ==================
+
+    # ===================
+    # v Private methods v
+    # ===================
+
+    def __autoMeasure(self, speedup, evalDuration):
+        """
+        Measure the speedup on the first complete evaluation, or once the mean evaluation
+        duration drifted since the last measure (automatic mode, see the class documentation).
+
+        :param speedup: The sum of the evaluation durations divided by the evaluation time
+                        (None for a serial evaluation).
+        :type speedup: float
+        :param evalDuration: The mean evaluation duration of the evaluation (seconds).
+        :type evalDuration: float
+        """
+        if self.__autoSpeedup is None:
+            self.__autoTune(speedup, evalDuration)
+            return
+        drift = evalDuration / max(self.__autoEvalDuration, 1e-9)
+        if 1.0 / self.AUTO_RETUNE_DRIFT <= drift <= self.AUTO_RETUNE_DRIFT:
+            return
+        # All the workers for the next measure
+        self.printLog("PYGA_ProcessEvaluator / autoMeasure - mean evaluation duration " + str(evalDuration) +
+                      " (" + str(self.__autoEvalDuration) + " when measured), speedup measured again\n", debug=True)
+        if self.__serial:
+            PYGA_Evaluator.stop(self)
+            self.__serial = False
+        self.__autoSpeedup = None
+        self.__nbWorkers = getNbAvailableCpus()
+        self.start()
+
+    def __autoTune(self, speedup, evalDuration):
+        """
+        Choose the number of worker processes from the speedup measured on a complete
+        evaluation with all the workers (automatic mode, see the class documentation).
+
+        :param speedup: The sum of the evaluation durations divided by the evaluation time.
+        :type speedup: float
+        :param evalDuration: The mean evaluation duration of the evaluation (seconds).
+        :type evalDuration: float
+        """
+        self.__autoSpeedup = [len(self.__workers), speedup]
+        self.__autoEvalDuration = evalDuration
+        self.__nbAutoTunes += 1
+        if speedup < self.AUTO_MIN_SPEEDUP and self.getEvaluationTimeout() == 0:
+            # The communications cost more than the evaluations: evaluate in the main process
+            self.__stopWorkers(self.__workers)
+            self.__serial = True
+            PYGA_Evaluator.start(self)
+        else:
+            nbWorkers = max(1, min(self.__nbWorkers, int(ceil(speedup)) + 1))
+            self.__stopWorkers(self.__workers[nbWorkers:])
+            self.__nbWorkers = nbWorkers
+        self.printLog("PYGA_ProcessEvaluator / autoTune - speedup " + str(speedup) + ", " +
+                      str(self.getNbWorkers()) + " workers kept (serial: " + str(self.__serial) + ")\n", debug=True)
+
+    def __releaseSlots(self, slots):
+        """
+        Free the shared memory slots of a chunk whose worker does not read them anymore.
+
+        :param slots: The slots used by the chunk (see PYGA_SharedGenomes.share).
+        :type slots: list
+        """
+        if self.__sharedGenomes is not None:
+            self.__sharedGenomes.release(slots)
+
+    def __stopWorkers(self, workers):
+        """
+        Stop idle worker processes.
+
+        :param workers: The workers to stop, as [process, connection].
+        :type workers: list
+        """
+        workers = list(workers)
+        for proc, connection in workers:
+            try:
+                connection.send(None)
+            except (IOError, OSError):
+                pass
+        for worker in workers:
+            proc, connection = worker
+            proc.join()
+            connection.close()
+            self.__workers.remove(worker)
+
+    def __startWorker(self):
+        """
+        Start a worker process.
+
+        :return: The worker, as [process, connection].
+        :rtype: list
+        """
+        parentConnection, childConnection = Pipe()
+        proc = Process(target=_workerLoop, args=(childConnection, self.getIndividualClass()))
+        proc.daemon = True
+        proc.start()
+        childConnection.close()
+        return [proc, parentConnection]
+
+    def __replaceWorker(self, worker, contextMsg):
+        """
+        Kill a worker process (if it is still alive) and start a new one instead.
+
+        :param worker: The worker to kill, as [process, connection].
+        :type worker: list
+        :param contextMsg: The pickled context message of the current evaluation (None if not evaluating).
+        :type contextMsg: bytes
+        :return: The new worker, as [process, connection].
+        :rtype: list
+        """
+        proc, connection = worker
+        if proc.is_alive():
+            proc.kill()
+        proc.join()
+        connection.close()
+        newWorker = self.__startWorker()
+        if contextMsg is not None:
+            newWorker[1].send_bytes(contextMsg)
+        self.__workers[self.__workers.index(worker)] = newWorker
+        self.printLog("PYGA_ProcessEvaluator / replaceWorker - worker " + str(proc.pid) + " replaced\n", debug=True)
+        return newWorker
+
+    # ===================
+    # ^ Private methods ^
+    # ===================
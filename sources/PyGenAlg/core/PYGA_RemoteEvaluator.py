@@ -0,0 +1,550 @@
+# -*- coding: utf-8 -*-
+"""
+Python Genetic Algorithm module.
+
+This file contains the remote evaluation engine of the GA: PYGA_RemoteEvaluator.
+The main process listens on a TCP address, the evaluation workers (runRemoteWorker)
+connect to it from any host, with an authentication key.
+
+License full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+
+
+
+Modification History:
+**** 18/10/2026 ****
+Creation
+
+TODO List:
+-
+"""
+# - Build-in imports -
+from collections import deque
+from multiprocessing import Pipe
+from multiprocessing.connection import Client, Listener, wait
+from pickle import dumps, HIGHEST_PROTOCOL
+from threading import Event, Lock, Thread
+from time import sleep, time
+from traceback import format_exc
+
+# - Local imports -
+from PyGenAlg.core.PYGA_Evaluator import PYGA_Evaluator, evaluateChunk, launchQueue
+from PyGenAlg.core.PYGA_Evaluator import CRASH_FAILURE, ERROR_FAILURE, TIMEOUT_FAILURE
+
+# Meta information
+__author__ = "Raphaël Deau"
+__copyright__ = "Copyright 2016, Raphaël Deau"
+__license__ = "Creative Commons Attribution Non-commercial 4.0"
+__version__ = "1.0.0"
+__since__ = "18/10/2026"
+__date__ = "18/10/2026"
+
+# Types of the messages sent to the workers
+INIT_MSG = 0
+CONTEXT_MSG = 1
+CHUNK_MSG = 2
+# Types of the messages sent by the workers
+RESULT_MSG = 3
+HEARTBEAT_MSG = 4
+
+# Time between two connection attempts of a worker (seconds)
+CONNECT_RETRY_PERIOD = 0.5
+
+
+def parseAddress(address):
+    """
+    Get the TCP address of the main process from a "host:port" string.
+
+    :param address: The address, as "host:port" (empty host for all the interfaces).
+    :type address: str
+    :return: The address, as (host, port).
+    :rtype: tuple
+    """
+    host, port = address.rsplit(':', 1)
+    return host, int(port)
+
+
+def runRemoteWorker(address, authkey, connectTimeout=30.0):
+    """
+    Run an evaluation worker for a PYGA_RemoteEvaluator: connect to the main process
+    (trying again until connectTimeout), then compute the chunks it sends.
+    The worker connects again when the connection is lost (network failure, chunk
+    abandoned by the main process...), and returns when the main process stops it
+    or cannot be reached anymore.
+
+    The individual class is received from the main process (pickled by reference):
+    its module must be importable by the worker.
+
+    :param address: The address of the main process, as (host, port) or "host:port".
+    :type address: tuple or str
+    :param authkey: The authentication key shared with the main process.
+    :type authkey: str or bytes
+    :param connectTimeout: The time to wait for the main process (seconds).
+    :type connectTimeout: float
+    :return: The number of chunks computed.
+    :rtype: int
+    """
+    if isinstance(address, str):
+        address = parseAddress(address)
+    if not isinstance(authkey, bytes):
+        authkey = authkey.encode()
+    nbChunks = 0
+    while True:
+        # 1- Connect to the main process
+        connection = None
+        endTime = time() + connectTimeout
+        while connection is None:
+            try:
+                connection = Client(address, authkey=authkey)
+            except (IOError, OSError, EOFError):
+                if time() >= endTime:
+                    return nbChunks
+                sleep(CONNECT_RETRY_PERIOD)
+        # 2- Compute the chunks
+        stopped, nbDone = _remoteWorkerSession(connection)
+        nbChunks += nbDone
+        if stopped:
+            return nbChunks
+
+
+def _remoteWorkerSession(connection):
+    """
+    Compute the chunks sent on a connection to the main process.
+
+    Receive [INIT_MSG, [individualClass, heartbeatPeriod]] first, initialise the
+    worker (see PYGA_Individual.initWorker) and send [HEARTBEAT_MSG, None] every
+    heartbeatPeriod from a thread, then receive [messageType, data]:
+        - CONTEXT_MSG: data is the evaluation context, kept for the next chunks.
+        - CHUNK_MSG: data is a list of [indivID, individual]. Send back
+          [RESULT_MSG, [results, error]] (see _workerLoop of PYGA_ProcessEvaluator).
+    Stops when None is received.
+
+    :param connection: The connection to the main process.
+    :type connection: multiprocessing Connection
+    :return: True if the worker was stopped by the main process (False if the
+             connection was lost), and the number of chunks computed.
+    :rtype: tuple
+    """
+    sendLock = Lock()
+    stopEvent = Event()
+    nbChunks = 0
+    try:
+        _, (individualClass, heartbeatPeriod) = connection.recv()
+        heartbeatThread = Thread(target=_heartbeatLoop, args=(connection, sendLock, stopEvent, heartbeatPeriod))
+        heartbeatThread.daemon = True
+        heartbeatThread.start()
+        initError = None
+        try:
+            individualClass.SET_WORKER_STATE(individualClass.initWorker())
+        except Exception:
+            initError = format_exc()
+        context = None
+        while True:
+            message = connection.recv()
+            if message is None:
+                return True, nbChunks
+            messageType, data = message
+            if messageType == CONTEXT_MSG:
+                context = data
+                continue
+            if initError is not None:
+                results = [[], initError]
+            else:
+                try:
+                    results = [evaluateChunk(individualClass, context, data), None]
+                except Exception:
+                    results = [[], format_exc()]
+            with sendLock:
+                connection.send([RESULT_MSG, results])
+            nbChunks += 1
+    except (EOFError, IOError, OSError):
+        return False, nbChunks
+    finally:
+        stopEvent.set()
+        connection.close()
+
+
+def _heartbeatLoop(connection, sendLock, stopEvent, heartbeatPeriod):
+    """
+    Send a heartbeat to the main process every heartbeatPeriod, even while
+    a chunk is computed, until stopEvent is set or the connection is lost.
+
+    :param connection: The connection to the main process.
+    :type connection: multiprocessing Connection
+    :param sendLock: The lock of the sendings on the connection.
+    :type sendLock: threading.Lock
+    :param stopEvent: The event set at the end of the session.
+    :type stopEvent: threading.Event
+    :param heartbeatPeriod: The time between two heartbeats (seconds).
+    :type heartbeatPeriod: float
+    """
+    while not stopEvent.wait(heartbeatPeriod):
+        with sendLock:
+            try:
+                connection.send([HEARTBEAT_MSG, None])
+            except (IOError, OSError):
+                return
+
+
+class PYGA_RemoteEvaluator(PYGA_Evaluator):
+    """
+    Evaluation engine using workers connected over TCP (see runRemoteWorker).
+
+    The main process listens on the given address from start() to stop(): the
+    workers may connect at any time (from any host, with the authentication key),
+    they are given chunks as soon as they are connected. The evaluation waits for
+    a first worker if none is connected.
+    As with the worker processes (see PYGA_ProcessEvaluator), the evaluation context
+    is sent once to each worker and the individuals by chunks.
+
+    Each worker sends a heartbeat every heartbeat timeout / HEARTBEATS_BY_TIMEOUT,
+    even while computing. A busy worker silent during the heartbeat timeout, or whose
+    connection is closed, is lost: its connection is closed and its chunk is given to
+    PYGA_Evaluator.failTask (launched again on the other workers, or penalised).
+    The fitness must not hold the GIL longer than the heartbeat timeout.
+    A worker late on its chunk (evaluation timeout) cannot be stopped: it is disconnected
+    (it connects again once its chunk is computed). So are the busy workers when the
+    evaluation is closed by the caller.
+
+    Attributes:
+        :ivar __address: The address listened by the main process, as (host, port).
+        :type __address: tuple
+        :ivar __authkey: The authentication key of the workers.
+        :type __authkey: bytes
+        :ivar __heartbeatTimeout: The time after which a silent busy worker is lost (seconds).
+        :type __heartbeatTimeout: float
+        :ivar __chunkSize: The number of individuals sent at once to a worker (0 for automatic).
+        :type __chunkSize: int
+        :ivar __listener: The listener of the worker connections (None when not started).
+        :type __listener: multiprocessing.connection.Listener
+        :ivar __acceptThread: The thread accepting the worker connections.
+        :type __acceptThread: threading.Thread
+        :ivar __stopping: True when the evaluator is stopped (the accept thread ends).
+        :type __stopping: bool
+        :ivar __newWorkers: The connections accepted and not used yet by an evaluation.
+        :type __newWorkers: deque
+        :ivar __newWorkerPipe: The pipe waking up the evaluation when a worker connects, as [reader, writer].
+        :type __newWorkerPipe: list
+        :ivar __workers: The connections of the workers used by the evaluations.
+        :type __workers: list
+        :ivar __nbConnected: The number of worker connections since the start.
+        :type __nbConnected: int
+        :ivar __nbLost: The number of workers lost since the start.
+        :type __nbLost: int
+    """
+
+    # Number of heartbeats sent by a worker during the heartbeat timeout
+    HEARTBEATS_BY_TIMEOUT = 5
+
+    # ==================
+    # v Public methods v
+    # ==================
+
+    def __init__(self, individualClass, printMethod, address, authkey, heartbeatTimeout=10.0, chunkSize=0):
+        """
+        Constructor of the remote evaluator.
+
+        :param individualClass: The individual class to evaluate.
+        :type individualClass: type derived from PYGA_Individual
+        :param printMethod: The method to call to print logs.
+        :type printMethod: Python method
+        :param address: The address to listen, as (host, port) or "host:port".
+        :type address: tuple or str
+        :param authkey: The authentication key of the workers.
+        :type authkey: str or bytes
+        :param heartbeatTimeout: The time after which a silent busy worker is lost (seconds).
+        :type heartbeatTimeout: float
+        :param chunkSize: The number of individuals sent at once to a worker (0 for automatic).
+        :type chunkSize: int
+        """
+        PYGA_Evaluator.__init__(self, individualClass, printMethod)
+        if isinstance(address, str):
+            address = parseAddress(address)
+        if not isinstance(authkey, bytes):
+            authkey = authkey.encode()
+        self.__address = address
+        self.__authkey = authkey
+        self.__heartbeatTimeout = heartbeatTimeout
+        self.__chunkSize = chunkSize
+        self.__listener = None
+        self.__acceptThread = None
+        self.__stopping = False
+        self.__newWorkers = deque()
+        self.__newWorkerPipe = None
+        self.__workers = []
+        self.__nbConnected = 0
+        self.__nbLost = 0
+
+    def getAddress(self):
+        """Get the address listened by the main process, as (host, port) (the actual port once started)."""
+        if self.__listener is not None:
+            return self.__listener.address
+        return self.__address
+
+    def getNbWorkers(self):
+        """Get the number of connected workers (at least one, the evaluation waiting for it)."""
+        return max(1, len(self.__workers) + len(self.__newWorkers))
+
+    def start(self):
+        """Listen for the worker connections."""
+        self.__stopping = False
+        self.__nbConnected = 0
+        self.__nbLost = 0
+        self.__listener = Listener(self.__address, authkey=self.__authkey)
+        self.__newWorkerPipe = list(Pipe(duplex=False))
+        self.__acceptThread = Thread(target=self.__acceptLoop)
+        self.__acceptThread.daemon = True
+        self.__acceptThread.start()
+        self.printLog("PYGA_RemoteEvaluator / start - listening on " + str(self.getAddress()) + '\n', debug=True)
+
+    def stop(self):
+        """Stop the workers and the listener."""
+        if self.__listener is None:
+            return
+        self.__stopping = True
+        # Unblock the accept thread with a last connection
+        try:
+            Client(self.__listener.address, authkey=self.__authkey).close()
+        except Exception:
+            pass
+        self.__acceptThread.join(self.__heartbeatTimeout)
+        self.__listener.close()
+        self.__listener = None
+        while len(self.__newWorkers) > 0:
+            self.__workers.append(self.__newWorkers.popleft())
+        for connection in self.__workers:
+            try:
+                connection.send(None)
+            except (IOError, OSError):
+                pass
+            connection.close()
+        self.__workers = []
+        for connection in self.__newWorkerPipe:
+            connection.close()
+        self.__newWorkerPipe = None
+
+    def getPrintInformation(self):
+        """Get the statistics of the workers, as printed at the end of the run."""
+        return ("Remote evaluation: " + str(self.__nbConnected) + " worker connections, " +
+                str(self.__nbLost) + " workers lost\n")
+
+    def evaluate(self, population, individuals):
+        """
+        Compute the objectives of the given individuals in the remote workers.
+        See PYGA_Evaluator.evaluate.
+        """
+        if self.__listener is None:
+            self.start()
+        # Send the evaluation context once to each worker (pickled only once)
+        contextVersion, context = self.getEvaluationContext(population)
+        contextMsg = dumps([CONTEXT_MSG, context], HIGHEST_PROTOCOL)
+        for connection in list(self.__workers):
+            try:
+                connection.send_bytes(contextMsg)
+            except (IOError, OSError):
+                self.__closeWorker(connection, "connection closed", lost=True)
+        # Workers having the current context
+        contextConnections = set(self.__workers)
+        timeout = self.getEvaluationTimeout()
+        toLaunch = launchQueue(individuals)
+        # Individuals of failed chunks, to send one by one
+        toLaunchAlone = deque()
+        # Busy workers, as [launched individuals, deadline, send time] by connection
+        busyWorkers = {}
+        lastSeen = dict((connection, time()) for connection in self.__workers)
+        waitingLogged = False
+        try:
+            while len(toLaunch) > 0 or len(toLaunchAlone) > 0 or len(busyWorkers) > 0:
+                # (the context given since the beginning of the evaluation, sent before the next chunk
+                # of each worker, see PYGA_Evaluator.getNewContext)
+                newContext = self.getNewContext(contextVersion)
+                if newContext is not None:
+                    contextVersion, context = newContext
+                    contextMsg = dumps([CONTEXT_MSG, context], HIGHEST_PROTOCOL)
+                    contextConnections = set()
+                # 1- Use the workers connected since the last loop
+                for connection in self.__adoptNewWorkers(contextMsg):
+                    lastSeen[connection] = time()
+                    contextConnections.add(connection)
+                # 2- Give a chunk of individuals to each idle worker
+                idleWorkers = [connection for connection in self.__workers if connection not in busyWorkers]
+                while (len(toLaunch) > 0 or len(toLaunchAlone) > 0) and len(idleWorkers) > 0:
+                    if len(toLaunchAlone) > 0:
+                        chunk = [toLaunchAlone.popleft()]
+                    else:
+                        chunk = self.popChunk(toLaunch, self.__chunkSize, len(self.__workers))
+                    connection = idleWorkers.pop()
+                    try:
+                        if connection not in contextConnections:
+                            connection.send_bytes(contextMsg)
+                            contextConnections.add(connection)
+                        connection.send([CHUNK_MSG, chunk])
+                    except (IOError, OSError):
+                        # The worker was lost while idle: the chunk is given to another one
+                        self.__closeWorker(connection, "connection closed", lost=True)
+                        toLaunchAlone.extendleft(reversed(chunk))
+                        continue
+                    sendTime = time()
+                    lastSeen[connection] = sendTime
+                    deadline = None
+                    if timeout > 0:
+                        deadline = sendTime + timeout * len(chunk)
+                    busyWorkers[connection] = [dict(chunk), deadline, sendTime]
+                if len(self.__workers) == 0 and not waitingLogged:
+                    self.printLog("\nWaiting for remote evaluation workers on " + str(self.getAddress()) + '\n')
+                    waitingLogged = True
+                # 3- Sleep until a worker sends a message, connects, is late or silent (or the wake up time)
+                deadlines = [busy[1] for busy in busyWorkers.values()]
+                deadlines += [lastSeen[connection] + self.__heartbeatTimeout for connection in busyWorkers]
+                newWorkerReader = self.__newWorkerPipe[0]
+                for connection in wait(self.__workers + [newWorkerReader], self.getWaitTime(deadlines)):
+                    if connection is newWorkerReader:
+                        while newWorkerReader.poll():
+                            newWorkerReader.recv_bytes()
+                        continue
+                    try:
+                        messageType, data = connection.recv()
+                    except (EOFError, IOError, OSError):
+                        for indivID, individual in self.__loseWorker(connection, busyWorkers, toLaunchAlone,
+                                                                     CRASH_FAILURE, "connection closed"):
+                            yield indivID, individual
+                        continue
+                    lastSeen[connection] = time()
+                    if messageType == HEARTBEAT_MSG or connection not in busyWorkers:
+                        continue
+                    launched, _, sendTime = busyWorkers.pop(connection)
+                    results, error = data
+                    if error is not None:
+                        for indivID, individual in self.failTask(list(launched.items()), toLaunchAlone,
+                                                                 ERROR_FAILURE, error):
+                            yield indivID, individual
+                        continue
+                    chunkTime = sum(duration for _, _, duration in results)
+                    self.measureOverhead(time() - sendTime - chunkTime)
+                    for indivID, result, duration in results:
+                        # Set the result in the individual of this process
+                        individual = launched[indivID]
+                        self.measureEvaluation(duration, individual)
+                        individual.setEvaluationResult(result)
+                        yield indivID, individual
+                # 4- Disconnect the late workers, lose the silent ones
+                now = time()
+                for connection in [connection for connection, busy in busyWorkers.items()
+                                   if busy[1] is not None and busy[1] <= now]:
+                    for indivID, individual in self.__loseWorker(connection, busyWorkers, toLaunchAlone,
+                                                                 TIMEOUT_FAILURE,
+                                                                 "timeout after " + str(timeout) + " seconds"):
+                        yield indivID, individual
+                for connection in [connection for connection in busyWorkers
+                                   if lastSeen[connection] + self.__heartbeatTimeout <= now]:
+                    for indivID, individual in self.__loseWorker(connection, busyWorkers, toLaunchAlone,
+                                                                 CRASH_FAILURE, "no heartbeat for " +
+                                                                 str(self.__heartbeatTimeout) + " seconds"):
+                        yield indivID, individual
+                if self.isWakeUpTime():
+                    yield None, None
+        finally:
+            # Evaluation closed by the caller (or failed): the running chunks are abandoned
+            # (the busy workers are disconnected, they connect again once their chunk is computed)
+            for connection in list(busyWorkers.keys()):
+                self.__closeWorker(connection, "chunk abandoned", lost=False)
+
+    # ==================
+    # ^ Public methods ^
+    # ==================
+
+    # ===================
+    # v Private methods v
+    # ===================
+
+    def __acceptLoop(self):
+        """Accept the worker connections and send them the individual class (run by the accept thread)."""
+        initMsg = [INIT_MSG, [self.getIndividualClass(), float(self.__heartbeatTimeout) / self.HEARTBEATS_BY_TIMEOUT]]
+        while not self.__stopping:
+            try:
+                connection = self.__listener.accept()
+            except Exception:
+                # Authentication failure, connection reset...
+                if not self.__stopping:
+                    self.printLog("PYGA_RemoteEvaluator / accept - connection refused:\n" + format_exc(), debug=True)
+                continue
+            if self.__stopping:
+                connection.close()
+                break
+            try:
+                connection.send(initMsg)
+            except (IOError, OSError):
+                connection.close()
+                continue
+            self.__newWorkers.append(connection)
+            self.__newWorkerPipe[1].send_bytes(b'')
+
+    def __adoptNewWorkers(self, contextMsg):
+        """
+        Use the workers connected since the last call in the evaluations.
+
+        :param contextMsg: The pickled context message of the current evaluation.
+        :type contextMsg: bytes
+        :return: The connections of the new workers.
+        :rtype: list
+        """
+        newWorkers = []
+        while len(self.__newWorkers) > 0:
+            connection = self.__newWorkers.popleft()
+            try:
+                connection.send_bytes(contextMsg)
+            except (IOError, OSError):
+                connection.close()
+                continue
+            self.__nbConnected += 1
+            self.__workers.append(connection)
+            newWorkers.append(connection)
+            self.printLog("PYGA_RemoteEvaluator / adoptNewWorkers - " + str(len(self.__workers)) + " workers\n",
+                          debug=True)
+        return newWorkers
+
+    def __loseWorker(self, connection, busyWorkers, toLaunchAlone, failureType, reason):
+        """
+        Close the connection of a lost (or late) worker, and give its chunk to failTask.
+
+        :param connection: The connection of the worker.
+        :type connection: multiprocessing Connection
+        :param busyWorkers: The busy workers of the current evaluation.
+        :type busyWorkers: dict
+        :param toLaunchAlone: The individuals to launch one by one.
+        :type toLaunchAlone: deque
+        :param failureType: The type of failure (see failTask).
+        :type failureType: str
+        :param reason: The reason of the failure.
+        :type reason: str
+        :return: Yields [indivID, individual] for the penalised individuals (see failTask).
+        :rtype: generator
+        """
+        self.__closeWorker(connection, reason, lost=failureType != TIMEOUT_FAILURE)
+        if connection in busyWorkers:
+            launched = busyWorkers.pop(connection)[0]
+            for indivID, individual in self.failTask(list(launched.items()), toLaunchAlone, failureType,
+                                                     "remote worker: " + reason):
+                yield indivID, individual
+
+    def __closeWorker(self, connection, reason, lost):
+        """
+        Close the connection of a worker and stop using it.
+
+        :param connection: The connection of the worker.
+        :type connection: multiprocessing Connection
+        :param reason: The reason of the closing (logged).
+        :type reason: str
+        :param lost: True if the worker is counted as lost.
+        :type lost: bool
+        """
+        if connection in self.__workers:
+            self.__workers.remove(connection)
+        connection.close()
+        if lost:
+            self.__nbLost += 1
+        self.printLog("PYGA_RemoteEvaluator / closeWorker - " + reason + ", " + str(len(self.__workers)) +
+                      " workers left\n", debug=True)
+
+    # ===================
+    # ^ Private methods ^
+    # ===================
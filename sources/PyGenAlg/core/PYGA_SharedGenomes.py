@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+Python Genetic Algorithm module.
+
+This file contains the shared memory send of the genomes: PYGA_SharedGenomes.
+The main process copies the genome of each individual sent to a worker process in a
+shared memory slot, the worker reads it in place (see PYGA_Individual.getGenomeBuffer
+and fromGenomeBuffer). Only the send is in shared memory: the genome is copied at each
+send, and the results still come back pickled through the pipe.
+
+License full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+
+
+
+Modification History:
+**** 18/10/2026 ****
+Creation
+
+TODO List:
+-
+"""
+# - Build-in imports -
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+# - Local imports -
+
+# Meta information
+__author__ = "Raphaël Deau"
+__copyright__ = "Copyright 2016, Raphaël Deau"
+__license__ = "Creative Commons Attribution Non-commercial 4.0"
+__version__ = "1.0.0"
+__since__ = "18/10/2026"
+__date__ = "18/10/2026"
+
+
+def attachChunk(individualClass, chunk, attachedBlocks):
+    """
+    Get the individuals of a chunk received by a worker: the individuals whose genome
+    is in shared memory (items [indivID, None, [block name, offset, size]], see
+    PYGA_SharedGenomes.share) are built from a view of the block (see
+    PYGA_Individual.fromGenomeBuffer), the others are received as they are.
+
+    :param individualClass: The individual class to evaluate.
+    :type individualClass: type derived from PYGA_Individual
+    :param chunk: The received chunk.
+    :type chunk: list
+    :param attachedBlocks: The shared memory blocks already attached by the worker, by name
+                           (the new ones are added).
+    :type attachedBlocks: dict
+    :return: The individuals to evaluate, as [indivID, individual].
+    :rtype: list
+    """
+    individuals = []
+    for item in chunk:
+        if len(item) == 2:
+            individuals.append(item)
+            continue
+        indivID, _, (blockName, offset, size) = item
+        block = attachedBlocks.get(blockName)
+        if block is None:
+            block = SharedMemory(name=blockName)
+            attachedBlocks[blockName] = block
+        genomeBuffer = block.buf[offset:offset + size].toreadonly()
+        individuals.append([indivID, individualClass.fromGenomeBuffer(genomeBuffer)])
+    return individuals
+
+
+class PYGA_SharedGenomes(object):
+    """
+    Shared memory blocks where the main process copies the genomes sent to the workers.
+
+    The blocks are divided in slots of the size of the first shared genome (the
+    bigger genomes are pickled with their individual). A slot is used from the
+    sending of its chunk until its results are received (see release): the
+    blocks are created when all the slots are used (each block having twice as
+    many slots as the previous one), and kept until close.
+    The genome is copied in the block by the main process each time it is sent,
+    instead of being pickled, sent through the pipe and unpickled with the individual.
+    No slot is kept for an individual between two sends, and the results of the
+    workers are still pickled and sent back through the pipe.
+
+    Attributes:
+        :ivar __slotSize: The size of a slot (bytes, 0 until the first genome is shared).
+        :type __slotSize: int
+        :ivar __blocks: The shared memory blocks.
+        :type __blocks: list of SharedMemory
+        :ivar __freeSlots: The free slots, as [block index, slot index].
+        :type __freeSlots: list
+        :ivar __nbShared: The number of genomes sent in shared memory.
+        :type __nbShared: int
+        :ivar __nbPickled: The number of individuals pickled (no genome buffer, genome too big).
+        :type __nbPickled: int
+    """
+
+    # Number of slots of the first block
+    FIRST_BLOCK_SLOTS = 64
+
+    # ==================
+    # v Public methods v
+    # ==================
+
+    def __init__(self):
+        """Constructor of the shared genomes (no block is created before the first genome)."""
+        # The resource tracker is shared with the workers started from now on: a worker
+        # attaching a block does not start its own (which would destroy the block when the worker ends)
+        resource_tracker.ensure_running()
+        self.__slotSize = 0
+        self.__blocks = []
+        self.__freeSlots = []
+        self.__nbShared = 0
+        self.__nbPickled = 0
+
+    def share(self, chunk):
+        """
+        Copy the genomes of the individuals of a chunk in shared memory (at each send of a genome).
+
+        :param chunk: The individuals to send, as [indivID, individual].
+        :type chunk: list
+        :return: The chunk to send (see attachChunk) and the slots used by the chunk (see release).
+        :rtype: tuple
+        """
+        items = []
+        slots = []
+        for indivID, individual in chunk:
+            genome = individual.getGenomeBuffer()
+            slot = None
+            if genome is not None:
+                genome = memoryview(genome).cast('B')
+                slot = self.__allocate(genome.nbytes)
+            if slot is None:
+                self.__nbPickled += 1
+                items.append([indivID, individual])
+                continue
+            block = self.__blocks[slot[0]]
+            offset = slot[1] * self.__slotSize
+            block.buf[offset:offset + genome.nbytes] = genome
+            self.__nbShared += 1
+            items.append([indivID, None, [block.name, offset, genome.nbytes]])
+            slots.append(slot)
+        return items, slots
+
+    def release(self, slots):
+        """
+        Free the slots of a chunk whose results are received (or abandoned).
+
+        :param slots: The slots used by the chunk (see share).
+        :type slots: list
+        """
+        self.__freeSlots.extend(slots)
+
+    def close(self):
+        """Destroy the shared memory blocks."""
+        for block in self.__blocks:
+            block.close()
+            block.unlink()
+        self.__blocks = []
+        self.__freeSlots = []
+
+    def getPrintInformation(self):
+        """Get the statistics of the transport, as printed at the end of the run."""
+        return ("Genomes sent in shared memory: " + str(self.__nbShared) + " (" + str(self.__nbPickled) +
+                " individuals pickled)\n")
+
+    # ==================
+    # ^ Public methods ^
+    # ==================
+
+    # ===================
+    # v Private methods v
+    # ===================
+
+    def __allocate(self, size):
+        """
+        Get a free slot for a genome.
+
+        :param size: The size of the genome (bytes).
+        :type size: int
+        :return: The slot, as [block index, slot index] (None if the genome is too big).
+        :rtype: list
+        """
+        if self.__slotSize == 0:
+            self.__slotSize = max(1, size)
+        if size > self.__slotSize:
+            return None
+        if len(self.__freeSlots) == 0:
+            nbSlots = self.FIRST_BLOCK_SLOTS * 2 ** len(self.__blocks)
+            self.__blocks.append(SharedMemory(create=True, size=nbSlots * self.__slotSize))
+            iBlock = len(self.__blocks) - 1
+            self.__freeSlots = [[iBlock, iSlot] for iSlot in reversed(range(nbSlots))]
+        return self.__freeSlots.pop()
+
+    # ===================
+    # ^ Private methods ^
+    # ===================
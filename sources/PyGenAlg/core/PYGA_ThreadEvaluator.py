@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+Python Genetic Algorithm module.
+
+This file contains the multithread evaluation engine of the GA: PYGA_ThreadEvaluator.
+It keeps a pool of threads alive during the whole run. It is useful for fitness
+functions releasing the GIL (NumPy, C extensions...): the individuals are
+evaluated in place, without any pickling.
+
+License full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+
+
+
+Modification History:
+**** 18/10/2026 ****
+Creation
+- Batch fitness (PYGA_Individual.fitnessBatch): one batch per thread
+- Evaluation timeout: late threads abandoned and replaced
+- Failed evaluations retried
+- Individuals added while evaluating (see launchQueue)
+- Wake up time, running evaluations abandoned when the evaluation is closed
+- Longest evaluations first: durations measured by individual
+- Number of threads given by the CPU affinity
+
+TODO List:
+-
+"""
+# - Build-in imports -
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from copy import copy
+from time import time
+
+# - Local imports -
+from PyGenAlg.core.PYGA_Evaluator import PYGA_Evaluator, getNbAvailableCpus, evaluateChunk, launchQueue
+from PyGenAlg.core.PYGA_Evaluator import ERROR_FAILURE, TIMEOUT_FAILURE
+
+# Meta information
+__author__ = "Raphaël Deau"
+__copyright__ = "Copyright 2016, Raphaël Deau"
+__license__ = "Creative Commons Attribution Non-commercial 4.0"
+__version__ = "1.0.0"
+__since__ = "18/10/2026"
+__date__ = "18/10/2026"
+
+
+class PYGA_ThreadEvaluator(PYGA_Evaluator):
+    """
+    Evaluation engine using a persistent pool of threads.
+
+    The worker initialisation (see PYGA_Individual.initWorker) is done once,
+    in the main process: its state is shared by all threads.
+
+    A thread cannot be killed: with an evaluation timeout, the individuals are
+    evaluated on copies (a late result is then ignored) and the pool of threads
+    is replaced when a thread is late. The late thread ends on its own (the
+    program waits for it before exiting).
+
+    Attributes:
+        :ivar __maxThread: The number of threads (0 for the number of available CPUs).
+        :type __maxThread: int
+        :ivar __executor: The pool of threads.
+        :type __executor: ThreadPoolExecutor
+        :ivar __nbThreads: The number of started threads.
+        :type __nbThreads: int
+    """
+    # ==================
+    # v Public methods v
+    # ==================
+
+    def __init__(self, individualClass, printMethod, maxThread):
+        """
+        Constructor of the thread evaluator.
+
+        :param individualClass: The individual class to evaluate.
+        :type individualClass: type derived from PYGA_Individual
+        :param printMethod: The method to call to print logs.
+        :type printMethod: Python method
+        :param maxThread: The number of threads (0 for the number of available CPUs).
+        :type maxThread: int
+        """
+        PYGA_Evaluator.__init__(self, individualClass, printMethod)
+        self.__maxThread = maxThread
+        self.__executor = None
+        self.__nbThreads = 0
+
+    def getNbWorkers(self):
+        """Get the number of threads."""
+        if self.__maxThread == 0:
+            return getNbAvailableCpus()
+        return self.__maxThread
+
+    def start(self):
+        """Initialise the worker state and start the threads."""
+        PYGA_Evaluator.start(self)
+        nbThreads = self.getNbWorkers()
+        self.__nbThreads = nbThreads
+        self.__executor = ThreadPoolExecutor(max_workers=nbThreads)
+        self.printLog("PYGA_ThreadEvaluator / start - " + str(nbThreads) + " threads started\n", debug=True)
+
+    def stop(self):
+        """Stop the threads."""
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True)
+            self.__executor = None
+        PYGA_Evaluator.stop(self)
+
+    def evaluate(self, population, individuals):
+        """
+        Compute the objectives of the given individuals in the threads.
+        See PYGA_Evaluator.evaluate.
+        """
+        if self.__executor is None:
+            self.start()
+        individualClass = self.getIndividualClass()
+        contextVersion, context = self.getEvaluationContext(population)
+        timeout = self.getEvaluationTimeout()
+        toLaunch = launchQueue(individuals)
+        # Individuals of failed tasks, to launch one by one
+        toLaunchAlone = deque()
+        running = {}
+        try:
+            while len(toLaunch) > 0 or len(toLaunchAlone) > 0 or len(running) > 0:
+                # (the context given since the beginning of the evaluation, see PYGA_Evaluator.getNewContext)
+                newContext = self.getNewContext(contextVersion)
+                if newContext is not None:
+                    contextVersion, context = newContext
+                # 1- Keep one task per thread (a task starts as soon as it is submitted)
+                while (len(toLaunch) > 0 or len(toLaunchAlone) > 0) and len(running) < self.__nbThreads:
+                    # One part of the waiting individuals per free thread with a batch fitness,
+                    # one task per individual otherwise
+                    if len(toLaunchAlone) > 0:
+                        task = [toLaunchAlone.popleft()]
+                    elif individualClass.hasFitnessBatch():
+                        nbToLaunch = self.getChunkSize(0, len(toLaunch), self.__nbThreads - len(running))
+                        task = [toLaunch.popleft() for _ in range(nbToLaunch)]
+                    else:
+                        task = [toLaunch.popleft()]
+                    deadline = None
+                    if timeout > 0:
+                        # Evaluate copies: the result of a late thread is ignored
+                        deadline = time() + timeout * len(task)
+                        chunk = [[indivID, copy(individual)] for indivID, individual in task]
+                    else:
+                        chunk = task
+                    future = self.__executor.submit(evaluateChunk, individualClass, context, chunk)
+                    running[future] = [dict(task), deadline]
+                # 2- Wait until a task is done (or late, or the wake up time)
+                waitTime = self.getWaitTime([deadline for _, deadline in running.values()])
+                done, _ = wait(list(running.keys()), waitTime, return_when=FIRST_COMPLETED)
+                for future in done:
+                    launched, _ = running.pop(future)
+                    try:
+                        results = future.result()
+                    except Exception as error:
+                        for indivID, individual in self.failTask(list(launched.items()), toLaunchAlone,
+                                                                 ERROR_FAILURE, repr(error)):
+                            yield indivID, individual
+                        continue
+                    for indivID, result, duration in results:
+                        individual = launched[indivID]
+                        self.measureEvaluation(duration, individual)
+                        individual.setEvaluationResult(result)
+                        yield indivID, individual
+                # 3- Abandon the late tasks
+                lateFutures = [future for future, (_, deadline) in running.items()
+                               if deadline is not None and deadline <= time()]
+                for future in lateFutures:
+                    launched, _ = running.pop(future)
+                    for indivID, individual in self.failTask(list(launched.items()), toLaunchAlone, TIMEOUT_FAILURE,
+                                                             "timeout after " + str(timeout) + " seconds"):
+                        yield indivID, individual
+                if len(lateFutures) > 0:
+                    # The late threads keep running: use new ones
+                    self.__executor.shutdown(wait=False)
+                    self.__executor = ThreadPoolExecutor(max_workers=self.__nbThreads)
+                    self.printLog("PYGA_ThreadEvaluator / evaluate - " + str(len(lateFutures)) +
+                                  " late threads abandoned\n", debug=True)
+                if self.isWakeUpTime():
+                    yield None, None
+        finally:
+            if len(running) > 0:
+                # Evaluation closed by the caller (or failed): the running tasks are abandoned
+                for future in running:
+                    future.cancel()
+                self.__executor.shutdown(wait=False)
+                self.__executor = ThreadPoolExecutor(max_workers=self.__nbThreads)
+
+    # ==================
+    # ^ Public methods ^
+    # ==================
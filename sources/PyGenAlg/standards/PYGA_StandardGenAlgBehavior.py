@@ -71,7 +71,8 @@ class PYGA_StandardGenAlgBehavior(PYGA_GenAlgBehavior):
             population.generateInitPop(self.getParam(self.POPULATION_SIZE_LABEL),
                                        self.getParam(self.DEL_DUPLICATED_INDIV_LABEL),
                                        self.getParam(self.MAX_PROCESS_LABEL), 
-                                       infoStr)
+                                       infoStr,
+                                       self.getParam(self.INIT_POP_EVAL_LABEL))
             infoStr2 = infoStr + ' Population generated: ' + str(population.size()) + ' individuals.\n'
             self.printLog(infoStr2)
         if population.size() < self.getParam(self.POPULATION_SIZE_LABEL):
@@ -15,6 +15,11 @@
 #
 #-----------------------
 
+# - build-in imports -
+from sys import version_info
+if version_info[0] >= 3:
+    xrange = range
+
 # - local imports -
 from PyGenAlg.core.PYGA_Individual import PYGA_Individual
 
@@ -55,9 +60,21 @@ class PYGA_StandardMultiObjIndividual(PYGA_Individual):
     def needCompute(self):
         return self.__objectives is None
 
+    def getEvaluationResult(self):
+        # Objectives are set by the individual: send them with the fitness
+        return [PYGA_Individual.getEvaluationResult(self), self.__objectives]
+
+    def setEvaluationResult(self, result):
+        PYGA_Individual.setEvaluationResult(self, result[0])
+        self.__objectives = result[1]
+
+    def applyPenalty(self, penalty):
+        # The penalty is the list of objectives
+        self.__objectives = penalty
+
     @classmethod
     def getBestIndividuals(cls, population):
-        print 'ERROR: This function (StandardMultiObjIndividual.getBestIndividuals) must be defined in derivated class.'
+        print('ERROR: This function (StandardMultiObjIndividual.getBestIndividuals) must be defined in derivated class.')
 
     # ==================
     # ^ Public methods ^
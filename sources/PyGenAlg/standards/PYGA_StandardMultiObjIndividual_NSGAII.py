@@ -15,6 +15,11 @@
 #
 #-----------------------
 
+# - build-in imports -
+from sys import version_info
+if version_info[0] >= 3:
+    xrange = range
+
 # - local imports -
 from PyGenAlg.standards.PYGA_StandardMultiObjIndividual import PYGA_StandardMultiObjIndividual
 
@@ -19,6 +19,9 @@
 import random
 import sys
 
+if sys.version_info[0] >= 3:
+    xrange = range
+
 # - local imports -
 from PyGenAlg.standards.PYGA_StandardMultiObjIndividual_NSGAII import PYGA_StandardMultiObjIndividual_NSGAII
 
@@ -143,7 +146,7 @@ class PYGA_StandardVectorMultiObjIndividual_NSGAII(PYGA_StandardMultiObjIndividu
         # 1- Get the definition domain of the variable
         defDomain = cls.VARIABLES_RANGES[iVar]
         if defDomain is None:
-            defDomain = '[' + str(-sys.maxint-1) + ',' + str(sys.maxint) + ']'
+            defDomain = '[' + str(-sys.maxsize-1) + ',' + str(sys.maxsize) + ']'
 #        print '-----'
 #        print defDomain
         # 2- Check the open/closed bounds
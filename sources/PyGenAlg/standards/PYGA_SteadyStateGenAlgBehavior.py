@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+Python Genetic Algorithm module.
+
+This file contains the steady state behavior of the GA: PYGA_SteadyStateGenAlgBehavior.
+There is no generational barrier: as soon as an offspring is evaluated, it is
+inserted in the population, and a new offspring is bred and sent to the free worker.
+
+License full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+
+
+
+Modification History:
+**** 18/10/2026 ****
+Creation
+
+TODO List:
+-
+"""
+# - Build-in imports -
+from collections import deque
+import os
+import random
+
+# - Local imports -
+from PyGenAlg.core.PYGA_GenAlgBehavior import PYGA_GenAlgBehavior
+from PyGenAlg.standards.PYGA_StandardGenAlgBehavior import PYGA_StandardGenAlgBehavior
+
+# Meta information
+__author__ = "Raphaël Deau"
+__copyright__ = "Copyright 2016, Raphaël Deau"
+__license__ = "Creative Commons Attribution Non-commercial 4.0"
+__version__ = "1.0.0"
+__since__ = "18/10/2026"
+__date__ = "18/10/2026"
+
+
+class PYGA_SteadyStateGenAlgBehavior(PYGA_StandardGenAlgBehavior):
+    """
+    Asynchronous steady state behavior.
+
+    The initial population is generated and evaluated as in the standard behavior,
+    then the evolution keeps one offspring per worker of the evaluation engine
+    (see PYGA_Evaluator.getNbWorkers) being evaluated. Each evaluated offspring
+    replaces the worst individual of the population (if it is better), then a new
+    offspring is bred from the current population (crossover or mutation, chosen
+    according to the crossover and mutation rates, see breedOffspring) and
+    sent to the evaluation at once: the workers never wait for the slowest evaluation.
+
+    The evolution stops according to the number of evaluations (max_evaluations),
+    the execution time (end_time) or the number of generations (nb_generations),
+    a generation being as many evaluations as the population size. The methods
+    startOfGeneration, selfOptimize and endOfGeneration are called for each of these
+    generations. The evaluations running when the evolution stops are completed.
+
+    The evaluation context is the one of the population at the beginning of the
+    evolution (see PYGA_Evaluator). There is no selection step nor optimisation
+    (scaling, sharing): the selective pressure comes from the replacement of the worst individuals.
+
+    Attributes:
+        :ivar __nbEvaluations: The number of offspring evaluated since the beginning of the evolution.
+        :type __nbEvaluations: int
+    """
+
+    steadyStateParamFileName = "steadyStateParameters.xml"
+    steadyStateParamsFile = os.path.join(os.path.dirname(os.path.abspath(__file__)), steadyStateParamFileName)
+    PYGA_GenAlgBehavior.addParamFile(steadyStateParamsFile)
+
+    # ==================
+    # v Public methods v
+    # ==================
+
+    def __init__(self, *args, **kwargs):
+        PYGA_StandardGenAlgBehavior.__init__(self, *args, **kwargs)
+        self.__nbEvaluations = 0
+
+    def isGenerational(self):
+        """The evolution is run by evolve."""
+        return False
+
+    def stopCriteria(self, population, iGeneration, startTime, infoStr):
+        """
+        Standard stop criteria (see PYGA_StandardGenAlgBehavior.stopCriteria),
+        and maximum number of evaluations.
+        """
+        percent, stop = PYGA_StandardGenAlgBehavior.stopCriteria(self, population, iGeneration, startTime, infoStr)
+        maxEval = self.getParam(self.MAX_EVALUATIONS_LABEL)
+        if maxEval != 0:
+            evalPercent = int(100 * self.__nbEvaluations / maxEval)
+            if evalPercent > percent:
+                percent = evalPercent
+            if self.__nbEvaluations >= maxEval:
+                stop = True
+        return percent, stop
+
+    def evolve(self, population, startTime, infoStr):
+        """
+        Run the steady state evolution.
+        See PYGA_GenAlgBehavior.evolve.
+        """
+        evaluator = self.getEvaluator()
+        popSize = population.size()
+        nbRunning = evaluator.getNbWorkers()
+        if nbRunning == 0:
+            nbRunning = popSize
+        self.__nbEvaluations = 0
+        iGen = 0
+        self.__startGeneration(population, iGen, infoStr)
+        # 1- Send one offspring to each worker
+        # (the identifiers of the offspring are unique during the evolution)
+        toLaunch = deque()
+        nextID = 0
+        for _ in range(nbRunning):
+            toLaunch.append([nextID, self.breedOffspring(population, infoStr)])
+            nextID += 1
+        stop = False
+        # 2- Insert each evaluated offspring, and replace it by a new one
+        for _, offspring in evaluator.computeObjectives(population, toLaunch):
+            self.__nbEvaluations += 1
+            self.insertOffspring(population, offspring, infoStr)
+            if stop:
+                # The evaluations still running are completed
+                continue
+            curGen = self.__nbEvaluations // popSize
+            percent, stop = self.stopCriteria(population, curGen, startTime, infoStr)
+            self.printLog(infoStr + ' ' + str(percent) + "% (Evaluation #" + str(self.__nbEvaluations) +
+                          ", generation #" + str(curGen) + ')' + ' ' * 10)
+            if stop:
+                continue
+            if curGen != iGen:
+                self.endOfGeneration(population, iGen, False, infoStr)
+                iGen = curGen
+                self.__startGeneration(population, iGen, infoStr)
+            toLaunch.append([nextID, self.breedOffspring(population, infoStr)])
+            nextID += 1
+        self.endOfGeneration(population, iGen, True, infoStr)
+        return self.__nbEvaluations
+
+    def breedOffspring(self, population, infoStr):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Breed a new offspring from the current population: crossover or mutation,
+        randomly chosen according to the crossover and mutation rates
+        (see PYGA_StandardGenAlgBehavior.crossover and mutation).
+
+        :param population: The current population.
+        :type population: Derived from PYGA_Population
+        :param infoStr: The log string to concatenate.
+        :type infoStr: str
+        :return: The new offspring (not evaluated).
+        :rtype: Derived from PYGA_Individual
+        """
+        crossRate = max(0, self.getParam(self.CROSSOVER_LABEL))
+        muteRate = max(0, self.getParam(self.MUTATION_LABEL))
+        if crossRate + muteRate > 0 and random.uniform(0, crossRate + muteRate) < crossRate:
+            offspring = self.crossover(population, 1, population, infoStr)
+        else:
+            offspring = self.mutation(population, 1, population, infoStr)
+        return offspring[0]
+
+    def insertOffspring(self, population, offspring, infoStr):
+        """
+        [ MAY BE OVERLOADED ]
+
+        Insert an evaluated offspring in the population: it replaces the worst
+        individual of the population if it is better.
+
+        :param population: The current population.
+        :type population: Derived from PYGA_Population
+        :param offspring: The evaluated offspring.
+        :type offspring: Derived from PYGA_Individual
+        :param infoStr: The log string to concatenate.
+        :type infoStr: str
+        """
+        individualClass = self.getIndividualClass()
+        population.addIndividual(offspring)
+        if individualClass.MULTI_OBJ:
+            individualClass.computeMultiObjFitness(population)
+        worstInd = None
+        for individual in population:
+            if worstInd is None or individualClass.isBetter(worstInd, individual, population):
+                worstInd = individual
+        population.removeIndividual(worstInd)
+        if individualClass.MULTI_OBJ:
+            individualClass.computeMultiObjFitness(population)
+
+    def getNbEvaluations(self):
+        """Get the number of offspring evaluated since the beginning of the evolution."""
+        return self.__nbEvaluations
+
+    # ==================
+    # ^ Public methods ^
+    # ==================
+
+    # ===================
+    # v Private methods v
+    # ===================
+
+    def __startGeneration(self, population, iGeneration, infoStr):
+        """
+        Start a generation of the steady state evolution (as many evaluations as
+        the population size).
+
+        :param population: The current population.
+        :type population: Derived from PYGA_Population
+        :param iGeneration: The generation number.
+        :type iGeneration: int
+        :param infoStr: The log string to concatenate.
+        :type infoStr: str
+        """
+        self.getIndividualClass().CURRENT_GENERATION = iGeneration + 1
+        self.startOfGeneration(population, iGeneration, infoStr)
+        self.selfOptimize(population, iGeneration, infoStr)
+
+    # ===================
+    # ^ Private methods ^
+    # ===================
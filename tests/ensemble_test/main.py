@@ -0,0 +1,43 @@
+# -*- mode: python; py-indent-offset: 4; tab-width: 4; coding: iso-8859-1 -*-
+
+#######################################################################
+# Author: Deau Raphal
+#
+# Copyright 2011 - 2016
+# License: Creative Commons Attribution Non-commercial 4.0
+# Full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+#
+#######################################################################
+
+# Ensemble: the same configuration run with NB_RUNS seeds, MAX_PROCESS at once.
+# The remaining runs are cancelled as soon as one run reaches TARGET_FITNESS.
+# Same as the command line:
+#   python -m PyGenAlg.core.PYGA_Ensemble Individual:Individual --runs 20 --max-process 4   (from simple_test)
+#                                         --target 1e-8 pop_size=50 nb_gen=100 selection=ranking
+
+import os
+import sys
+
+from PyGenAlg.core.PYGA_Ensemble import PYGA_Ensemble
+
+# The example individual of simple_test
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'simple_test'))
+from Individual import Individual
+
+NB_RUNS = 20
+MAX_PROCESS = 4
+TARGET_FITNESS = 1e-8
+
+if __name__ == '__main__':
+
+    ensemble = PYGA_Ensemble(Individual, NB_RUNS,
+                             maxProcess=MAX_PROCESS,
+                             targetFitness=TARGET_FITNESS)
+    ensemble.setParameters(pop_size=50, nb_gen=100,
+                           crossrate=10, mutaterate=10,
+                           selection='ranking')
+    ensemble.run()
+
+    for generationStatistics in ensemble.getGenerationStatistics():
+        print(generationStatistics)
+    print(ensemble.getBestIndividual())
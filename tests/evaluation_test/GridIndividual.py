@@ -0,0 +1,86 @@
+# -*- mode: python; py-indent-offset: 4; tab-width: 4; coding: iso-8859-1 -*-
+
+#######################################################################
+# Author: Deau Raphal
+#
+# Copyright 2011 - 2016
+# License: Creative Commons Attribution Non-commercial 4.0
+# Full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+#
+#######################################################################
+
+# Example individual of the evaluation examples: the individual of simple_test
+# with its genes on a grid (GRID_SIZE values per gene), so that the same genomes
+# are created again and again, identified by their fingerprint.
+# The fitness calls of the process are counted (NB_FITNESS_CALLS).
+
+# - build-in imports
+import os
+import random
+import sys
+
+# - local imports -
+# The example individual of simple_test
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'simple_test'))
+from Individual import Individual, f
+
+# Number of values of a gene
+GRID_SIZE = 11
+
+
+# Random value of a gene
+def gridValue():
+    return random.randint(0, GRID_SIZE - 1) / float(GRID_SIZE - 1)
+
+
+class GridIndividual(Individual):
+
+    # The fitness does not use the population (the results can be cached)
+    NEED_POPULATION = False
+    # Number of fitness calls in this process
+    NB_FITNESS_CALLS = 0
+
+    # ===========================
+    # v Overloaded methods v
+    # ===========================
+
+    # ----------------------
+    # Public - Generate
+    @classmethod
+    def generate(cls):
+        newIndiv = cls()
+        newIndiv.setValue([gridValue(), gridValue()])
+        return newIndiv
+    # ----------------------
+
+    # ----------------------
+    # Public - Fitness
+    def fitness(self, population):
+        GridIndividual.NB_FITNESS_CALLS += 1
+        return f(self.getValue())
+    # ----------------------
+
+    # ----------------------
+    # Public - Fingerprint
+    def getFingerprint(self):
+        return tuple(self.getValue())
+    # ----------------------
+
+    # ----------------------
+    # Public - Mutation
+    @classmethod
+    def mutation(cls, individual):
+        newInd = individual.duplicate()
+        value = list(newInd.getValue())
+        i = random.randint(0, 1)
+        oldValue = value[i]
+        while value[i] == oldValue:
+            value[i] = gridValue()
+        newInd.setValue(value)
+        return newInd
+    # Public - End of Mutation
+    # ----------------------
+
+    # ===========================
+    # ^ Overloaded methods ^
+    # ===========================
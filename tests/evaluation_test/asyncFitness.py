@@ -0,0 +1,69 @@
+# -*- mode: python; py-indent-offset: 4; tab-width: 4; coding: iso-8859-1 -*-
+
+#######################################################################
+# Author: Deau Raphal
+#
+# Copyright 2011 - 2016
+# License: Creative Commons Attribution Non-commercial 4.0
+# Full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+#
+#######################################################################
+
+# Coroutine fitness ("async def fitness") run by the ASYNC evaluation backend: the
+# fitness waits EVAL_DURATION seconds for an external simulator (asyncio.sleep here),
+# up to MAX_CONCURRENCY evaluations waiting at once (max_process parameter) in the
+# main process.
+# Checks that the evaluations overlap, within the concurrency limit.
+
+import asyncio
+import io
+import random
+import time
+
+from PyGenAlg.core.PYGA_GenAlg import PYGA_GenAlg
+
+from GridIndividual import GridIndividual
+
+EVAL_DURATION = 0.05
+MAX_CONCURRENCY = 10
+
+
+class AsyncIndividual(GridIndividual):
+
+    # Number of evaluations waiting for the simulator, maximum reached
+    NB_RUNNING = 0
+    MAX_RUNNING = 0
+
+    # ----------------------
+    # Public - Fitness (coroutine)
+    async def fitness(self, population):
+        AsyncIndividual.NB_RUNNING += 1
+        AsyncIndividual.MAX_RUNNING = max(AsyncIndividual.MAX_RUNNING, AsyncIndividual.NB_RUNNING)
+        try:
+            await asyncio.sleep(EVAL_DURATION)
+        finally:
+            AsyncIndividual.NB_RUNNING -= 1
+        return GridIndividual.fitness(self, population)
+    # ----------------------
+
+
+if __name__ == '__main__':
+
+    random.seed(0)
+    genAlg = PYGA_GenAlg(AsyncIndividual, outputPrint=io.StringIO())
+    genAlg.setParameters(pop_size=50, nb_gen=10,
+                         crossrate=10, mutaterate=10,
+                         selection='ranking',
+                         evaluation_backend='ASYNC',
+                         max_process=MAX_CONCURRENCY)
+    startTime = time.time()
+    genAlg.run()
+    runTime = time.time() - startTime
+
+    nbCalls = GridIndividual.NB_FITNESS_CALLS
+    print('Fitness calls: ' + str(nbCalls) + ', ' + str(AsyncIndividual.MAX_RUNNING) + ' at once at most')
+    print('Run time: ' + str(round(runTime, 2)) + ' seconds (' + str(round(nbCalls * EVAL_DURATION, 2)) +
+          ' seconds of simulation)')
+    assert 1 < AsyncIndividual.MAX_RUNNING <= MAX_CONCURRENCY
+    assert runTime < nbCalls * EVAL_DURATION / 2
+    print(genAlg.getBestIndividual())
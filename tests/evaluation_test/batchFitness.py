@@ -0,0 +1,61 @@
+# -*- mode: python; py-indent-offset: 4; tab-width: 4; coding: iso-8859-1 -*-
+
+#######################################################################
+# Author: Deau Raphal
+#
+# Copyright 2011 - 2016
+# License: Creative Commons Attribution Non-commercial 4.0
+# Full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+#
+#######################################################################
+
+# Batch fitness (fitnessBatch): the individuals to evaluate are given at once, their
+# genomes being stacked to compute all the fitnesses in one vectorized operation (a
+# list comprehension here, a NumPy array operation or a GPU kernel in practice).
+# Checks that each evaluation of the population is one batch, and that the batch
+# gives the results of the fitness of the individuals.
+
+import io
+import random
+import re
+
+from PyGenAlg.core.PYGA_GenAlg import PYGA_GenAlg
+
+from GridIndividual import GridIndividual
+
+
+class BatchIndividual(GridIndividual):
+
+    # Sizes of the computed batches
+    BATCH_SIZES = []
+
+    # ----------------------
+    # Public - Fitness of several individuals
+    @classmethod
+    def fitnessBatch(cls, individuals, population):
+        cls.BATCH_SIZES.append(len(individuals))
+        genomes = [individual.getValue() for individual in individuals]
+        return [(x0 + x1 - 1.0)**2 for x0, x1 in genomes]
+    # ----------------------
+
+
+if __name__ == '__main__':
+
+    random.seed(0)
+    output = io.StringIO()
+    genAlg = PYGA_GenAlg(BatchIndividual, outputPrint=output)
+    genAlg.setParameters(pop_size=50, nb_gen=10,
+                         crossrate=10, mutaterate=10,
+                         selection='ranking',
+                         max_process=1)
+    genAlg.run()
+    # The population is evaluated once initialised, then at each generation
+    nbGenerations = int(re.findall(r'Evolving\.\.\. 100% \(Generation #(\d+)\)', output.getvalue())[-1])
+
+    print('Batches: ' + str(BatchIndividual.BATCH_SIZES))
+    print('Fitness calls: ' + str(GridIndividual.NB_FITNESS_CALLS))
+    assert len(BatchIndividual.BATCH_SIZES) == nbGenerations + 1
+    assert GridIndividual.NB_FITNESS_CALLS == 0
+    for individual in genAlg.getPopulation():
+        assert individual.getFitness() == GridIndividual.fitness(individual, None)
+    print(genAlg.getBestIndividual())
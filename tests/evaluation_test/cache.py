@@ -0,0 +1,58 @@
+# -*- mode: python; py-indent-offset: 4; tab-width: 4; coding: iso-8859-1 -*-
+
+#######################################################################
+# Author: Deau Raphal
+#
+# Copyright 2011 - 2016
+# License: Creative Commons Attribution Non-commercial 4.0
+# Full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+#
+#######################################################################
+
+# Evaluation cache (eval_cache_size parameter): the results of the evaluated genomes
+# are kept by fingerprint, and a genome created again is not evaluated again.
+# Checks that the fitness is only called on the cache misses (summary line printed
+# at the end of the run), and that a new individual having the genes of an evaluated
+# one gets its result from the cache.
+
+import io
+import random
+
+from PyGenAlg.core.PYGA_EvaluationCache import PYGA_EvaluationCache
+from PyGenAlg.core.PYGA_GenAlg import PYGA_GenAlg
+
+from GridIndividual import GridIndividual
+
+CACHE_SIZE = 1000
+
+if __name__ == '__main__':
+
+    random.seed(0)
+    output = io.StringIO()
+    genAlg = PYGA_GenAlg(GridIndividual, outputPrint=output)
+    genAlg.setParameters(pop_size=50, nb_gen=20,
+                         crossrate=10, mutaterate=10,
+                         selection='ranking',
+                         eval_cache_size=CACHE_SIZE,
+                         merge_duplicated_eval=False)
+    genAlg.run()
+
+    # 1- Summary line of the run: "Evaluation cache: <hits> hits, <misses> misses (...)"
+    cacheLine = [line for line in output.getvalue().split('\n') if line.startswith('Evaluation cache:')][0]
+    print(cacheLine)
+    nbHits, nbMisses = [int(word) for word in cacheLine.replace(',', ' ').split()[2:5:2]]
+    print('Fitness calls: ' + str(GridIndividual.NB_FITNESS_CALLS))
+    assert nbHits > 0
+    assert nbMisses == GridIndividual.NB_FITNESS_CALLS
+
+    # 2- Genome created again
+    cache = PYGA_EvaluationCache(CACHE_SIZE)
+    cache.start()
+    bestIndividual = genAlg.getBestIndividual()
+    cache.store(bestIndividual.getFingerprint(), bestIndividual.getEvaluationResult())
+    newIndividual = GridIndividual()
+    newIndividual.setValue(list(bestIndividual.getValue()))
+    found, result = cache.lookup(newIndividual.getFingerprint())
+    cache.stop()
+    assert found and result == bestIndividual.getEvaluationResult()
+    print('Genome created again found in the cache: ' + str(newIndividual.getValue()) + ' / ' + str(result))
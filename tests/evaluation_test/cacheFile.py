@@ -0,0 +1,62 @@
+# -*- mode: python; py-indent-offset: 4; tab-width: 4; coding: iso-8859-1 -*-
+
+#######################################################################
+# Author: Deau Raphal
+#
+# Copyright 2011 - 2016
+# License: Creative Commons Attribution Non-commercial 4.0
+# Full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+#
+#######################################################################
+
+# Persistent evaluation cache (eval_cache_file parameter): the results are kept
+# in a sqlite file shared by the runs. The same run is done twice (one process
+# per run): the second run loads the results of the first one from the file,
+# and calls no fitness.
+
+import io
+import os
+import random
+import tempfile
+from multiprocessing import Pool
+
+from PyGenAlg.core.PYGA_GenAlg import PYGA_GenAlg
+
+from GridIndividual import GridIndividual
+
+
+# One run, returning its number of fitness calls and its cache summary
+def run(cacheFile):
+    random.seed(0)
+    output = io.StringIO()
+    genAlg = PYGA_GenAlg(GridIndividual, outputPrint=output)
+    genAlg.setParameters(pop_size=50, nb_gen=20,
+                         crossrate=10, mutaterate=10,
+                         selection='ranking',
+                         eval_cache_file=cacheFile)
+    genAlg.run()
+    lines = output.getvalue().split('\n')
+    iCacheLine = [i for i, line in enumerate(lines) if line.startswith('Evaluation cache:')][0]
+    return GridIndividual.NB_FITNESS_CALLS, '\n'.join(lines[iCacheLine:iCacheLine + 2])
+
+
+if __name__ == '__main__':
+
+    cacheDir = tempfile.mkdtemp()
+    cacheFile = os.path.join(cacheDir, 'evaluations.sqlite')
+    try:
+        # A new process per run (one GA per process)
+        pool = Pool(1, maxtasksperchild=1)
+        nbCalls1, cacheLines1 = pool.apply(run, (cacheFile,))
+        nbCalls2, cacheLines2 = pool.apply(run, (cacheFile,))
+        pool.close()
+        pool.join()
+    finally:
+        for fileName in os.listdir(cacheDir):
+            os.remove(os.path.join(cacheDir, fileName))
+        os.rmdir(cacheDir)
+
+    print('First run: ' + str(nbCalls1) + ' fitness calls\n' + cacheLines1)
+    print('Second run: ' + str(nbCalls2) + ' fitness calls\n' + cacheLines2)
+    assert nbCalls1 > 0
+    assert nbCalls2 == 0
@@ -0,0 +1,93 @@
+# -*- mode: python; py-indent-offset: 4; tab-width: 4; coding: iso-8859-1 -*-
+
+#######################################################################
+# Author: Deau Raphal
+#
+# Copyright 2011 - 2016
+# License: Creative Commons Attribution Non-commercial 4.0
+# Full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+#
+#######################################################################
+
+# Cost of the evaluations: the evaluation of a genome lasts longer when its first
+# gene is high. The evaluators launch the most expensive evaluations first when:
+#     - the individual estimates its cost (estimateCost),
+#     - or gives the feature of its genome the duration depends on (getCostFeature),
+#       the evaluator learning the mean duration of each feature during the run.
+# Checks the order of the evaluations given by the evaluator in both cases.
+
+import io
+import random
+import time
+
+from PyGenAlg.core.PYGA_Evaluator import PYGA_Evaluator
+from PyGenAlg.core.PYGA_GenAlg import PYGA_GenAlg
+from PyGenAlg.core.PYGA_ThreadEvaluator import PYGA_ThreadEvaluator
+
+from GridIndividual import GridIndividual
+
+# Duration of an evaluation of cost 1 (seconds)
+COST_UNIT = 0.005
+
+
+# Cost of the evaluation of an individual (1 to 10)
+def evaluationCost(individual):
+    return 1. + 9. * individual.getValue()[0]
+
+
+class EstimatedCostIndividual(GridIndividual):
+
+    # ----------------------
+    # Public - Fitness
+    def fitness(self, population):
+        time.sleep(COST_UNIT * evaluationCost(self))
+        return GridIndividual.fitness(self, population)
+    # ----------------------
+
+    # ----------------------
+    # Public - Estimate cost
+    def estimateCost(self):
+        return evaluationCost(self)
+    # ----------------------
+
+
+class CostFeatureIndividual(GridIndividual):
+
+    # ----------------------
+    # Public - Fitness
+    def fitness(self, population):
+        time.sleep(COST_UNIT * evaluationCost(self))
+        return GridIndividual.fitness(self, population)
+    # ----------------------
+
+    # ----------------------
+    # Public - Cost feature
+    def getCostFeature(self):
+        return self.getValue()[0]
+    # ----------------------
+
+
+if __name__ == '__main__':
+
+    random.seed(0)
+
+    # 1- Estimated cost: the individuals are sorted at once
+    evaluator = PYGA_Evaluator(EstimatedCostIndividual)
+    individuals = [EstimatedCostIndividual.generate() for _ in range(20)]
+    sortedIndividuals = evaluator.sortByCost(list(enumerate(individuals)))
+    costs = [round(evaluationCost(individual), 1) for _, individual in sortedIndividuals]
+    print('Estimated costs, in launch order: ' + str(costs))
+    assert costs == sorted(costs, reverse=True)
+
+    # 2- Cost feature: the durations are learned during the run (two threads)
+    evaluator = PYGA_ThreadEvaluator(CostFeatureIndividual, None, 2)
+    genAlg = PYGA_GenAlg(CostFeatureIndividual, outputPrint=io.StringIO(), evaluator=evaluator)
+    genAlg.setParameters(pop_size=30, nb_gen=5,
+                         crossrate=10, mutaterate=10,
+                         selection='ranking')
+    genAlg.run()
+    individuals = list(genAlg.getPopulation())
+    sortedIndividuals = evaluator.sortByCost(list(enumerate(individuals)))
+    features = [individual.getCostFeature() for _, individual in sortedIndividuals]
+    print('Cost features learned, in launch order: ' + str(features))
+    assert features == sorted(features, reverse=True)
@@ -0,0 +1,50 @@
+# -*- mode: python; py-indent-offset: 4; tab-width: 4; coding: iso-8859-1 -*-
+
+#######################################################################
+# Author: Deau Raphal
+#
+# Copyright 2011 - 2016
+# License: Creative Commons Attribution Non-commercial 4.0
+# Full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+#
+#######################################################################
+
+# Identical genomes merged (merge_duplicated_eval parameter, no evaluation cache):
+# the individuals of a population having the same fingerprint are evaluated once,
+# the others get the result of the evaluated one.
+# Checks that the evaluations saved (printed at the end of the run) are the
+# evaluations without fitness call.
+
+import io
+import random
+
+from PyGenAlg.core.PYGA_GenAlg import PYGA_GenAlg
+
+from GridIndividual import GridIndividual
+
+if __name__ == '__main__':
+
+    random.seed(0)
+    output = io.StringIO()
+    genAlg = PYGA_GenAlg(GridIndividual, outputPrint=output)
+    genAlg.setParameters(pop_size=50, nb_gen=20,
+                         crossrate=10, mutaterate=10,
+                         selection='ranking',
+                         eval_cache_size=0,
+                         merge_duplicated_eval=True)
+    genAlg.run()
+
+    lines = output.getvalue().split('\n')
+    nbEvaluations = int([line for line in lines if line.startswith('Total number of evaluation:')][0].split()[-1])
+    savedLine = [line for line in lines if line.startswith('Evaluations saved (identical genomes):')][0]
+    print('Evaluations: ' + str(nbEvaluations))
+    print(savedLine)
+    print('Fitness calls: ' + str(GridIndividual.NB_FITNESS_CALLS))
+    nbSaved = int(savedLine.split()[-1])
+    assert nbSaved > 0
+    assert GridIndividual.NB_FITNESS_CALLS == nbEvaluations - nbSaved
+    # The individuals having the same genome have the same result
+    fitnessByGenome = {}
+    for individual in genAlg.getPopulation():
+        fitness = fitnessByGenome.setdefault(individual.getFingerprint(), individual.getFitness())
+        assert individual.getFitness() == fitness
@@ -0,0 +1,67 @@
+# -*- mode: python; py-indent-offset: 4; tab-width: 4; coding: iso-8859-1 -*-
+
+#######################################################################
+# Author: Deau Raphal
+#
+# Copyright 2011 - 2016
+# License: Creative Commons Attribution Non-commercial 4.0
+# Full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+#
+#######################################################################
+
+# Failed evaluations retried (eval_max_retry and eval_penalty parameters): the fitness
+# of the genomes whose second gene is 0 crashes its worker process. The dead workers
+# are replaced, each of these individuals is evaluated again MAX_RETRY times, then
+# it gets the PENALTY fitness.
+# Checks the failure summary of the run: MAX_RETRY retries per penalised individual.
+
+import io
+import os
+import random
+
+from PyGenAlg.core.PYGA_GenAlg import PYGA_GenAlg
+
+from GridIndividual import GridIndividual
+
+MAX_RETRY = 2
+PENALTY = 1e9
+
+
+class CrashingIndividual(GridIndividual):
+
+    # ----------------------
+    # Public - Fitness (crashes the process for the genomes whose second gene is 0)
+    def fitness(self, population):
+        if self.getValue()[1] == 0.:
+            os._exit(1)
+        return GridIndividual.fitness(self, population)
+    # ----------------------
+
+
+if __name__ == '__main__':
+
+    random.seed(0)
+    output = io.StringIO()
+    genAlg = PYGA_GenAlg(CrashingIndividual, outputPrint=output)
+    genAlg.setParameters(pop_size=20, nb_gen=5,
+                         crossrate=10, mutaterate=10,
+                         selection='ranking',
+                         max_process=2,
+                         eval_max_retry=MAX_RETRY,
+                         eval_penalty=PENALTY)
+    genAlg.run()
+
+    lines = output.getvalue().split('\n')
+    # "Evaluation failures: <crash> crash, <error> error, <timeout> timeout (<retries> retries, <penalised> penalised)"
+    failureLine = [line for line in lines if line.startswith('Evaluation failures:')][-1]
+    print(failureLine)
+    words = failureLine.replace('(', ' ').split()
+    nbCrashes = int(words[2])
+    nbRetries = int(words[8])
+    nbPenalised = int(words[10])
+    assert nbCrashes > 0 and nbPenalised > 0
+    assert nbRetries == MAX_RETRY * nbPenalised
+    for individual in genAlg.getPopulation():
+        if individual.getFitness() == PENALTY:
+            print('Penalised: ' + str(individual))
+            assert individual.getValue()[1] == 0.
@@ -0,0 +1,166 @@
+# -*- mode: python; py-indent-offset: 4; tab-width: 4; coding: iso-8859-1 -*-
+
+#######################################################################
+# Author: Deau Raphal
+#
+# Copyright 2011 - 2016
+# License: Creative Commons Attribution Non-commercial 4.0
+# Full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+#
+#######################################################################
+
+# Genomes sent to the worker processes in shared memory (shared_genomes parameter):
+# the genome of the individual is an array of doubles (array.array, a NumPy array
+# would be used the same way), copied in shared memory by the main process at each
+# send and read in place by the workers (getGenomeBuffer / fromGenomeBuffer). The
+# results still come back pickled through the pipes.
+# The same run is done with the genomes in shared memory and with the individuals
+# pickled (one process per run): the results are the same.
+
+import io
+import random
+from array import array
+from multiprocessing import Process, Queue
+
+from PyGenAlg.core.PYGA_GenAlg import PYGA_GenAlg
+from PyGenAlg.core.PYGA_Individual import PYGA_Individual
+
+# Number of genes of an individual
+NB_GENES = 10000
+
+
+class ArrayIndividual(PYGA_Individual):
+
+    # The fitness does not use the population
+    NEED_POPULATION = False
+
+    # ===========================
+    # v Public methods v
+    # ===========================
+
+    # ----------------------
+    # Public - Constructor
+    def __init__(self, genome=None):
+        PYGA_Individual.__init__(self)
+        # array('d') in the main process, read only view of the shared memory in a worker
+        self.__genome = genome
+    # ----------------------
+
+    # ----------------------
+    # Public - Get genome
+    def getGenome(self):
+        return self.__genome
+    # ----------------------
+
+    # ===========================
+    # ^ Public methods ^
+    # ===========================
+
+
+
+    # ===========================
+    # v Overloaded methods v
+    # ===========================
+
+    # ----------------------
+    # Public - Generate
+    @classmethod
+    def generate(cls):
+        return cls(array('d', [random.random() for _ in range(NB_GENES)]))
+    # ----------------------
+
+    # ----------------------
+    # Public - Fitness
+    def fitness(self, population):
+        genome = self.__genome
+        return sum((genome[i] - float(i % 2)) ** 2 for i in range(NB_GENES)) / NB_GENES
+    # ----------------------
+
+    # ----------------------
+    # Public - Genome buffer (copied in shared memory)
+    def getGenomeBuffer(self):
+        return self.__genome
+    # ----------------------
+
+    # ----------------------
+    # Public - Individual built from its genome buffer (in a worker)
+    @classmethod
+    def fromGenomeBuffer(cls, genomeBuffer):
+        # No copy: the view is only used during the evaluation
+        return cls(genomeBuffer.cast('d'))
+    # ----------------------
+
+    def distance(self, otherInd, population):
+        return abs(self.getFitness() - otherInd.getFitness())
+
+    # ----------------------
+    # Public - Is better
+    def isBetter(self, otherInd, population):
+        return self.getFitness() < otherInd.getFitness()
+    # ----------------------
+
+    # ----------------------
+    # Public - Crossover
+    @classmethod
+    def crossover(cls, parent1, parent2):
+        cut = random.randint(1, NB_GENES - 1)
+        genome1 = parent1.getGenome()
+        genome2 = parent2.getGenome()
+        return [cls(genome1[:cut] + genome2[cut:]), cls(genome2[:cut] + genome1[cut:])]
+    # Public - End of Crossover
+    # ----------------------
+
+    # ----------------------
+    # Public - Mutation
+    @classmethod
+    def mutation(cls, individual):
+        genome = array('d', individual.getGenome())
+        for i in random.sample(range(NB_GENES), NB_GENES // 100):
+            genome[i] = random.random()
+        return cls(genome)
+    # Public - End of Mutation
+    # ----------------------
+
+    # ===========================
+    # ^ Overloaded methods ^
+    # ===========================
+
+
+# One run, putting the fitnesses of the population and the line of the genome transport in the queue
+def run(sharedGenomes, results):
+    random.seed(0)
+    output = io.StringIO()
+    genAlg = PYGA_GenAlg(ArrayIndividual, outputPrint=output)
+    genAlg.setParameters(pop_size=40, nb_gen=10,
+                         crossrate=10, mutaterate=10,
+                         selection='ranking',
+                         max_process=2,
+                         shared_genomes=sharedGenomes)
+    genAlg.run()
+    sharedLines = [line for line in output.getvalue().split('\n')
+                   if line.startswith('Genomes sent in shared memory:')]
+    fitnesses = sorted(individual.getFitness() for individual in genAlg.getPopulation())
+    results.put([fitnesses, sharedLines])
+
+
+# A new process per run (one GA per process, not a Pool: its daemon processes cannot start the workers)
+def runProcess(sharedGenomes):
+    results = Queue()
+    process = Process(target=run, args=(sharedGenomes, results))
+    process.start()
+    result = results.get()
+    process.join()
+    return result
+
+
+if __name__ == '__main__':
+
+    sharedFitnesses, sharedLines = runProcess(True)
+    pickledFitnesses, pickledLines = runProcess(False)
+
+    print('Shared genomes: best fitness ' + str(sharedFitnesses[0]) + '\n' + '\n'.join(sharedLines))
+    print('Pickled individuals: best fitness ' + str(pickledFitnesses[0]))
+    assert len(sharedLines) == 1
+    assert int(sharedLines[0].split(':')[1].split()[0]) > 0
+    assert len(pickledLines) == 0
+    assert sharedFitnesses == pickledFitnesses
@@ -0,0 +1,77 @@
+# -*- mode: python; py-indent-offset: 4; tab-width: 4; coding: iso-8859-1 -*-
+
+#######################################################################
+# Author: Deau Raphal
+#
+# Copyright 2011 - 2016
+# License: Creative Commons Attribution Non-commercial 4.0
+# Full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+#
+#######################################################################
+
+# Evaluation timeout (eval_timeout and eval_penalty parameters): the fitness of the
+# genomes whose first gene is 0 hangs (a simulation that never ends). Their worker
+# process is stopped after EVAL_TIMEOUT seconds, and they get the PENALTY fitness.
+# Checks the failure summary of the run, and that only these genomes are penalised.
+
+import io
+import random
+import time
+
+from PyGenAlg.core.PYGA_GenAlg import PYGA_GenAlg
+
+from GridIndividual import GridIndividual
+
+EVAL_TIMEOUT = 0.5
+PENALTY = 1e9
+
+
+class HangingIndividual(GridIndividual):
+
+    # Genomes of the penalised individuals
+    PENALISED = []
+
+    # ----------------------
+    # Public - Fitness (hangs for the genomes whose first gene is 0)
+    def fitness(self, population):
+        if self.getValue()[0] == 0.:
+            time.sleep(3600)
+        return GridIndividual.fitness(self, population)
+    # ----------------------
+
+    # ----------------------
+    # Public - Penalty of a failed evaluation
+    def applyPenalty(self, penalty):
+        HangingIndividual.PENALISED.append(list(self.getValue()))
+        GridIndividual.applyPenalty(self, penalty)
+    # ----------------------
+
+
+if __name__ == '__main__':
+
+    random.seed(0)
+    output = io.StringIO()
+    genAlg = PYGA_GenAlg(HangingIndividual, outputPrint=output)
+    genAlg.setParameters(pop_size=20, nb_gen=5,
+                         crossrate=10, mutaterate=10,
+                         selection='ranking',
+                         max_process=2,
+                         eval_timeout=EVAL_TIMEOUT,
+                         eval_penalty=PENALTY)
+    genAlg.run()
+
+    lines = output.getvalue().split('\n')
+    # "Evaluation failures: <crash> crash, <error> error, <timeout> timeout (<retries> retries, <penalised> penalised)"
+    failureLine = [line for line in lines if line.startswith('Evaluation failures:')][-1]
+    print(failureLine)
+    words = failureLine.replace('(', ' ').split()
+    assert int(words[6]) > 0
+    assert int(words[10]) == len(HangingIndividual.PENALISED)
+    print('Penalised genomes: ' + str(HangingIndividual.PENALISED))
+    assert len(HangingIndividual.PENALISED) > 0
+    for genome in HangingIndividual.PENALISED:
+        assert genome[0] == 0.
+    for individual in genAlg.getPopulation():
+        if individual.getFitness() == PENALTY:
+            print('Penalised: ' + str(individual))
+            assert individual.getValue()[0] == 0.
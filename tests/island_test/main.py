@@ -0,0 +1,43 @@
+# -*- mode: python; py-indent-offset: 4; tab-width: 4; coding: iso-8859-1 -*-
+
+#######################################################################
+# Author: Deau Raphal
+#
+# Copyright 2011 - 2016
+# License: Creative Commons Attribution Non-commercial 4.0
+# Full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+#
+#######################################################################
+
+# Island model: NB_ISLANDS GAs run in separate processes, the best individual
+# of each island migrating to the next one (ring) every MIGRATION_INTERVAL
+# generations. The last island explores more (higher mutation rate).
+
+import os
+import sys
+
+from PyGenAlg.core.PYGA_Islands import PYGA_Islands
+
+# The example individual of simple_test
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'simple_test'))
+from Individual import Individual
+
+NB_ISLANDS = 4
+MIGRATION_INTERVAL = 5
+
+if __name__ == '__main__':
+
+    islands = PYGA_Islands(Individual, NB_ISLANDS,
+                           migrationInterval=MIGRATION_INTERVAL,
+                           nbMigrants=2,
+                           migrationTopology='ring',
+                           migrantSelection='best')
+    islands.setParameters(pop_size=50, nb_gen=40,
+                          crossrate=10, mutaterate=10,
+                          selection='ranking')
+    islands.setParameters(NB_ISLANDS - 1, mutaterate=40)
+    islands.run()
+
+    for iIsland in range(islands.getNbIslands()):
+        print('Island ' + str(iIsland) + ': ' + str(islands.getIslandHistory(iIsland)))
+    print(islands.getBestIndividual())
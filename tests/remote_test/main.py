@@ -0,0 +1,53 @@
+# -*- mode: python; py-indent-offset: 4; tab-width: 4; coding: iso-8859-1 -*-
+
+#######################################################################
+# Author: Deau Raphal
+#
+# Copyright 2011 - 2016
+# License: Creative Commons Attribution Non-commercial 4.0
+# Full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+#
+#######################################################################
+
+# Remote evaluation on localhost: the main process listens on ADDRESS, and
+# NB_WORKERS local worker processes (worker.py) connect to it. One of them is
+# killed during the run: its chunk is launched again on the other workers.
+# To evaluate on other hosts, listen on all the interfaces (":6543") and run
+# worker.py on each host with the address of this one.
+
+import os
+import subprocess
+import sys
+import threading
+
+from PyGenAlg.core.PYGA_GenAlg import PYGA_GenAlg
+
+# The example individual of simple_test (imported by the workers too)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'simple_test'))
+from Individual import Individual
+
+ADDRESS = 'localhost:6543'
+AUTHKEY = 'PyGenAlg remote test'
+NB_WORKERS = 4
+KILL_TIME = 1.0
+
+if __name__ == '__main__':
+    workerScript = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'worker.py')
+    workers = [subprocess.Popen([sys.executable, workerScript, ADDRESS, AUTHKEY]) for _ in range(NB_WORKERS)]
+    killTimer = threading.Timer(KILL_TIME, workers[0].kill)
+    killTimer.start()
+
+    genAlg = PYGA_GenAlg(Individual)
+    genAlg.setParameters(pop_size=50, nb_gen=20,
+                         crossrate=10, mutaterate=10,
+                         selection='ranking',
+                         evaluation_backend='REMOTE',
+                         remote_address=ADDRESS,
+                         remote_authkey=AUTHKEY,
+                         remote_heartbeat_timeout=2.0)
+    genAlg.run()
+
+    killTimer.cancel()
+    for worker in workers:
+        worker.wait()
+    print(genAlg.getPopulation().getBestIndividual())
@@ -0,0 +1,27 @@
+# -*- mode: python; py-indent-offset: 4; tab-width: 4; coding: iso-8859-1 -*-
+
+#######################################################################
+# Author: Deau Raphal
+#
+# Copyright 2011 - 2016
+# License: Creative Commons Attribution Non-commercial 4.0
+# Full text: https://creativecommons.org/licenses/by-nc/4.0/legalcode
+#
+#######################################################################
+
+# Remote evaluation worker: run it on each host, giving the address of the
+# main process (see main.py) and the authentication key:
+#     python worker.py host:port authkey
+# The Individual module must be importable by the worker (the one of simple_test here).
+
+import os
+import sys
+
+from PyGenAlg.core.PYGA_RemoteEvaluator import runRemoteWorker
+
+# The individuals received are unpickled with the example individual of simple_test
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'simple_test'))
+
+if __name__ == '__main__':
+    nbChunks = runRemoteWorker(sys.argv[1], sys.argv[2])
+    print('Worker stopped after ' + str(nbChunks) + ' chunks')
@@ -17,11 +17,16 @@
 
 # - build-in imports
 import random
+from sys import version_info
 
 # - local imports -
 #import PYGA
 from PyGenAlg.core.PYGA_Individual import PYGA_Individual
 
+# Manage python versions compatibility
+if version_info[0] >= 3:
+    xrange = range
+
 # Function to maximize
 def f(x):
     return (x[0] + x[1] - 1.0)**2